@@ -84,10 +84,12 @@ from .helpers import (
     label_registry,
     recorder,
     restore_state,
+    startup_cache,
     template,
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
+from .helpers.importlib import async_preimport_requirements
 from .helpers.storage import get_internal_store_manager
 from .helpers.system_info import async_get_system_info
 from .helpers.typing import ConfigType
@@ -838,9 +840,18 @@ async def _async_resolve_domains_to_setup(
 
     # Optimistically check if requirements are already installed
     # ahead of setting up the integrations so we can prime the cache
+    # and import them concurrently
     # We do not wait for this since its an optimization only
     hass.async_create_background_task(
-        requirements.async_load_installed_versions(hass, needed_requirements),
+        _async_preload_requirements(
+            hass,
+            needed_requirements,
+            [
+                integration_cache[domain]
+                for domain in domains_to_setup
+                if domain in integration_cache
+            ],
+        ),
         "check installed requirements",
         eager_start=True,
     )
@@ -880,6 +891,28 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+async def _async_preload_requirements(
+    hass: core.HomeAssistant,
+    needed_requirements: set[str],
+    integrations: list[loader.Integration],
+) -> None:
+    """Check which requirements are installed and import them ahead of setup."""
+    await requirements.async_load_installed_versions(hass, needed_requirements)
+    installed = requirements.async_get_installed_requirements(hass)
+    await async_preimport_requirements(
+        hass,
+        {
+            requirement
+            for integration in integrations
+            # Integrations importing in the event loop may rely on
+            # their requirements being imported there too
+            if integration.import_executor
+            for requirement in integration.requirements
+            if requirement in installed
+        },
+    )
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -887,6 +920,10 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
+    # Prime the loader with the manifests and installed requirements
+    # found on the previous start of this installation
+    cache = await startup_cache.async_load(hass)
+
     domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
         hass, config
     )
@@ -970,6 +1007,8 @@ async def _async_set_up_integrations(
                 hass._active_tasks,  # noqa: SLF001
             )
 
+    cache.async_schedule_save()
+
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
     try:
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 from collections.abc import Iterable
 from datetime import datetime as dt
+import math
+from typing import Any
 
 from homeassistant.components.recorder import get_instance
+from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant
 
 
@@ -32,3 +35,108 @@ def has_states_before(hass: HomeAssistant, run_time: dt) -> bool:
     """
     oldest_ts = get_instance(hass).states_manager.oldest_ts
     return oldest_ts is not None and run_time.timestamp() >= oldest_ts
+
+
+def downsample_compressed_states(
+    states: dict[str, list[dict[str, Any]]], max_points: int
+) -> dict[str, list[dict[str, Any]]]:
+    """Downsample the numeric states of each entity to about max_points.
+
+    Runs of numeric states are reduced with the largest-triangle-three-buckets
+    algorithm, which keeps the visual shape of the series. States that are not
+    numeric (unavailable, unknown or non-numeric entities) are always kept so
+    their transitions stay exact.
+    """
+    return {
+        entity_id: _downsample_entity_states(entity_states, max_points)
+        for entity_id, entity_states in states.items()
+    }
+
+
+def _downsample_entity_states(
+    states: list[dict[str, Any]], max_points: int
+) -> list[dict[str, Any]]:
+    """Downsample the numeric states of a single entity."""
+    if len(states) <= max_points:
+        return states
+
+    # Split the states into runs of numeric states separated by the
+    # non-numeric states, which are kept as they are.
+    segments: list[tuple[list[float], list[float], list[dict[str, Any]]]] = []
+    times: list[float] = []
+    values: list[float] = []
+    segment_states: list[dict[str, Any]] = []
+    layout: list[int | dict[str, Any]] = []
+    for state in states:
+        try:
+            value = float(state[COMPRESSED_STATE_STATE])
+        except (TypeError, ValueError):
+            value = math.nan
+        if math.isfinite(value):
+            if not segment_states:
+                layout.append(len(segments))
+                segments.append((times, values, segment_states))
+            times.append(state[COMPRESSED_STATE_LAST_UPDATED])
+            values.append(value)
+            segment_states.append(state)
+            continue
+        if segment_states:
+            times, values, segment_states = [], [], []
+        layout.append(state)
+
+    if not segments:
+        return states
+
+    numeric_count = sum(len(segment[2]) for segment in segments)
+    budget = max(max_points - (len(states) - numeric_count), 2 * len(segments))
+    result: list[dict[str, Any]] = []
+    for item in layout:
+        if not isinstance(item, int):
+            result.append(item)
+            continue
+        times, values, segment_states = segments[item]
+        threshold = max(2, budget * len(segment_states) // numeric_count)
+        result.extend(
+            segment_states[idx]
+            for idx in largest_triangle_three_buckets(times, values, threshold)
+        )
+    return result
+
+
+def largest_triangle_three_buckets(
+    x: list[float], y: list[float], threshold: int
+) -> list[int]:
+    """Return the indices of the points to keep to downsample to threshold.
+
+    The first and last points are always kept.
+    """
+    length = len(x)
+    if threshold >= length:
+        return list(range(length))
+    if threshold <= 2:
+        return [0, length - 1] if length > 1 else [0]
+
+    bucket_size = (length - 2) / (threshold - 2)
+    indices = [0]
+    selected = 0
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, length)
+        next_count = next_end - end
+        avg_x = sum(x[end:next_end]) / next_count
+        avg_y = sum(y[end:next_end]) / next_count
+        point_x = x[selected]
+        point_y = y[selected]
+        max_area = -1.0
+        for idx in range(start, end):
+            area = abs(
+                (point_x - avg_x) * (y[idx] - point_y)
+                - (point_x - x[idx]) * (avg_y - point_y)
+            )
+            if area > max_area:
+                max_area = area
+                selected = idx
+        indices.append(selected)
+    indices.append(length - 1)
+    return indices
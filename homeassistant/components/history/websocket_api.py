@@ -6,6 +6,7 @@ import asyncio
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from datetime import datetime as dt, timedelta
+from functools import partial
 import logging
 from typing import Any, cast
 
@@ -13,6 +14,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.recorder import get_instance, history
+from homeassistant.components.recorder.util import session_scope
 from homeassistant.components.websocket_api import ActiveConnection, messages
 from homeassistant.const import (
     COMPRESSED_STATE_ATTRIBUTES,
@@ -39,7 +41,11 @@ from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import create_eager_task
 
 from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
-from .helpers import entities_may_have_state_changes_after, has_states_before
+from .helpers import (
+    downsample_compressed_states,
+    entities_may_have_state_changes_after,
+    has_states_before,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -72,25 +78,27 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
-    return json_bytes(
-        messages.result_message(
-            msg_id,
-            history.get_significant_states(
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                None,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-                no_attributes,
-                True,
-            ),
-        )
+    states = cast(
+        dict[str, list[dict[str, Any]]],
+        history.get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ),
     )
+    if max_points:
+        states = downsample_compressed_states(states, max_points)
+    return json_bytes(messages.result_message(msg_id, states))
 
 
 @websocket_api.websocket_command(
@@ -103,6 +111,7 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=2)),
     }
 )
 @websocket_api.async_response
@@ -172,6 +181,7 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            msg.get("max_points"),
         )
     )
 
@@ -226,6 +236,7 @@ def _generate_historical_response(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    max_points: int | None,
 ) -> tuple[float, dt | None, bytes | None]:
     """Generate a historical response."""
     states = cast(
@@ -243,6 +254,8 @@ def _generate_historical_response(
             True,
         ),
     )
+    if max_points:
+        states = downsample_compressed_states(states, max_points)
     last_time_ts = 0.0
     for state_list in states.values():
         if (
@@ -269,6 +282,64 @@ def _generate_historical_response(
     )
 
 
+def _stream_historical_response(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    send_empty: bool,
+    max_points: int | None,
+) -> float:
+    """Stream a historical response with a message per entity.
+
+    Each message is sent as soon as the states of its entity have been
+    read from the database so only a single entity is held in memory.
+    """
+    send_message = partial(hass.loop.call_soon_threadsafe, connection.send_message)
+    last_time_ts = 0.0
+    with session_scope(hass=hass, read_only=True) as session:
+        for entity_id, states in history.stream_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        ):
+            if max_points:
+                states = downsample_compressed_states({entity_id: states}, max_points)[
+                    entity_id
+                ]
+            if (
+                state_last_time := states[-1][COMPRESSED_STATE_LAST_UPDATED]
+            ) > last_time_ts:
+                last_time_ts = cast(float, state_last_time)
+            send_message(
+                _generate_websocket_response(
+                    msg_id,
+                    start_time,
+                    dt_util.utc_from_timestamp(last_time_ts),
+                    {entity_id: states},
+                )
+            )
+
+    if last_time_ts == 0 and send_empty:
+        # If we did not send any states ever, we need to send an empty response
+        # so the websocket client knows it should render/process/consume the
+        # data.
+        send_message(_generate_websocket_response(msg_id, start_time, end_time, {}))
+    return last_time_ts
+
+
 async def _async_send_historical_states(
     hass: HomeAssistant,
     connection: ActiveConnection,
@@ -281,9 +352,28 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    stream_per_entity: bool = False,
+    max_points: int | None = None,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
+    if stream_per_entity and entity_ids:
+        last_time_ts = await instance.async_add_executor_job(
+            _stream_historical_response,
+            hass,
+            connection,
+            msg_id,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            send_empty,
+            max_points,
+        )
+        return dt_util.utc_from_timestamp(last_time_ts) if last_time_ts != 0 else None
     last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
         _generate_historical_response,
         hass,
@@ -296,6 +386,7 @@ async def _async_send_historical_states(
         minimal_response,
         no_attributes,
         send_empty,
+        max_points,
     )
     if payload:
         connection.send_message(payload)
@@ -409,6 +500,8 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("stream_per_entity", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=2)),
     }
 )
 @websocket_api.async_response
@@ -448,6 +541,8 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    stream_per_entity = msg["stream_per_entity"]
+    max_points: int | None = msg.get("max_points")
 
     if end_time and end_time <= utc_now:
         if (
@@ -474,6 +569,8 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            stream_per_entity,
+            max_points,
         )
         return
 
@@ -538,6 +635,8 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        stream_per_entity,
+        max_points,
     )
 
     if msg_id not in connection.subscriptions:
@@ -582,4 +681,6 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         send_empty=not last_event_time,
+        stream_per_entity=stream_per_entity,
+        max_points=max_points,
     )
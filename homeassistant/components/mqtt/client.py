@@ -116,6 +116,10 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+# Bound the topic -> subscriptions cache, brokers with many distinct
+# topics would otherwise grow it without limit.
+MATCHING_SUBSCRIPTIONS_CACHE_SIZE = 8192
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt._WebsocketWrapper | Any  # noqa: SLF001
 
 type SubscribePayloadType = str | bytes | bytearray  # Only bytes if encoding is None
@@ -265,12 +269,108 @@ class Subscription:
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
 
 
+class _SubscriptionTrieNode:
+    """A single topic level in the subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        # Subscriptions whose topic filter ends at this level,
+        # mapped to their insertion sequence number.
+        self.subscriptions: dict[Subscription, int] = {}
+
+
+class SubscriptionTrie:
+    """Level-indexed trie of wildcard subscriptions.
+
+    Every node represents one topic level. The `+` and `#` wildcards
+    are stored as regular children so matching a topic only visits the
+    branches that can match, instead of testing every subscription.
+    """
+
+    __slots__ = ("_root", "_sequence")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+        self._sequence = 0
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription to the trie."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        self._sequence += 1
+        node.subscriptions[subscription] = self._sequence
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription from the trie.
+
+        Raises KeyError if the subscription is not in the trie.
+        """
+        levels = subscription.topic.split("/")
+        path: list[_SubscriptionTrieNode] = [self._root]
+        for level in levels:
+            path.append(path[-1].children[level])
+        del path[-1].subscriptions[subscription]
+        # Prune nodes that no longer lead to any subscription
+        for idx in range(len(levels), 0, -1):
+            node = path[idx]
+            if node.subscriptions or node.children:
+                break
+            del path[idx - 1].children[levels[idx - 1]]
+
+    def has_filter(self, topic: str) -> bool:
+        """Return if a subscription exists with exactly this topic filter."""
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def matches(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions matching a topic in subscription order."""
+        # Wildcards on the first level do not match topics starting with $
+        # Section 4.7.2 in the MQTT v3.1.1 specification.
+        wildcards_allowed = topic[:1] != "$"
+        found: dict[Subscription, int] = {}
+        nodes = [self._root]
+        for level in topic.split("/"):
+            next_nodes: list[_SubscriptionTrieNode] = []
+            for node in nodes:
+                children = node.children
+                if (child := children.get(level)) is not None:
+                    next_nodes.append(child)
+                if wildcards_allowed:
+                    if (child := children.get("+")) is not None:
+                        next_nodes.append(child)
+                    if (child := children.get("#")) is not None:
+                        found.update(child.subscriptions)
+            if not next_nodes:
+                break
+            nodes = next_nodes
+            wildcards_allowed = True
+        else:
+            for node in nodes:
+                found.update(node.subscriptions)
+                # A multi-level wildcard also matches its parent level
+                if (child := node.children.get("#")) is not None:
+                    found.update(child.subscriptions)
+        if len(found) < 2:
+            return list(found)
+        return sorted(found, key=found.__getitem__)
+
+
 class MqttClientSetup:
     """Helper class to setup the paho mqtt client from config."""
 
@@ -378,6 +478,7 @@ class MQTT:
         # To ensure the wildcard subscriptions order is preserved, we use a dict
         # with `None` values instead of a set.
         self._wildcard_subscriptions: dict[Subscription, None] = {}
+        self._wildcard_subscriptions_trie = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -625,8 +726,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return topic in self._simple_subscriptions or (
+            self._wildcard_subscriptions_trie.has_filter(topic)
         )
 
     async def async_publish(
@@ -759,6 +860,7 @@ class MQTT:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions[subscription] = None
+            self._wildcard_subscriptions_trie.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -777,6 +879,7 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 del self._wildcard_subscriptions[subscription]
+                self._wildcard_subscriptions_trie.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
@@ -847,9 +950,7 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
-
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1056,18 +1157,13 @@ class MQTT:
             queue_only=True,
         )
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
+    @lru_cache(MATCHING_SUBSCRIPTIONS_CACHE_SIZE)
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        if self._wildcard_subscriptions:
+            subscriptions.extend(self._wildcard_subscriptions_trie.matches(topic))
         return subscriptions
 
     @callback
@@ -1267,13 +1363,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()  # type: ignore[no-untyped-call]
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)  # type: ignore[no-untyped-call]
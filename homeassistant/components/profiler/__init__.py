@@ -17,16 +17,17 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import config_validation as cv, template
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
 
-from .const import DOMAIN
+from .const import DOMAIN, JOB_PROFILER
+from .job_profiler import JobProfiler
 
 SERVICE_START = "start"
 SERVICE_MEMORY = "memory"
@@ -75,6 +76,8 @@ CONF_MAX_OBJECTS = "max_objects"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
+DEFAULT_JOB_STATS_LIMIT = 20
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -85,6 +88,9 @@ async def async_setup_entry(  # noqa: C901
     """Set up Profiler from a config entry."""
     lock = asyncio.Lock()
     domain_data = hass.data[DOMAIN] = {}
+    job_profiler = domain_data[JOB_PROFILER] = JobProfiler()
+    hass.async_set_job_profiler(job_profiler)
+    websocket_api.async_register_command(hass, websocket_job_stats)
 
     async def _async_run_profile(call: ServiceCall) -> None:
         async with lock:
@@ -214,6 +220,9 @@ async def async_setup_entry(  # noqa: C901
                             maybe_lru.get_stats(),
                         )
 
+        for name, stats in template.compiled_template_cache_info().items():
+            _LOGGER.critical("Cache stats for compiled templates %s: %s", name, stats)
+
         for lru in objgraph.by_type(_SQLALCHEMY_LRU_OBJECT):
             if (data := getattr(lru, "_data", None)) and isinstance(data, dict):
                 for key, value in dict(data).items():
@@ -391,10 +400,40 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    hass.async_set_job_profiler(None)
     hass.data.pop(DOMAIN)
     return True
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "profiler/job_stats",
+        vol.Optional("limit", default=DEFAULT_JOB_STATS_LIMIT): vol.All(
+            int, vol.Range(min=1)
+        ),
+    }
+)
+@callback
+def websocket_job_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
+) -> None:
+    """Return the callbacks that blocked the event loop the longest."""
+    if (domain_data := hass.data.get(DOMAIN)) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Profiler is not set up"
+        )
+        return
+    job_profiler: JobProfiler = domain_data[JOB_PROFILER]
+    connection.send_result(
+        msg["id"],
+        {
+            "sample_rate": job_profiler.sample_rate,
+            "jobs": [stats.as_dict() for stats in job_profiler.top(msg["limit"])],
+        },
+    )
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
@@ -0,0 +1,135 @@
+"""Sample how long callback jobs block the event loop."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass, field
+import functools
+import logging
+from time import perf_counter
+from typing import Any
+
+from homeassistant.core import HassJob
+
+_LOGGER = logging.getLogger(__name__)
+
+# Only one in JOB_SAMPLE_RATE callback runs is timed to keep the
+# overhead negligible while the profiler is always on
+JOB_SAMPLE_RATE = 32
+
+SLOW_CALLBACK_THRESHOLD = 0.1
+
+# Upper bounds in seconds, runs slower than the last bound
+# go into an extra overflow bucket
+HISTOGRAM_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)
+
+
+@dataclass(slots=True)
+class JobStats:
+    """Wall time histogram of the sampled runs of a job target."""
+
+    domain: str
+    function: str
+    samples: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    slow: int = 0
+    buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(HISTOGRAM_BUCKETS) + 1)
+    )
+
+    def add(self, duration: float) -> None:
+        """Record a sampled run."""
+        self.samples += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        if duration >= SLOW_CALLBACK_THRESHOLD:
+            self.slow += 1
+        self.buckets[bisect_left(HISTOGRAM_BUCKETS, duration)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dictionary representation of the stats."""
+        return {
+            "domain": self.domain,
+            "function": self.function,
+            "samples": self.samples,
+            "total": self.total,
+            "mean": self.total / self.samples if self.samples else 0.0,
+            "max": self.max,
+            "slow": self.slow,
+            "buckets": dict(
+                zip(
+                    [*(str(bound) for bound in HISTOGRAM_BUCKETS), "+Inf"],
+                    self.buckets,
+                    strict=True,
+                )
+            ),
+        }
+
+
+def _job_key(target: Any) -> tuple[str, str]:
+    """Return the integration domain and qualified name of a job target."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    module: str = getattr(target, "__module__", None) or ""
+    function: str = getattr(target, "__qualname__", None) or repr(target)
+    parts = module.split(".")
+    if len(parts) > 2 and parts[:2] == ["homeassistant", "components"]:
+        domain = parts[2]
+    elif len(parts) > 1 and parts[0] == "custom_components":
+        domain = parts[1]
+    else:
+        domain = "homeassistant"
+    return domain, f"{module}.{function}"
+
+
+class JobProfiler:
+    """Run callback jobs and time a sample of them.
+
+    Instances are installed with HomeAssistant.async_set_job_profiler.
+    """
+
+    def __init__(self, sample_rate: int = JOB_SAMPLE_RATE) -> None:
+        """Initialize the job profiler."""
+        self.sample_rate = sample_rate
+        self.stats: dict[tuple[str, str], JobStats] = {}
+        self._countdown = sample_rate
+        self._warned: set[tuple[str, str]] = set()
+
+    def __call__(self, hassjob: HassJob[..., Any], args: tuple[Any, ...]) -> None:
+        """Run a callback job, timing it if it is sampled."""
+        self._countdown -= 1
+        if self._countdown:
+            hassjob.target(*args)
+            return
+        self._countdown = self.sample_rate
+        start = perf_counter()
+        try:
+            hassjob.target(*args)
+        finally:
+            self._record(hassjob, perf_counter() - start)
+
+    def _record(self, hassjob: HassJob[..., Any], duration: float) -> None:
+        """Record a sampled run of a job."""
+        key = _job_key(hassjob.target)
+        if (stats := self.stats.get(key)) is None:
+            stats = self.stats[key] = JobStats(*key)
+        stats.add(duration)
+        if duration >= SLOW_CALLBACK_THRESHOLD and key not in self._warned:
+            self._warned.add(key)
+            _LOGGER.warning(
+                "Callback %s from integration %s blocked the event loop for %.3f"
+                " seconds",
+                key[1],
+                key[0],
+                duration,
+            )
+
+    def top(self, limit: int) -> list[JobStats]:
+        """Return the job targets with the most sampled wall time."""
+        return sorted(self.stats.values(), key=lambda s: s.total, reverse=True)[:limit]
+
+    @property
+    def slow_callbacks(self) -> int:
+        """Return the number of sampled runs above the slow threshold."""
+        return sum(stats.slow for stats in self.stats.values())
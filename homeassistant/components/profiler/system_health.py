@@ -0,0 +1,30 @@
+"""Provide info to system health."""
+
+from typing import Any
+
+from homeassistant.components import system_health
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, JOB_PROFILER
+from .job_profiler import JobProfiler
+
+
+@callback
+def async_register(
+    hass: HomeAssistant, register: system_health.SystemHealthRegistration
+) -> None:
+    """Register system health callbacks."""
+    register.async_register_info(system_health_info)
+
+
+async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
+    """Get info for the info page."""
+    if (domain_data := hass.data.get(DOMAIN)) is None:
+        return {}
+    job_profiler: JobProfiler = domain_data[JOB_PROFILER]
+    top = job_profiler.top(1)
+    return {
+        "sampled_jobs": sum(stats.samples for stats in job_profiler.stats.values()),
+        "slow_callbacks": job_profiler.slow_callbacks,
+        "slowest_callback": top[0].function if top else None,
+    }
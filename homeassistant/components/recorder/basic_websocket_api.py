@@ -37,6 +37,8 @@ def ws_info(
         # for the thread state lock which will block the event loop.
         is_running = instance.is_running
         max_backlog = instance.max_backlog
+        purge_progress = instance.purge_progress
+        state_attributes_cache = instance.state_attributes_manager.cache_stats
     else:
         backlog = None
         migration_in_progress = False
@@ -44,13 +46,17 @@ def ws_info(
         recording = False
         is_running = False
         max_backlog = None
+        purge_progress = None
+        state_attributes_cache = None
 
     recorder_info = {
         "backlog": backlog,
         "max_backlog": max_backlog,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
+        "purge_progress": purge_progress.as_dict() if purge_progress else None,
         "recording": recording,
+        "state_attributes_cache": state_attributes_cache,
         "thread_running": is_running,
     }
     connection.send_result(msg["id"], recorder_info)
@@ -0,0 +1,283 @@
+"""Batched multi-row writer for the recorder event session."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from .db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+
+
+class BulkWriter:
+    """Accumulate new rows per table and insert them with one statement each.
+
+    The rows are the same objects the table managers track as pending so
+    the ids they are assigned here are picked up by the managers'
+    post_commit_pending calls after the commit. Instead of flushing them
+    through the ORM unit of work, every table is written with a single
+    executemany / multi-VALUES INSERT in dependency order, fetching the
+    generated primary keys with RETURNING where later rows need them.
+
+    The rows are kept until the caller clears them after a successful
+    commit so a failed commit can be retried with the same rows.
+
+    The database must support RETURNING for executemany INSERTs with
+    rows returned in parameter order.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the bulk writer."""
+        self._states_meta: list[StatesMeta] = []
+        self._state_attributes: list[StateAttributes] = []
+        self._event_types: list[EventTypes] = []
+        self._event_data: list[EventData] = []
+        self._events: list[Events] = []
+        self._states: list[States] = []
+        self._flushed_states: list[States] = []
+
+    def add(self, obj: object) -> None:
+        """Add a new row to be written on the next flush."""
+        if type(obj) is States:
+            self._states.append(obj)
+        elif type(obj) is Events:
+            self._events.append(obj)
+        elif type(obj) is StateAttributes:
+            self._state_attributes.append(obj)
+        elif type(obj) is EventData:
+            self._event_data.append(obj)
+        elif type(obj) is StatesMeta:
+            self._states_meta.append(obj)
+        elif type(obj) is EventTypes:
+            self._event_types.append(obj)
+        else:
+            raise TypeError(f"Unsupported object for bulk writing: {obj!r}")
+
+    @property
+    def has_pending_writes(self) -> bool:
+        """Return if there are rows waiting to be written."""
+        return bool(
+            self._states
+            or self._events
+            or self._state_attributes
+            or self._event_data
+            or self._states_meta
+            or self._event_types
+        )
+
+    def clear(self) -> None:
+        """Discard all rows that have not been written."""
+        self._states_meta.clear()
+        self._state_attributes.clear()
+        self._event_types.clear()
+        self._event_data.clear()
+        self._events.clear()
+        self._states.clear()
+        self._flushed_states = []
+
+    def rollback(self) -> None:
+        """Forget the ids assigned by the last flush.
+
+        Called when the transaction the rows were written in was rolled
+        back, the rows are written again with the next flush.
+        """
+        for db_states_meta in self._states_meta:
+            db_states_meta.metadata_id = None
+        for db_state_attributes in self._state_attributes:
+            db_state_attributes.attributes_id = None
+        for db_event_types in self._event_types:
+            db_event_types.event_type_id = None
+        for db_event_data in self._event_data:
+            db_event_data.data_id = None
+        for db_state in self._flushed_states:
+            db_state.state_id = None
+        self._flushed_states = []
+
+    def flush(self, session: Session) -> None:
+        """Write all pending rows to the database in the session transaction.
+
+        The caller is responsible for committing the session and
+        clearing the rows once the commit succeeded, or rolling
+        back the session and calling rollback if it failed.
+        """
+        if states_meta := self._states_meta:
+            for db_states_meta, metadata_id in zip(
+                states_meta,
+                _insert_returning_ids(
+                    session,
+                    StatesMeta,
+                    StatesMeta.metadata_id,
+                    [{"entity_id": row.entity_id} for row in states_meta],
+                ),
+                strict=True,
+            ):
+                db_states_meta.metadata_id = metadata_id
+
+        if state_attributes := self._state_attributes:
+            for db_state_attributes, attributes_id in zip(
+                state_attributes,
+                _insert_returning_ids(
+                    session,
+                    StateAttributes,
+                    StateAttributes.attributes_id,
+                    [
+                        {"hash": row.hash, "shared_attrs": row.shared_attrs}
+                        for row in state_attributes
+                    ],
+                ),
+                strict=True,
+            ):
+                db_state_attributes.attributes_id = attributes_id
+
+        if event_types := self._event_types:
+            for db_event_types, event_type_id in zip(
+                event_types,
+                _insert_returning_ids(
+                    session,
+                    EventTypes,
+                    EventTypes.event_type_id,
+                    [{"event_type": row.event_type} for row in event_types],
+                ),
+                strict=True,
+            ):
+                db_event_types.event_type_id = event_type_id
+
+        if event_data := self._event_data:
+            for db_event_data, data_id in zip(
+                event_data,
+                _insert_returning_ids(
+                    session,
+                    EventData,
+                    EventData.data_id,
+                    [
+                        {"hash": row.hash, "shared_data": row.shared_data}
+                        for row in event_data
+                    ],
+                ),
+                strict=True,
+            ):
+                db_event_data.data_id = data_id
+
+        if events := self._events:
+            # Nothing references the new events so there
+            # is no need to fetch the event_ids back.
+            session.execute(insert(Events), [_event_params(row) for row in events])
+
+        if states := self._states:
+            self._flush_states(session, states)
+
+    def _flush_states(self, session: Session, states: list[States]) -> None:
+        """Write the pending states.
+
+        A state may link to an older state of the same entity that is
+        pending in the same batch, so states are written in generations
+        where each generation only links to states that already have an id.
+
+        A pending old state is not always added to the batch, for example
+        when its attributes could not be serialized. Like the ORM would
+        cascade them, such old states are written with the batch.
+        """
+        in_batch = {id(db_state) for db_state in states}
+        orphans: list[States] = []
+        for db_state in states:
+            old_state = db_state.old_state
+            while (
+                old_state is not None
+                and old_state.state_id is None
+                and id(old_state) not in in_batch
+            ):
+                in_batch.add(id(old_state))
+                orphans.append(old_state)
+                old_state = old_state.old_state
+        if orphans:
+            states = [*orphans, *states]
+        self._flushed_states = states
+
+        while states:
+            ready: list[States] = []
+            waiting: list[States] = []
+            for db_state in states:
+                if (
+                    old_state := db_state.old_state
+                ) is not None and old_state.state_id is None:
+                    waiting.append(db_state)
+                else:
+                    ready.append(db_state)
+            if not ready:
+                # Every old state is in the batch so this can only happen
+                # with a cycle, write the rest without linking them instead
+                # of inserting an empty batch
+                ready, waiting = waiting, []
+            for db_state, state_id in zip(
+                ready,
+                _insert_returning_ids(
+                    session,
+                    States,
+                    States.state_id,
+                    [_state_params(row) for row in ready],
+                ),
+                strict=True,
+            ):
+                db_state.state_id = state_id
+            states = waiting
+
+
+def _insert_returning_ids(
+    session: Session, table: type[Any], id_column: Any, params: list[dict[str, Any]]
+) -> list[int]:
+    """Insert rows with a single statement and return their ids in order."""
+    return list(
+        session.scalars(
+            insert(table).returning(id_column, sort_by_parameter_order=True), params
+        )
+    )
+
+
+def _event_params(row: Events) -> dict[str, Any]:
+    """Return the insert parameters for an event row."""
+    event_type_rel = row.event_type_rel
+    event_data_rel = row.event_data_rel
+    return {
+        "origin_idx": row.origin_idx,
+        "time_fired_ts": row.time_fired_ts,
+        "context_id_bin": row.context_id_bin,
+        "context_user_id_bin": row.context_user_id_bin,
+        "context_parent_id_bin": row.context_parent_id_bin,
+        "event_type_id": row.event_type_id
+        if event_type_rel is None
+        else event_type_rel.event_type_id,
+        "data_id": row.data_id if event_data_rel is None else event_data_rel.data_id,
+    }
+
+
+def _state_params(row: States) -> dict[str, Any]:
+    """Return the insert parameters for a state row."""
+    old_state = row.old_state
+    state_attributes = row.state_attributes
+    states_meta_rel = row.states_meta_rel
+    return {
+        "entity_id": row.entity_id,
+        "state": row.state,
+        "origin_idx": row.origin_idx,
+        "last_updated_ts": row.last_updated_ts,
+        "last_changed_ts": row.last_changed_ts,
+        "last_reported_ts": row.last_reported_ts,
+        "context_id_bin": row.context_id_bin,
+        "context_user_id_bin": row.context_user_id_bin,
+        "context_parent_id_bin": row.context_parent_id_bin,
+        "old_state_id": row.old_state_id if old_state is None else old_state.state_id,
+        "attributes_id": row.attributes_id
+        if state_attributes is None
+        else state_attributes.attributes_id,
+        "metadata_id": row.metadata_id
+        if states_meta_rel is None
+        else states_meta_rel.metadata_id,
+    }
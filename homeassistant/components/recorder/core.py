@@ -50,6 +50,7 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_writer import BulkWriter
 from .const import (
     DB_WORKER_PREFIX,
     DEFAULT_MAX_BIND_VARS,
@@ -80,6 +81,7 @@ from .db_schema import (
 from .executor import DBInterruptibleThreadPoolExecutor
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -164,6 +166,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        bulk_write: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -181,6 +184,7 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.bulk_write = bulk_write
         self.database_engine: DatabaseEngine | None = None
         # Database connection is ready, but non-live migration may be in progress
         db_connected: asyncio.Future[bool] = hass.data[DOMAIN].db_connected
@@ -213,6 +217,10 @@ class Recorder(threading.Thread):
         self.statistics_meta_manager = StatisticsMetaManager(self)
 
         self.event_session: Session | None = None
+        # Only set when bulk_write is enabled and supported by the database
+        self._bulk_writer: BulkWriter | None = None
+        # Progress of the last purge started by a PurgeTask
+        self.purge_progress: PurgeProgress | None = None
         self._get_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.migration_in_progress = False
@@ -685,6 +693,9 @@ class Recorder(threading.Thread):
     def _add_to_session(self, session: Session, obj: object) -> None:
         """Add an object to the session."""
         self._event_session_has_pending_writes = True
+        if self._bulk_writer is not None:
+            self._bulk_writer.add(obj)
+            return
         session.add(obj)
 
     def _notify_migration_failed(self) -> None:
@@ -1208,22 +1219,36 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
-        if (
-            pending_last_reported
-            := self.states_manager.get_pending_last_reported_timestamp()
-        ) and self.schema_version >= LAST_REPORTED_SCHEMA_VERSION:
-            with session.no_autoflush:
-                session.execute(
-                    update(States),
-                    [
-                        {
-                            "state_id": state_id,
-                            "last_reported_ts": last_reported_timestamp,
-                        }
-                        for state_id, last_reported_timestamp in pending_last_reported.items()
-                    ],
-                )
-        session.commit()
+        bulk_writer = self._bulk_writer
+        try:
+            if bulk_writer is not None:
+                bulk_writer.flush(session)
+
+            if (
+                pending_last_reported
+                := self.states_manager.get_pending_last_reported_timestamp()
+            ) and self.schema_version >= LAST_REPORTED_SCHEMA_VERSION:
+                with session.no_autoflush:
+                    session.execute(
+                        update(States),
+                        [
+                            {
+                                "state_id": state_id,
+                                "last_reported_ts": last_reported_timestamp,
+                            }
+                            for state_id, last_reported_timestamp in pending_last_reported.items()
+                        ],
+                    )
+            session.commit()
+        except Exception:
+            if bulk_writer is not None:
+                # Undo the partially written batch and keep its rows
+                # so the retry writes them again with new ids
+                bulk_writer.rollback()
+                session.rollback()
+            raise
+        if bulk_writer is not None:
+            bulk_writer.clear()
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1257,6 +1282,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        if self._bulk_writer is not None:
+            self._bulk_writer.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1282,6 +1309,23 @@ class Recorder(threading.Thread):
         """Open the event session."""
         self.event_session = self.get_session()
         self.event_session.expire_on_commit = False
+        self._setup_bulk_writer()
+
+    def _setup_bulk_writer(self) -> None:
+        """Set up the bulk writer if enabled and supported by the database."""
+        if not self.bulk_write or self._bulk_writer is not None:
+            return
+        assert self.engine is not None
+        if not self.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+            _LOGGER.warning(
+                "The database does not support returning ids for multi-row inserts; "
+                "bulk writing is disabled and the recorder will use the default "
+                "write path"
+            )
+            self.bulk_write = False
+            return
+        _LOGGER.debug("Using bulk writer for the event session")
+        self._bulk_writer = BulkWriter()
 
     def _send_keep_alive(self) -> None:
         """Send a keep alive to keep the db connection open."""
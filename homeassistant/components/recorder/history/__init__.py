@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 from sqlalchemy.orm.session import Session
 
@@ -18,6 +19,7 @@ from .modern import (
     get_significant_states as _modern_get_significant_states,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    stream_significant_states_with_session as _modern_stream_significant_states_with_session,
 )
 
 # These are the APIs of this package
@@ -29,6 +31,7 @@ __all__ = [
     "get_significant_states",
     "get_significant_states_with_session",
     "state_changes_during_period",
+    "stream_significant_states_with_session",
 ]
 
 
@@ -152,6 +155,56 @@ def get_significant_states_with_session(
     )
 
 
+def stream_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+    """Yield the compressed significant states of each entity as it completes."""
+    if get_instance(hass).states_meta_manager.active:
+        return _modern_stream_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+    # The legacy schema does not support streaming so the
+    # whole result is fetched at once.
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states_with_session as _legacy_get_significant_states_with_session,
+    )
+
+    return iter(
+        cast(
+            dict[str, list[dict[str, Any]]],
+            _legacy_get_significant_states_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                None,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                True,
+            ),
+        ).items()
+    )
+
+
 def state_changes_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -21,6 +21,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -232,6 +233,106 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    stmt, entity_id_to_metadata_id, start_time_ts = query
+    return _sorted_states_to_dict(
+        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+def stream_significant_states_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+) -> Iterator[tuple[str, list[dict[str, Any]]]]:
+    """Yield the compressed significant states of each entity as it completes.
+
+    Unlike get_significant_states_with_session the rows are consumed from
+    the cursor in chunks and only the states of a single entity are held
+    in memory at a time, so peak memory and the time until the first
+    entity is available do not depend on the length of the period.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return
+    stmt, entity_id_to_metadata_id, start_time_ts = query
+    metadata_id_to_entity_id = {
+        metadata_id: entity_id
+        for entity_id, metadata_id in entity_id_to_metadata_id.items()
+        if metadata_id is not None
+    }
+    for metadata_id, group in groupby(
+        execute_stmt_lambda_element(
+            session, stmt, start_time, end_time, orm_rows=False
+        ),
+        itemgetter(_FIELD_MAP["metadata_id"]),
+    ):
+        entity_id = metadata_id_to_entity_id[metadata_id]
+        if entity_states := _sorted_states_to_dict(
+            group,
+            start_time_ts,
+            [entity_id],
+            {entity_id: metadata_id},
+            minimal_response,
+            True,
+            no_attributes=no_attributes,
+        ):
+            yield entity_id, cast(list[dict[str, Any]], entity_states[entity_id])
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> tuple[StatementLambdaElement, dict[str, int | None], float | None] | None:
+    """Return the significant states statement for the entities.
+
+    The statement is returned with the metadata_id mapping of the entities
+    and the start time timestamp if the start time states are included.
+
+    Returns None if none of the entities have ever been recorded.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -240,7 +341,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -278,14 +379,10 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
+        stmt,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+        start_time_ts if include_start_time_state else None,
     )
 
 
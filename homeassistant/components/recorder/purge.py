@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
@@ -52,6 +53,33 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# A purge chunk is committed early once it took this many seconds
+# or once this many tasks are waiting in the recorder queue, so
+# recording new data is never held up for long by a purge.
+MAX_PURGE_CHUNK_DURATION = 5
+MAX_PURGE_CHUNK_BACKLOG = 1000
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of a purge which runs in multiple chunks."""
+
+    purge_before: datetime
+    states: int = 0
+    events: int = 0
+    chunks: int = 0
+    finished: bool = False
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the progress."""
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "states_purged": self.states,
+            "events_purged": self.events,
+            "chunks": self.chunks,
+            "finished": self.finished,
+        }
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -61,15 +89,26 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    max_duration: float | None = None,
+    max_backlog: int | None = None,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    If max_duration or max_backlog is given, the states and events batches
+    stop early once the chunk took max_duration seconds or the recorder
+    backlog reached max_backlog tasks.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    if progress is None:
+        progress = PurgeProgress(purge_before)
+    progress.chunks += 1
+    should_pause = _purge_pause_checker(instance, max_duration, max_backlog)
     with session_scope(session=instance.get_session()) as session:
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
@@ -78,7 +117,9 @@ def purge_old_data(
                 "Purge running in legacy format as there are states with event_id"
                 " remaining"
             )
-            has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
+            has_more_to_purge |= _purge_legacy_format(
+                instance, session, purge_before, progress
+            )
         else:
             _LOGGER.debug(
                 "Purge running in new format as there are NO states with event_id"
@@ -86,10 +127,20 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance,
+                session,
+                states_batch_size,
+                purge_before,
+                progress,
+                should_pause,
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance,
+                session,
+                events_batch_size,
+                purge_before,
+                progress,
+                should_pause,
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -126,16 +177,38 @@ def purge_old_data(
         instance.states_manager.load_from_db(session)
     if repack:
         repack_database(instance)
+    progress.finished = True
     return True
 
 
+def _purge_pause_checker(
+    instance: Recorder, max_duration: float | None, max_backlog: int | None
+) -> Callable[[], bool]:
+    """Return a function which checks if a purge chunk should stop early."""
+    deadline = None if max_duration is None else time.monotonic() + max_duration
+
+    def _should_pause() -> bool:
+        if deadline is not None and time.monotonic() >= deadline:
+            _LOGGER.debug("Purge chunk reached its time limit")
+            return True
+        if max_backlog is not None and instance.backlog >= max_backlog:
+            _LOGGER.debug("Purge chunk stopped to let the recorder catch up")
+            return True
+        return False
+
+    return _should_pause
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
 
 
 def _purge_legacy_format(
-    instance: Recorder, session: Session, purge_before: datetime
+    instance: Recorder,
+    session: Session,
+    purge_before: datetime,
+    progress: PurgeProgress,
 ) -> bool:
     """Purge rows that are still linked by the event_ids."""
     (
@@ -150,6 +223,8 @@ def _purge_legacy_format(
     _purge_unused_attributes_ids(instance, session, attributes_ids)
     _purge_event_ids(session, event_ids)
     _purge_unused_data_ids(instance, session, data_ids)
+    progress.states += len(state_ids)
+    progress.events += len(event_ids)
 
     # The database may still have some rows that have an event_id but are not
     # linked to any event. These rows are not linked to any event because the
@@ -164,6 +239,7 @@ def _purge_legacy_format(
     )
     _purge_state_ids(instance, session, detached_state_ids)
     _purge_unused_attributes_ids(instance, session, detached_attributes_ids)
+    progress.states += len(detached_state_ids)
     return bool(
         event_ids
         or state_ids
@@ -179,6 +255,8 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
+    should_pause: Callable[[], bool],
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -201,7 +279,10 @@ def _purge_states_and_attributes_ids(
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        progress.states += len(state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if should_pause():
+            break
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -216,6 +297,8 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
+    should_pause: Callable[[], bool],
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -236,7 +319,10 @@ def _purge_events_and_data_ids(
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        progress.events += len(event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if should_pause():
+            break
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from lru import LRU
@@ -56,14 +57,20 @@ class BaseTableManager[_DataT]:
 class BaseLRUTableManager[_DataT](BaseTableManager[_DataT]):
     """Base class for LRU table managers."""
 
-    def __init__(self, recorder: Recorder, lru_size: int) -> None:
+    def __init__(
+        self,
+        recorder: Recorder,
+        lru_size: int,
+        evicted_callback: Callable[[Any, int], None] | None = None,
+    ) -> None:
         """Initialize the LRU table manager.
 
         We keep track of the most recently used items
         and evict the least recently used items when the cache is full.
+        The evicted_callback is called with each evicted item.
         """
         super().__init__(recorder)
-        self._id_map = LRU(lru_size)
+        self._id_map = LRU(lru_size, callback=evicted_callback)
 
     def adjust_lru_size(self, new_size: int) -> None:
         """Adjust the LRU cache size.
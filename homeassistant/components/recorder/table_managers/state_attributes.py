@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Collection, Iterable
 import logging
 from typing import TYPE_CHECKING, cast
@@ -28,15 +29,127 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# The memory budget in bytes for the shared attributes which were evicted
+# from the LRU and are kept in a second level cache indexed by their hash
+HASH_CACHE_MAX_BYTES = 4 * 1024 * 1024
+# Approximate memory used by a hash cache entry besides the shared attributes
+HASH_CACHE_ENTRY_OVERHEAD = 150
+
 _LOGGER = logging.getLogger(__name__)
 
 
+class StateAttributesHashCache:
+    """Memory budgeted cache of shared attributes to attributes_ids by hash.
+
+    Entries are evicted in least recently used order once the size of
+    the cached shared attributes exceeds the memory budget.
+    """
+
+    __slots__ = ("_entries", "evictions", "max_bytes", "size_bytes")
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize the hash cache."""
+        self._entries: OrderedDict[int, tuple[str, int]] = OrderedDict()
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of cached shared attributes."""
+        return len(self._entries)
+
+    def pop(self, shared_attrs: str, data_hash: int) -> int | None:
+        """Remove and return the attributes_id of the shared attributes."""
+        if (entry := self._entries.get(data_hash)) is None or (
+            entry[0] != shared_attrs
+        ):
+            return None
+        del self._entries[data_hash]
+        self.size_bytes -= len(shared_attrs) + HASH_CACHE_ENTRY_OVERHEAD
+        return entry[1]
+
+    def add(self, shared_attrs: str, data_hash: int, attributes_id: int) -> None:
+        """Add the attributes_id of the shared attributes."""
+        entries = self._entries
+        if (old_entry := entries.pop(data_hash, None)) is not None:
+            self.size_bytes -= len(old_entry[0]) + HASH_CACHE_ENTRY_OVERHEAD
+        entries[data_hash] = (shared_attrs, attributes_id)
+        self.size_bytes += len(shared_attrs) + HASH_CACHE_ENTRY_OVERHEAD
+        while self.size_bytes > self.max_bytes:
+            _, (evicted_shared_attrs, _) = entries.popitem(last=False)
+            self.size_bytes -= len(evicted_shared_attrs) + HASH_CACHE_ENTRY_OVERHEAD
+            self.evictions += 1
+
+    def evict_ids(self, attributes_ids: set[int]) -> None:
+        """Remove the entries of the attributes_ids."""
+        entries = self._entries
+        for data_hash in [
+            data_hash
+            for data_hash, (_, attributes_id) in entries.items()
+            if attributes_id in attributes_ids
+        ]:
+            shared_attrs, _ = entries.pop(data_hash)
+            self.size_bytes -= len(shared_attrs) + HASH_CACHE_ENTRY_OVERHEAD
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self.size_bytes = 0
+
+
 class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     """Manage the StateAttributes table."""
 
     def __init__(self, recorder: Recorder) -> None:
-        """Initialize the event type manager."""
-        super().__init__(recorder, CACHE_SIZE)
+        """Initialize the event type manager.
+
+        Shared attributes evicted from the LRU are moved to a second
+        level cache which is limited by memory instead of by the number
+        of entries, so attributes which change frequently do not have
+        to be looked up in the database again as long as they fit in
+        the memory budget.
+        """
+        self._hash_cache = StateAttributesHashCache(HASH_CACHE_MAX_BYTES)
+        super().__init__(recorder, CACHE_SIZE, self._evicted_from_lru)
+        self.hits = 0
+        self.misses = 0
+
+    def _evicted_from_lru(self, shared_attrs: str, attributes_id: int) -> None:
+        """Move shared attributes evicted from the LRU to the hash cache."""
+        self._hash_cache.add(
+            shared_attrs,
+            StateAttributes.hash_shared_attrs_bytes(shared_attrs.encode("utf-8")),
+            attributes_id,
+        )
+
+    def _get_from_hash_cache(self, shared_attrs: str, data_hash: int) -> int | None:
+        """Resolve shared_attrs from the hash cache and move them back to the LRU."""
+        if (attributes_id := self._hash_cache.pop(shared_attrs, data_hash)) is not None:
+            self._id_map[shared_attrs] = attributes_id
+        return attributes_id
+
+    @property
+    def cache_stats(self) -> dict[str, int]:
+        """Return the statistics of the attributes_id caches."""
+        hash_cache = self._hash_cache
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": hash_cache.evictions,
+            "lru_entries": len(self._id_map),
+            "hash_cache_entries": len(hash_cache),
+            "hash_cache_bytes": hash_cache.size_bytes,
+        }
+
+    def get_from_cache(self, data: str) -> int | None:
+        """Resolve shared_attrs to the attributes_id without accessing the database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if (attributes_id := self._id_map.get(data)) is not None:
+            self.hits += 1
+        return attributes_id
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -60,11 +173,18 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
-        if hashes := {
-            StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
-            for event in events
-            if (shared_attrs_bytes := self.serialize_from_event(event))
-        }:
+        id_map = self._id_map
+        hashes: set[int] = set()
+        for event in events:
+            if not (shared_attrs_bytes := self.serialize_from_event(event)):
+                continue
+            shared_attrs = shared_attrs_bytes.decode("utf-8")
+            if shared_attrs in id_map:
+                continue
+            data_hash = StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes)
+            if self._get_from_hash_cache(shared_attrs, data_hash) is None:
+                hashes.add(data_hash)
+        if hashes:
             self._load_from_hashes(hashes, session)
 
     def get(self, shared_attr: str, data_hash: int, session: Session) -> int | None:
@@ -86,8 +206,12 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         results: dict[str, int | None] = {}
         missing_hashes: set[int] = set()
         for shared_attrs, data_hash in shared_attrs_data_hashes:
-            if (attributes_id := self._id_map.get(shared_attrs)) is None:
+            if (attributes_id := self._id_map.get(shared_attrs)) is None and (
+                attributes_id := self._get_from_hash_cache(shared_attrs, data_hash)
+            ) is None:
                 missing_hashes.add(data_hash)
+            else:
+                self.hits += 1
 
             results[shared_attrs] = attributes_id
 
@@ -105,6 +229,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         recorder thread.
         """
         results: dict[str, int | None] = {}
+        self.misses += len(hashes)
         with session.no_autoflush:
             for hashs_chunk in chunked_or_all(hashes, self.recorder.max_bind_vars):
                 for attributes_id, shared_attrs in execute_stmt_lambda_element(
@@ -152,3 +277,13 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
             state_attributes_ids_reversed
         ):
             id_map.pop(state_attributes_ids_reversed[purged_attributes_id], None)
+        self._hash_cache.evict_ids(attributes_ids)
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._hash_cache.clear()
@@ -114,20 +114,30 @@ class PurgeTask(RecorderTask):
     purge_before: datetime
     repack: bool
     apply_filter: bool
+    progress: purge.PurgeProgress | None = None
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
+        progress = self.progress or purge.PurgeProgress(self.purge_before)
+        instance.purge_progress = progress
         if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            max_duration=purge.MAX_PURGE_CHUNK_DURATION,
+            max_backlog=purge.MAX_PURGE_CHUNK_BACKLOG,
+            progress=progress,
         ):
             # We always need to do the db cleanups after a purge
             # is finished to ensure the WAL checkpoint and other
             # tasks happen after a vacuum.
             periodic_db_cleanups(instance)
             return
-        # Schedule a new purge task if this one didn't finish
+        # Schedule a new purge task if this one didn't finish,
+        # the recorder will commit the queued events in between
         instance.queue_task(
-            PurgeTask(self.purge_before, self.repack, self.apply_filter)
+            PurgeTask(self.purge_before, self.repack, self.apply_filter, progress)
         )
 
 
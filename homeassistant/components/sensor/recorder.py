@@ -6,10 +6,11 @@ from collections import defaultdict
 from collections.abc import Callable, Iterable
 from contextlib import suppress
 import datetime
+from functools import cache
 import itertools
 import logging
 import math
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
@@ -26,12 +27,22 @@ from homeassistant.components.recorder.models import (
 )
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_STATE_CHANGED,
     REVOLUTIONS_PER_MINUTE,
     UnitOfIrradiance,
     UnitOfSoundPressure,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant, State, callback, split_entity_id
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+    split_entity_id,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.entity import entity_sources
@@ -50,6 +61,9 @@ from .const import (
     UnitOfVolumeFlowRate,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
 _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATISTICS = {
@@ -78,6 +92,138 @@ WARN_UNSUPPORTED_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unsupported_u
 WARN_UNSTABLE_UNIT: HassKey[set[str]] = HassKey(f"{DOMAIN}_warn_unstable_unit")
 # Link to dev statistics where issues around LTS can be fixed
 LINK_DEV_STATISTICS = "https://my.home-assistant.io/redirect/developer_statistics"
+# Recent sensor states kept in memory to compile short term statistics
+STATE_BUFFER: HassKey[SensorStateBuffer] = HassKey(f"{DOMAIN}_state_buffer")
+# Maximum number of states kept in memory per entity
+STATE_BUFFER_MAX_STATES = 1024
+
+
+class SensorStateBuffer:
+    """Keep the recent states of statistics sensors in memory.
+
+    The buffer is seeded with the current states of the sensors and then
+    follows state_changed events, which allows the short term statistics
+    of the next periods to be compiled without querying the states from
+    the database.
+
+    The first buffered state of an entity marks the point since which the
+    history of the entity is complete. Entities which were added, pruned
+    or overflowed after the start of a period are not covered and the
+    states for them need to be fetched from the database.
+
+    Sensors excluded by the recorder entity filter are not buffered.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entity_filter: Callable[[str], bool] | None
+    ) -> None:
+        """Initialize the buffer."""
+        self._hass = hass
+        self._entity_filter = entity_filter
+        self._states: dict[str, list[State]] = {}
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> None:
+        """Seed the buffer with the current states and start following changes."""
+        entity_filter = self._entity_filter
+        for state in self._hass.states.async_all(DOMAIN):
+            if ATTR_STATE_CLASS in state.attributes and (
+                not entity_filter or entity_filter(state.entity_id)
+            ):
+                self._states[state.entity_id] = [state]
+        self._unsub = self._hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed
+        )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following changes and drop the buffered states."""
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+        self._states.clear()
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Add a changed state to the buffer."""
+        entity_id = event.data["entity_id"]
+        if not entity_id.startswith("sensor."):
+            return
+        if self._entity_filter and not self._entity_filter(entity_id):
+            return
+        if (new_state := event.data["new_state"]) is None:
+            self._states.pop(entity_id, None)
+            return
+        if ATTR_STATE_CLASS not in new_state.attributes:
+            self._states.pop(entity_id, None)
+            return
+        if (states := self._states.get(entity_id)) is None:
+            self._states[entity_id] = [new_state]
+            return
+        if new_state.last_updated_timestamp < states[-1].last_updated_timestamp:
+            # The clock went backwards, the buffer can no longer tell which
+            # states were recorded before the first buffered state.
+            del self._states[entity_id]
+            return
+        states.append(new_state)
+        if len(states) > STATE_BUFFER_MAX_STATES:
+            del states[: len(states) // 2]
+
+    @callback
+    def async_get_history(
+        self,
+        start: datetime.datetime,
+        end: datetime.datetime,
+        entity_ids: Iterable[str],
+        significant_changes_only: bool,
+    ) -> dict[str, list[State] | None]:
+        """Return the buffered states of the entities during start-end.
+
+        The result matches the states which get_full_significant_states
+        would return from the database, including the state at the start
+        of the period. Entities which are not covered by the buffer are
+        mapped to None. Buffered states which are no longer needed to
+        compile the periods after end are pruned.
+        """
+        start_ts = start.timestamp()
+        end_ts = end.timestamp()
+        next_start_ts = (end - datetime.timedelta.resolution).timestamp()
+        history: dict[str, list[State] | None] = {}
+        for entity_id in entity_ids:
+            if not (states := self._states.get(entity_id)) or (
+                states[0].last_updated_timestamp >= start_ts
+            ):
+                history[entity_id] = None
+                continue
+            start_idx = 0
+            entity_history: list[State] = []
+            for idx, state in enumerate(states):
+                last_updated_ts = state.last_updated_timestamp
+                if last_updated_ts < start_ts:
+                    start_idx = idx
+                    continue
+                if last_updated_ts >= end_ts:
+                    break
+                if last_updated_ts > start_ts and (
+                    not significant_changes_only
+                    or state.last_changed == state.last_updated
+                ):
+                    entity_history.append(state)
+            entity_history.insert(0, states[start_idx])
+            history[entity_id] = entity_history
+            self._prune(states, next_start_ts)
+        return history
+
+    @staticmethod
+    def _prune(states: list[State], start_ts: float) -> None:
+        """Drop the states before the state at start_ts."""
+        keep_idx = 0
+        for idx, state in enumerate(states):
+            if state.last_updated_timestamp >= start_ts:
+                break
+            keep_idx = idx
+        del states[:keep_idx]
 
 
 def _get_sensor_states(hass: HomeAssistant) -> list[State]:
@@ -146,6 +292,99 @@ def _time_weighted_average(
     return accumulated / period_seconds
 
 
+@cache
+def _numpy_available() -> bool:
+    """Return if NumPy is installed.
+
+    NumPy is not a requirement of the sensor integration, which is imported
+    before requirements are installed, so it is only used when available.
+    """
+    try:
+        import numpy as np  # noqa: F401 pylint: disable=import-outside-toplevel
+    except ImportError:
+        return False
+    return True
+
+
+def _float_states_to_arrays(
+    fstates: list[tuple[float, State]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the values and the last_updated timestamps of the states as arrays."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    count = len(fstates)
+    values = np.fromiter(
+        (fstate for fstate, _ in fstates), dtype=np.float64, count=count
+    )
+    timestamps = np.fromiter(
+        (state.last_updated_timestamp for _, state in fstates),
+        dtype=np.float64,
+        count=count,
+    )
+    return values, timestamps
+
+
+def _time_weighted_average_arrays(
+    values: np.ndarray,
+    timestamps: np.ndarray,
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> float:
+    """Calculate a time weighted average from arrays of values and timestamps.
+
+    Matches _time_weighted_average without a loop over the states.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    start_ts = start.timestamp()
+    # The timestamps are made relative to the start of the period and
+    # rounded to whole microseconds, which is the resolution of
+    # last_updated, to get exact durations.
+    start_times = np.maximum(np.round((timestamps - start_ts) * 1e6), 0.0)
+    end_time = round((end.timestamp() - start_ts) * 1e6)
+    # Weight each value by the duration until the next state change,
+    # or until the end of the period for the last state
+    durations = np.diff(start_times, append=end_time)
+    # Adjust start time, if there was no last known state
+    period_microseconds = end_time - float(start_times[0])
+    if period_microseconds == 0:
+        return 0.0
+    return float(np.dot(values, durations)) / period_microseconds
+
+
+def _mean_min_max(
+    fstates: list[tuple[float, State]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+    wanted: set[str],
+) -> tuple[float | None, float | None, float | None]:
+    """Return the time weighted mean, min and max of the states.
+
+    Statistics which are not wanted are returned as None.
+    """
+    mean: float | None = None
+    min_: float | None = None
+    max_: float | None = None
+    if wanted.isdisjoint(("mean", "min", "max")):
+        return mean, min_, max_
+    if _numpy_available():
+        values, timestamps = _float_states_to_arrays(fstates)
+        if "mean" in wanted:
+            mean = _time_weighted_average_arrays(values, timestamps, start, end)
+        if "min" in wanted:
+            min_ = float(values.min())
+        if "max" in wanted:
+            max_ = float(values.max())
+        return mean, min_, max_
+    if "mean" in wanted:
+        mean = _time_weighted_average(fstates, start, end)
+    if "min" in wanted:
+        min_ = min(*itertools.islice(zip(*fstates, strict=False), 1))
+    if "max" in wanted:
+        max_ = max(*itertools.islice(zip(*fstates, strict=False), 1))
+    return mean, min_, max_
+
+
 def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
     """Return a set of all units."""
     return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
@@ -402,6 +641,69 @@ def _timestamp_to_isoformat_or_none(timestamp: float | None) -> str | None:
     return dt_util.utc_from_timestamp(timestamp).isoformat()
 
 
+@callback
+def _async_start_state_buffer(hass: HomeAssistant) -> SensorStateBuffer:
+    """Start the state buffer, it is stopped when Home Assistant stops."""
+    state_buffer = hass.data[STATE_BUFFER] = SensorStateBuffer(
+        hass, get_instance(hass).entity_filter
+    )
+    state_buffer.async_start()
+
+    @callback
+    def _async_stop_state_buffer(_: Event) -> None:
+        """Stop the state buffer."""
+        if hass.data.get(STATE_BUFFER) is state_buffer:
+            del hass.data[STATE_BUFFER]
+        state_buffer.async_stop()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_stop_state_buffer)
+    return state_buffer
+
+
+def _get_buffered_history(
+    hass: HomeAssistant,
+    start: datetime.datetime,
+    end: datetime.datetime,
+    wanted_statistics: dict[str, set[str]],
+) -> dict[str, list[State]]:
+    """Return the history of the sensors which is covered by the state buffer."""
+    if not hass.is_running:
+        return {}
+    if (state_buffer := hass.data.get(STATE_BUFFER)) is None:
+        state_buffer = run_callback_threadsafe(
+            hass.loop, _async_start_state_buffer, hass
+        ).result()
+
+    entities_full_history: list[str] = []
+    entities_significant_history: list[str] = []
+    for entity_id, wanted in wanted_statistics.items():
+        if "sum" in wanted:
+            entities_full_history.append(entity_id)
+        else:
+            entities_significant_history.append(entity_id)
+
+    @callback
+    def _async_get_history() -> dict[str, list[State] | None]:
+        return {
+            **state_buffer.async_get_history(
+                start, end, entities_full_history, significant_changes_only=False
+            ),
+            **state_buffer.async_get_history(
+                start, end, entities_significant_history, significant_changes_only=True
+            ),
+        }
+
+    return {
+        entity_id: entity_history
+        for entity_id, entity_history in run_callback_threadsafe(
+            hass.loop, _async_get_history
+        )
+        .result()
+        .items()
+        if entity_history is not None
+    }
+
+
 def compile_statistics(  # noqa: C901
     hass: HomeAssistant,
     session: Session,
@@ -413,13 +715,17 @@ def compile_statistics(  # noqa: C901
 
     sensor_states = _get_sensor_states(hass)
     wanted_statistics = _wanted_statistics(sensor_states)
-    # Get history between start and end
+    # Get history between start and end, from the state buffer if possible
+    history_list = _get_buffered_history(
+        hass, start - datetime.timedelta.resolution, end, wanted_statistics
+    )
     entities_full_history = [
-        i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
+        i.entity_id
+        for i in sensor_states
+        if "sum" in wanted_statistics[i.entity_id] and i.entity_id not in history_list
     ]
-    history_list: dict[str, list[State]] = {}
     if entities_full_history:
-        history_list = history.get_full_significant_states_with_session(
+        _history_list = history.get_full_significant_states_with_session(
             hass,
             session,
             start - datetime.timedelta.resolution,
@@ -427,10 +733,12 @@ def compile_statistics(  # noqa: C901
             entity_ids=entities_full_history,
             significant_changes_only=False,
         )
+        history_list = {**history_list, **_history_list}
     entities_significant_history = [
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
+        and i.entity_id not in history_list
     ]
     if entities_significant_history:
         _history_list = history.get_full_significant_states_with_session(
@@ -525,17 +833,15 @@ def compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
-        if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-        if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(
-                *itertools.islice(zip(*valid_float_states, strict=False), 1)
-            )
-
-        if "mean" in wanted_statistics[entity_id]:
-            stat["mean"] = _time_weighted_average(valid_float_states, start, end)
+        mean, min_, max_ = _mean_min_max(
+            valid_float_states, start, end, wanted_statistics[entity_id]
+        )
+        if max_ is not None:
+            stat["max"] = max_
+        if min_ is not None:
+            stat["min"] = min_
+        if mean is not None:
+            stat["mean"] = mean
 
         if "sum" in wanted_statistics[entity_id]:
             last_reset = old_last_reset = None
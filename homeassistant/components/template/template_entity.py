@@ -511,6 +511,7 @@ class TemplateEntity(Entity):  # pylint: disable=hass-enforce-class-module
             self._handle_results,
             log_fn=log_fn,
             has_super_template=has_availability_template,
+            batch_renders=True,
         )
         self.async_on_remove(result_info.async_remove)
         self._template_result_info = result_info
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from functools import lru_cache, partial
 import json
 import logging
+from operator import attrgetter
 from typing import Any, cast
 
 import voluptuous as vol
@@ -14,11 +16,13 @@ from homeassistant.auth.models import User
 from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.auth.permissions.events import SUBSCRIBE_ALLOWLIST
 from homeassistant.const import (
+    EVENT_HOMEASSISTANT_STOP,
     EVENT_STATE_CHANGED,
     MATCH_ALL,
     SIGNAL_BOOTSTRAP_INTEGRATIONS,
 )
 from homeassistant.core import (
+    CALLBACK_TYPE,
     Context,
     Event,
     EventStateChangedData,
@@ -60,6 +64,7 @@ from homeassistant.loader import (
     async_get_integrations,
 )
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -67,6 +72,7 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+STATES_SNAPSHOT: HassKey[StatesSnapshot] = HassKey("websocket_api_states_snapshot")
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -309,12 +315,171 @@ async def handle_call_service(
         connection.send_error(msg["id"], const.ERR_UNKNOWN_ERROR, str(err))
 
 
+class _StatesJSON:
+    """JSON fragments of all states for one serialization of a state."""
+
+    __slots__ = ("_changes", "_fragments", "_joined", "_serialize")
+
+    def __init__(self, serialize: Callable[[State], bytes]) -> None:
+        """Initialize the fragments."""
+        self._serialize = serialize
+        self._fragments: dict[str, bytes] | None = None
+        # entity_id -> (was added, new state or None if removed)
+        self._changes: dict[str, tuple[bool, State | None]] = {}
+        self._joined: bytes | None = None
+
+    @callback
+    def async_state_changed(
+        self, entity_id: str, old_state: State | None, new_state: State | None
+    ) -> None:
+        """Record a state change to apply on the next request."""
+        if self._fragments is None:
+            return
+        self._joined = None
+        changes = self._changes
+        if old_state is None:
+            # An added state moves to the end like in the state machine
+            changes.pop(entity_id, None)
+            changes[entity_id] = (True, new_state)
+        elif (change := changes.get(entity_id)) is not None and change[0]:
+            changes[entity_id] = (True, new_state)
+        else:
+            changes[entity_id] = (False, new_state)
+
+    @callback
+    def async_json(self, hass: HomeAssistant) -> bytes:
+        """Return the comma joined JSON of all states.
+
+        Raises ValueError or TypeError if a state can not be serialized.
+        """
+        if (joined := self._joined) is not None:
+            return joined
+        serialize = self._serialize
+        if (fragments := self._fragments) is None:
+            fragments = {
+                state.entity_id: serialize(state) for state in hass.states.async_all()
+            }
+        else:
+            changes = self._changes
+            try:
+                for entity_id, (added, state) in changes.items():
+                    if added or state is None:
+                        fragments.pop(entity_id, None)
+                    if state is not None:
+                        fragments[entity_id] = serialize(state)
+            except (ValueError, TypeError):
+                # Start over with all states on the next request
+                self._fragments = None
+                raise
+            finally:
+                changes.clear()
+        self._fragments = fragments
+        joined = self._joined = b",".join(fragments.values())
+        return joined
+
+
+class StatesSnapshot:
+    """Pre-serialized JSON of all states in the state machine.
+
+    The snapshot is shared by all connections which may read every entity,
+    so a burst of clients connecting at the same time serializes the
+    state machine once instead of once per client. The JSON is kept per
+    entity and a state change only replaces the JSON of the changed
+    entity, the JSON of all states is joined again on the next request.
+    """
+
+    __slots__ = (
+        "_compressed_states_json",
+        "_hass",
+        "_states_json",
+        "_unsub_state_changed",
+        "generation",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the snapshot."""
+        self._hass = hass
+        self._states_json = _StatesJSON(attrgetter("as_dict_json"))
+        self._compressed_states_json = _StatesJSON(
+            attrgetter("as_compressed_state_json")
+        )
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+        self.generation = 0
+
+    @callback
+    def async_setup(self) -> None:
+        """Listen for state changes to update the snapshot."""
+        self._unsub_state_changed = self._hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_state_changed
+        )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop updating the snapshot."""
+        if self._unsub_state_changed is not None:
+            self._unsub_state_changed()
+            self._unsub_state_changed = None
+
+    @callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Replace the JSON of the changed state."""
+        self.generation += 1
+        data = event.data
+        entity_id = data["entity_id"]
+        old_state = data["old_state"]
+        new_state = data["new_state"]
+        self._states_json.async_state_changed(entity_id, old_state, new_state)
+        self._compressed_states_json.async_state_changed(
+            entity_id, old_state, new_state
+        )
+
+    @callback
+    def async_states_json(self) -> bytes:
+        """Return the comma joined JSON of all states.
+
+        Raises ValueError or TypeError if a state can not be serialized.
+        """
+        return self._states_json.async_json(self._hass)
+
+    @callback
+    def async_compressed_states_json(self) -> bytes:
+        """Return the comma joined compressed JSON of all states.
+
+        Raises ValueError or TypeError if a state can not be serialized.
+        """
+        return self._compressed_states_json.async_json(self._hass)
+
+
+@callback
+def _async_get_states_snapshot(hass: HomeAssistant) -> StatesSnapshot:
+    """Return the states snapshot."""
+    if (snapshot := hass.data.get(STATES_SNAPSHOT)) is None:
+        snapshot = hass.data[STATES_SNAPSHOT] = StatesSnapshot(hass)
+        snapshot.async_setup()
+
+        @callback
+        def _async_discard_snapshot(_: Event) -> None:
+            """Discard the snapshot when Home Assistant stops."""
+            if hass.data.get(STATES_SNAPSHOT) is snapshot:
+                del hass.data[STATES_SNAPSHOT]
+            snapshot.async_shutdown()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_discard_snapshot)
+    return snapshot
+
+
+@callback
+def _async_can_read_all_states(connection: ActiveConnection) -> bool:
+    """Return if the user of the connection may read all states."""
+    user = connection.user
+    return user.is_admin or user.permissions.access_all_entities(POLICY_READ)
+
+
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
 ) -> list[State]:
-    user = connection.user
-    if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+    if _async_can_read_all_states(connection):
         return hass.states.async_all()
     entity_perm = connection.user.permissions.check_entity
     return [
@@ -330,10 +495,19 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
+    if _async_can_read_all_states(connection):
+        try:
+            serialized_states = _async_get_states_snapshot(hass).async_states_json()
+        except (ValueError, TypeError):
+            pass
+        else:
+            _send_handle_get_states_response(connection, msg["id"], serialized_states)
+            return
+
     states = _async_get_allowed_states(hass, connection)
 
     try:
-        serialized_states = [state.as_dict_json for state in states]
+        serialized_states = b",".join([state.as_dict_json for state in states])
     except (ValueError, TypeError):
         pass
     else:
@@ -341,10 +515,10 @@ def handle_get_states(
         return
 
     # If we can't serialize, we'll filter out unserializable states
-    serialized_states = []
+    serializable_states: list[bytes] = []
     for state in states:
         try:
-            serialized_states.append(state.as_dict_json)
+            serializable_states.append(state.as_dict_json)
         except (ValueError, TypeError):
             connection.logger.error(
                 "Unable to serialize to JSON. Bad data found at %s",
@@ -353,45 +527,144 @@ def handle_get_states(
                 ),
             )
 
-    _send_handle_get_states_response(connection, msg["id"], serialized_states)
+    _send_handle_get_states_response(
+        connection, msg["id"], b",".join(serializable_states)
+    )
 
 
 def _send_handle_get_states_response(
-    connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
+    connection: ActiveConnection, msg_id: int, serialized_states: bytes
 ) -> None:
     """Send handle get states response."""
     connection.send_message(
-        construct_result_message(
-            msg_id, b"".join((b"[", b",".join(serialized_states), b"]"))
-        )
+        construct_result_message(msg_id, b"".join((b"[", serialized_states, b"]")))
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+class _EntityChangesForwarder:
+    """Forward entity state changes for a subscribe_entities subscription.
+
+    While the client keeps up, every state change is sent as its own
+    cached diff message. Once the send queue of the connection reaches
+    PENDING_MSG_COALESCE_DIFFS, changes are held back and merged per
+    entity, and are sent as a single message once the client has caught
+    up. A client that falls behind then needs at most one pending change
+    per entity instead of one per state change, and is not disconnected
+    for exceeding the pending message limit.
+    """
+
+    __slots__ = (
+        "_connection",
+        "_entity_filter",
+        "_entity_ids",
+        "_flush_handle",
+        "_hass",
+        "_message_id_as_bytes",
+        "_pending",
+        "_unsub",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: ActiveConnection,
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        message_id_as_bytes: bytes,
+    ) -> None:
+        """Initialize the forwarder."""
+        self._hass = hass
+        self._connection = connection
+        self._entity_ids = entity_ids
+        self._entity_filter = entity_filter
+        self._message_id_as_bytes = message_id_as_bytes
+        # entity_id -> (state known to the client, latest state)
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(self) -> CALLBACK_TYPE:
+        """Listen for state changes and return a callback to unsubscribe."""
+        self._unsub = self._hass.bus.async_listen(
+            EVENT_STATE_CHANGED, self._async_forward
+        )
+        return self._async_unsubscribe
+
+    @callback
+    def _async_unsubscribe(self) -> None:
+        """Stop listening and drop any held back changes."""
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending.clear()
+
+    @callback
+    def _async_forward(self, event: Event[EventStateChangedData]) -> None:
+        """Forward entity state changed events to websocket."""
+        entity_id = event.data["entity_id"]
+        if (self._entity_ids and entity_id not in self._entity_ids) or (
+            self._entity_filter and not self._entity_filter(entity_id)
+        ):
+            return
+        # We have to lookup the permissions again because the user might have
+        # changed since the subscription was created.
+        connection = self._connection
+        user = connection.user
+        permissions = user.permissions
+        if (
+            not user.is_admin
+            and not permissions.access_all_entities(POLICY_READ)
+            and not permissions.check_entity(entity_id, POLICY_READ)
+        ):
+            return
+        pending = self._pending
+        if (
+            not pending
+            and connection.pending_message_count() < const.PENDING_MSG_COALESCE_DIFFS
+        ):
+            connection.send_message(
+                messages.cached_state_diff_message(self._message_id_as_bytes, event)
+            )
+            return
+        # Once changes are held back, every later change must be held back
+        # as well so the client receives the changes of an entity in order.
+        new_state = event.data["new_state"]
+        if (held_back := pending.get(entity_id)) is not None:
+            pending[entity_id] = (held_back[0], new_state)
+        else:
+            pending[entity_id] = (event.data["old_state"], new_state)
+        if self._flush_handle is None:
+            self._async_schedule_flush()
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Schedule sending the held back changes."""
+        self._flush_handle = self._hass.loop.call_later(
+            const.COALESCE_DIFFS_FLUSH_INTERVAL, self._async_flush
+        )
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the held back changes if the client has caught up."""
+        connection = self._connection
+        if connection.pending_message_count() >= const.PENDING_MSG_COALESCE_DIFFS:
+            self._async_schedule_flush()
+            return
+        self._flush_handle = None
+        pending = self._pending
+        changes = [
+            (entity_id, old_state, new_state)
+            for entity_id, (old_state, new_state) in pending.items()
+        ]
+        pending.clear()
+        if message := messages.coalesced_state_diff_message(
+            self._message_id_as_bytes, changes
+        ):
+            connection.send_message(message)
 
 
 @callback
@@ -415,17 +688,9 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            entity_filter,
-            connection.user,
-            message_id_as_bytes,
-        ),
-    )
+    connection.subscriptions[msg_id] = _EntityChangesForwarder(
+        hass, connection, entity_ids, entity_filter, message_id_as_bytes
+    ).async_subscribe()
     connection.send_result(msg_id)
 
     # JSON serialize here so we can recover if it blows up due to the
@@ -433,15 +698,23 @@ def handle_subscribe_entities(
     # to succeed for the UI to show.
     try:
         if entity_ids or entity_filter:
-            serialized_states = [
-                state.as_compressed_state_json
-                for state in states
-                if (not entity_ids or state.entity_id in entity_ids)
-                and (not entity_filter or entity_filter(state.entity_id))
-            ]
+            serialized_states = b",".join(
+                [
+                    state.as_compressed_state_json
+                    for state in states
+                    if (not entity_ids or state.entity_id in entity_ids)
+                    and (not entity_filter or entity_filter(state.entity_id))
+                ]
+            )
+        elif _async_can_read_all_states(connection):
+            # Fast path when not filtering and all states can be read
+            serialized_states = _async_get_states_snapshot(
+                hass
+            ).async_compressed_states_json()
         else:
-            # Fast path when not filtering
-            serialized_states = [state.as_compressed_state_json for state in states]
+            serialized_states = b",".join(
+                [state.as_compressed_state_json for state in states]
+            )
     except (ValueError, TypeError):
         pass
     else:
@@ -450,10 +723,10 @@ def handle_subscribe_entities(
         )
         return
 
-    serialized_states = []
+    serializable_states: list[bytes] = []
     for state in states:
         try:
-            serialized_states.append(state.as_compressed_state_json)
+            serializable_states.append(state.as_compressed_state_json)
         except (ValueError, TypeError):
             connection.logger.error(
                 "Unable to serialize to JSON. Bad data found at %s",
@@ -463,14 +736,14 @@ def handle_subscribe_entities(
             )
 
     _send_handle_entities_init_response(
-        connection, message_id_as_bytes, serialized_states
+        connection, message_id_as_bytes, b",".join(serializable_states)
     )
 
 
 def _send_handle_entities_init_response(
     connection: ActiveConnection,
     message_id_as_bytes: bytes,
-    serialized_states: list[bytes],
+    serialized_states: bytes,
 ) -> None:
     """Send handle entities init response."""
     connection.send_message(
@@ -479,7 +752,7 @@ def _send_handle_entities_init_response(
                 b'{"id":',
                 message_id_as_bytes,
                 b',"type":"event","event":{"a":{',
-                b",".join(serialized_states),
+                serialized_states,
                 b"}}}",
             )
         )
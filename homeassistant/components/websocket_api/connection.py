@@ -36,6 +36,11 @@ type MessageHandler = Callable[[HomeAssistant, ActiveConnection, dict[str, Any]]
 type BinaryHandler = Callable[[HomeAssistant, ActiveConnection, bytes], None]
 
 
+def _no_pending_messages() -> int:
+    """Return zero pending messages."""
+    return 0
+
+
 class ActiveConnection:
     """Handle an active websocket client connection."""
 
@@ -46,6 +51,7 @@ class ActiveConnection:
         "hass",
         "last_id",
         "logger",
+        "pending_message_count",
         "refresh_token_id",
         "send_message",
         "subscriptions",
@@ -75,6 +81,8 @@ class ActiveConnection:
             self.hass.data[const.DOMAIN]
         )
         self.binary_handlers: list[BinaryHandler | None] = []
+        # Replaced by the websocket handler with the length of its send queue
+        self.pending_message_count: Callable[[], int] = _no_pending_messages
         current_connection.set(self)
 
     def __repr__(self) -> str:
@@ -34,6 +34,13 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Number of pending messages at which subscribe_entities stops sending
+# one message per state change and merges the changes per entity until
+# the client has caught up.
+PENDING_MSG_COALESCE_DIFFS: Final = 256
+# Seconds between checks if a client that fell behind has caught up.
+COALESCE_DIFFS_FLUSH_INTERVAL: Final = 0.5
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
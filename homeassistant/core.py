@@ -455,6 +455,11 @@ class HomeAssistant:
             max_workers=1, thread_name_prefix="ImportExecutor"
         )
         self.loop_thread_id = getattr(self.loop, "_thread_id")
+        # Runs callback jobs instead of calling them directly when set,
+        # see async_set_job_profiler
+        self._job_profiler: (
+            Callable[[HassJob[..., Any], tuple[Any, ...]], None] | None
+        ) = None
 
     def verify_event_loop_thread(self, what: str) -> None:
         """Report and raise if we are not running in the event loop thread."""
@@ -763,7 +768,10 @@ class HomeAssistant:
         elif hassjob.job_type is HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob = cast(HassJob[..., _R], hassjob)
-            self.loop.call_soon(hassjob.target, *args)
+            if self._job_profiler is None:
+                self.loop.call_soon(hassjob.target, *args)
+            else:
+                self.loop.call_soon(self._job_profiler, hassjob, args)
             return None
         else:
             if TYPE_CHECKING:
@@ -937,11 +945,30 @@ class HomeAssistant:
         if hassjob.job_type is HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob = cast(HassJob[..., _R], hassjob)
-            hassjob.target(*args)
+            if self._job_profiler is None:
+                hassjob.target(*args)
+            else:
+                self._job_profiler(hassjob, args)
             return None
 
         return self._async_add_hass_job(hassjob, *args, background=background)
 
+    @callback
+    def async_set_job_profiler(
+        self,
+        job_profiler: Callable[[HassJob[..., Any], tuple[Any, ...]], None] | None,
+    ) -> None:
+        """Set or clear the job profiler.
+
+        The job profiler is called with the job and its arguments instead
+        of the callback jobs run by async_run_hass_job and scheduled by
+        _async_add_hass_job, and must run the job itself. It allows to
+        measure how long callbacks block the event loop.
+
+        This method must be run in the event loop.
+        """
+        self._job_profiler = job_profiler
+
     @overload
     @callback
     def async_run_job[_R, *_Ts](
@@ -1459,7 +1486,14 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_dispatch_cache",
+        "_entity_listeners",
+        "_hass",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1468,6 +1502,19 @@ class EventBus:
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # The listeners to run for an event type, including the match all
+        # listeners. Rebuilt on the next fire after listeners were added
+        # or removed.
+        self._dispatch_cache: dict[
+            EventType[Any] | str, tuple[_FilterableJobType[Any], ...]
+        ] = {}
+        # event_type -> entity_id -> listeners, see async_listen_entity
+        self._entity_listeners: dict[
+            EventType[Any] | str,
+            dict[
+                str, tuple[HassJob[[Event[Any]], Coroutine[Any, Any, None] | None], ...]
+            ],
+        ] = {}
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1483,7 +1530,12 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, entity_listeners in self._entity_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + sum(
+                len(jobs) for jobs in entity_listeners.values()
+            )
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1548,14 +1600,11 @@ class EventBus:
                 "Bus:Handling %s", _event_repr(event_type, origin, event_data)
             )
 
-        listeners = self._listeners.get(event_type, EMPTY_LIST)
-        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
-            match_all_listeners = self._match_all_listeners
-        else:
-            match_all_listeners = EMPTY_LIST
+        if (listeners := self._dispatch_cache.get(event_type)) is None:
+            listeners = self._async_build_dispatch_cache(event_type)
 
         event: Event[_DataT] | None = None
-        for job, event_filter in listeners + match_all_listeners:
+        for job, event_filter in listeners:
             if event_filter is not None:
                 try:
                     if event_data is None or not event_filter(event_data):
@@ -1578,6 +1627,51 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+        if (
+            (entity_listeners := self._entity_listeners.get(event_type)) is None
+            or event_data is None
+            # Events like call_service can carry a list of entity ids
+            or not isinstance(entity_id := event_data.get("entity_id"), str)
+            or (entity_jobs := entity_listeners.get(entity_id)) is None
+        ):
+            return
+
+        if not event:
+            event = Event(
+                event_type,
+                event_data,
+                origin,
+                time_fired,
+                context,
+            )
+
+        for entity_job in entity_jobs:
+            try:
+                self._hass.async_run_hass_job(entity_job, event)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", entity_job)
+
+    @callback
+    def _async_build_dispatch_cache(
+        self, event_type: EventType[_DataT] | str
+    ) -> tuple[_FilterableJobType[Any], ...]:
+        """Build and cache the listeners to run for an event type."""
+        listeners = tuple(self._listeners.get(event_type, EMPTY_LIST))
+        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            listeners += tuple(self._match_all_listeners)
+        self._dispatch_cache[event_type] = listeners
+        return listeners
+
+    @callback
+    def _async_invalidate_dispatch_cache(
+        self, event_type: EventType[_DataT] | str
+    ) -> None:
+        """Invalidate the cached listeners after listeners changed."""
+        if event_type == MATCH_ALL:
+            self._dispatch_cache.clear()
+        else:
+            self._dispatch_cache.pop(event_type, None)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1649,6 +1743,7 @@ class EventBus:
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type."""
         self._listeners[event_type].append(filterable_job)
+        self._async_invalidate_dispatch_cache(event_type)
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
@@ -1718,6 +1813,58 @@ class EventBus:
         one_time_listener.remove = remove
         return remove
 
+    @callback
+    def async_listen_entity(
+        self,
+        event_type: EventType[_DataT] | str,
+        entity_id: str,
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type about a single entity.
+
+        The listener only runs for events where the entity_id in the event
+        data matches. Unlike a listener with an event_filter, it costs
+        nothing when events for other entities are fired.
+
+        Returns function to unsubscribe the listener.
+
+        This method must be run in the event loop.
+        """
+        job: HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None] = HassJob(
+            listener, f"listen {event_type} {entity_id}"
+        )
+        entity_listeners = self._entity_listeners.setdefault(event_type, {})
+        entity_listeners[entity_id] = (*entity_listeners.get(entity_id, ()), job)
+        return functools.partial(
+            self._async_remove_entity_listener, event_type, entity_id, job
+        )
+
+    @callback
+    def _async_remove_entity_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        entity_id: str,
+        job: HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> None:
+        """Remove a listener for events about a single entity.
+
+        This method must be run in the event loop.
+        """
+        try:
+            entity_listeners = self._entity_listeners[event_type]
+            jobs = list(entity_listeners[entity_id])
+            jobs.remove(job)
+        except (KeyError, ValueError):
+            _LOGGER.exception("Unable to remove unknown job listener %s", job)
+            return
+        if jobs:
+            # Replace the tuple so a fire in progress is not affected
+            entity_listeners[entity_id] = tuple(jobs)
+            return
+        del entity_listeners[entity_id]
+        if not entity_listeners:
+            del self._entity_listeners[event_type]
+
     @callback
     def _async_remove_listener(
         self,
@@ -1730,6 +1877,7 @@ class EventBus:
         """
         try:
             self._listeners[event_type].remove(filterable_job)
+            self._async_invalidate_dispatch_cache(event_type)
 
             # delete event_type list if empty
             if not self._listeners[event_type] and event_type != MATCH_ALL:
@@ -2021,17 +2169,35 @@ class State:
         )
 
 
+def _attribute_index_key(state: State, attribute: str) -> Any:
+    """Return the key of a state in an attribute index.
+
+    Returns _SENTINEL if the state does not have the attribute or
+    the value can not be used as a key.
+    """
+    value = state.attributes.get(attribute, _SENTINEL)
+    try:
+        hash(value)
+    except TypeError:
+        return _SENTINEL
+    return value
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
     Maintains an additional index:
     - domain -> dict[str, State]
+
+    And opt-in indexes by attribute value:
+    - attribute -> value -> dict[str, State]
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self._attribute_indexes: dict[str, dict[Any, dict[str, State]]] = {}
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -2039,15 +2205,75 @@ class States(UserDict[str, State]):
 
     def __setitem__(self, key: str, entry: State) -> None:
         """Add an item."""
+        if self._attribute_indexes:
+            self._update_attribute_indexes(key, self.data.get(key), entry)
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
+        if self._attribute_indexes:
+            self._update_attribute_indexes(key, entry, None)
         del self._domain_index[entry.domain][entry.entity_id]
         super().__delitem__(key)
 
+    def _update_attribute_indexes(
+        self, key: str, old_entry: State | None, new_entry: State | None
+    ) -> None:
+        """Move an item between the buckets of the attribute indexes."""
+        for attribute, index in self._attribute_indexes.items():
+            old_value = (
+                _SENTINEL
+                if old_entry is None
+                else _attribute_index_key(old_entry, attribute)
+            )
+            new_value = (
+                _SENTINEL
+                if new_entry is None
+                else _attribute_index_key(new_entry, attribute)
+            )
+            if old_value is not _SENTINEL and (
+                new_value is _SENTINEL or old_value != new_value
+            ):
+                bucket = index[old_value]
+                del bucket[key]
+                # Avoid keeping a bucket for every value ever seen
+                if not bucket:
+                    del index[old_value]
+            if new_value is not _SENTINEL:
+                if (bucket := index.get(new_value)) is None:
+                    bucket = index[new_value] = {}
+                bucket[key] = new_entry  # type: ignore[assignment]
+
+    def add_attribute_index(self, attribute: str) -> None:
+        """Start maintaining an index of the states by an attribute."""
+        if attribute in self._attribute_indexes:
+            return
+        index: dict[Any, dict[str, State]] = {}
+        for key, entry in self.data.items():
+            if (value := _attribute_index_key(entry, attribute)) is not _SENTINEL:
+                index.setdefault(value, {})[key] = entry
+        self._attribute_indexes[attribute] = index
+
+    def attribute_states(
+        self, attribute: str, value: Any
+    ) -> ValuesView[State] | tuple[()] | None:
+        """Get all states with an attribute set to a value.
+
+        Returns None if the attribute is not indexed or the value can
+        not be looked up in the index.
+        """
+        if (index := self._attribute_indexes.get(attribute)) is None:
+            return None
+        try:
+            bucket = index.get(value)
+        except TypeError:
+            return None
+        if bucket is None:
+            return ()
+        return bucket.values()
+
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
         """Get all entity_ids for a domain."""
         # Avoid polluting _domain_index with non-existing domains
@@ -2147,6 +2373,45 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_add_attribute_index(self, attribute: str) -> None:
+        """Maintain an index of the states by the value of an attribute.
+
+        Makes async_all_with_attribute a lookup instead of a scan of all
+        states for the attribute, at the cost of keeping the index up to
+        date on every state change. Indexes can not be removed.
+
+        This method must be run in the event loop.
+        """
+        self._states.add_attribute_index(attribute)
+
+    @callback
+    def async_all_with_attribute(
+        self,
+        attribute: str,
+        value: Any,
+        domain_filter: str | Iterable[str] | None = None,
+    ) -> list[State]:
+        """Create a list of all states with an attribute set to a value.
+
+        Uses the index added by async_add_attribute_index if there is one.
+
+        This method must be run in the event loop.
+        """
+        states: Iterable[State] | None = self._states.attribute_states(attribute, value)
+        if states is None:
+            states = [
+                state
+                for state in self._states_data.values()
+                if state.attributes.get(attribute, _SENTINEL) == value
+            ]
+        if domain_filter is None:
+            return list(states)
+        if isinstance(domain_filter, str):
+            domain_filter = (domain_filter.lower(),)
+        domains = set(domain_filter)
+        return [state for state in states if state.domain in domains]
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
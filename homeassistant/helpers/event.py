@@ -9,7 +9,10 @@ import copy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial, wraps
+from heapq import heapify, heappop, heappush
+from itertools import count
 import logging
+import math
 from random import randint
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
@@ -75,6 +78,9 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TEMPLATE_RENDER_BATCH: HassKey[_TemplateRenderBatch] = HassKey("template_render_batch")
+_TIMER_WHEEL: HassKey[_TimerWheel] = HassKey("timer_wheel")
+_TIME_CHANGE_SCHEDULER: HassKey[_TimeChangeScheduler] = HassKey("time_change_scheduler")
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -971,6 +977,89 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class _TemplateRenderBatch:
+    """Render the templates of trackers changed in the same loop iteration.
+
+    State changes for a tracker are collected until the next iteration of
+    the event loop, so a tracker renders each of its templates at most once
+    per iteration however many of the states it tracks changed. Templates
+    without variables render once per iteration for all trackers.
+
+    The render runs in a task that is not started eagerly, so it runs after
+    the state changes dispatched in the same iteration and is waited for by
+    async_block_till_done.
+    """
+
+    __slots__ = ("_hass", "_pending", "_render_infos")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the batch."""
+        self._hass = hass
+        self._pending: dict[
+            TrackTemplateResultInfo, list[Event[EventStateChangedData]]
+        ] = {}
+        self._render_infos: (
+            dict[tuple[Template, Callable[[int, str], None] | None], RenderInfo] | None
+        ) = None
+
+    @callback
+    def async_add(
+        self, tracker: TrackTemplateResultInfo, event: Event[EventStateChangedData]
+    ) -> None:
+        """Add a state change to render a tracker for."""
+        if not self._pending:
+            self._hass.async_create_task_internal(
+                self._async_render(), "template render batch", eager_start=False
+            )
+        if (events := self._pending.get(tracker)) is None:
+            self._pending[tracker] = [event]
+        else:
+            events.append(event)
+
+    @callback
+    def async_discard(self, tracker: TrackTemplateResultInfo) -> None:
+        """Discard the pending state changes of a removed tracker."""
+        self._pending.pop(tracker, None)
+
+    @callback
+    def async_render_to_info(
+        self, template: Template, variables: TemplateVarsType
+    ) -> RenderInfo:
+        """Render a template, reusing the render of an identical template.
+
+        Templates are only identical if they also log to the same function,
+        since rendering logs the warnings of the template.
+        """
+        if variables or self._render_infos is None:
+            return template.async_render_to_info(variables)
+        key = (template, template._log_fn)  # noqa: SLF001
+        if (info := self._render_infos.get(key)) is None:
+            info = self._render_infos[key] = template.async_render_to_info()
+        return info
+
+    async def _async_render(self) -> None:
+        """Render the pending trackers."""
+        pending = self._pending
+        self._pending = {}
+        self._render_infos = {}
+        try:
+            for tracker, events in pending.items():
+                try:
+                    tracker.async_refresh_events(events)
+                except Exception:
+                    _LOGGER.exception("Error while rendering templates of %s", tracker)
+        finally:
+            self._render_infos = None
+
+
+@callback
+def _async_get_template_render_batch(hass: HomeAssistant) -> _TemplateRenderBatch:
+    """Return the template render batch."""
+    if (batch := hass.data.get(_TEMPLATE_RENDER_BATCH)) is None:
+        batch = hass.data[_TEMPLATE_RENDER_BATCH] = _TemplateRenderBatch(hass)
+    return batch
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -980,10 +1069,12 @@ class TrackTemplateResultInfo:
         track_templates: Sequence[TrackTemplate],
         action: TrackTemplateResultListener,
         has_super_template: bool = False,
+        batch_renders: bool = False,
     ) -> None:
         """Handle removal / refresh of tracker init."""
         self.hass = hass
         self._job = HassJob(action, f"track template result {track_templates}")
+        self._batch = _async_get_template_render_batch(hass) if batch_renders else None
 
         self._track_templates = track_templates
         self._has_super_template = has_super_template
@@ -1059,7 +1150,9 @@ class TrackTemplateResultInfo:
                     log_fn(logging.ERROR, str(info.exception))
 
         self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
+            self.hass,
+            _render_infos_to_track_states(self._info.values()),
+            self._refresh if self._batch is None else self._async_add_to_batch,
         )
         self._update_time_listeners()
         _LOGGER.debug(
@@ -1119,12 +1212,54 @@ class TrackTemplateResultInfo:
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
+        if self._batch is not None:
+            self._batch.async_discard(self)
 
     @callback
     def async_refresh(self) -> None:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def _async_add_to_batch(self, event: Event[EventStateChangedData]) -> None:
+        """Render the templates for a state change in the next loop iteration."""
+        assert self._batch is not None
+        self._batch.async_add(self, event)
+
+    @callback
+    def async_refresh_events(self, events: list[Event[EventStateChangedData]]) -> None:
+        """Refresh the templates for state changes collected by a batch."""
+        if len(events) == 1:
+            self._refresh(events[0])
+            return
+
+        # Render each template once, for the last state change it tracks
+        template_events: dict[Template, Event[EventStateChangedData]] = {}
+        event_order: dict[Template, int] = {}
+        for index, event in enumerate(events):
+            for template, info in self._info.items():
+                if _event_triggers_rerender(event, info):
+                    template_events[template] = event
+                    event_order[template] = index
+        if not template_events:
+            return
+        # Render in the order of the state changes, so the results are
+        # applied in the same order as when rendering for each of them.
+        # A template entity's state then sees an attribute, like its delay,
+        # that changed before it.
+        self._refresh(
+            events[-1],
+            track_templates=sorted(
+                (
+                    track_template_
+                    for track_template_ in self._track_templates
+                    if track_template_.template in event_order
+                ),
+                key=lambda track_template_: event_order[track_template_.template],
+            ),
+            template_events=template_events,
+        )
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
@@ -1169,9 +1304,11 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        if self._batch is None:
+            info = template.async_render_to_info(track_template_.variables)
+        else:
+            info = self._batch.async_render_to_info(template, track_template_.variables)
+        self._info[template] = info
 
         try:
             result: str | TemplateError = info.result()
@@ -1221,6 +1358,7 @@ class TrackTemplateResultInfo:
         event: Event[EventStateChangedData] | None,
         track_templates: Iterable[TrackTemplate] | None = None,
         replayed: bool | None = False,
+        template_events: Mapping[Template, Event[EventStateChangedData]] | None = None,
     ) -> None:
         """Refresh the template.
 
@@ -1233,6 +1371,10 @@ class TrackTemplateResultInfo:
 
         replayed is True if the event is being replayed because the
         rate limit was hit.
+
+        template_events optionally maps templates to the state_changed
+        event to consider for them instead of event, when refreshing for
+        several state changes at once.
         """
         updates: list[TrackTemplateResult] = []
         info_changed = False
@@ -1245,7 +1387,13 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(
+                super_template,
+                now,
+                template_events.get(super_template.template, event)
+                if template_events
+                else event,
+            )
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1268,6 +1416,7 @@ class TrackTemplateResultInfo:
                 # Super template changed from not True to True, force re-render
                 # of all templates in the group
                 event = None
+                template_events = None
                 track_templates = self._track_templates
 
         # Then update the remaining templates unless blocked by the super template
@@ -1276,7 +1425,13 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_,
+                    now,
+                    template_events.get(track_template_.template, event)
+                    if template_events
+                    else event,
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
@@ -1340,6 +1495,7 @@ def async_track_template_result(
     strict: bool = False,
     log_fn: Callable[[int, str], None] | None = None,
     has_super_template: bool = False,
+    batch_renders: bool = False,
 ) -> TrackTemplateResultInfo:
     """Add a listener that fires when the result of a template changes.
 
@@ -1371,13 +1527,19 @@ def async_track_template_result(
     has_super_template
         When set to True, the first template will block rendering of other
         templates if it doesn't render as True.
+    batch_renders
+        When set to True, re-renders for state changes are deferred to the
+        next iteration of the event loop and batched with those of other
+        trackers, so the templates render at most once per iteration.
 
     Returns
     -------
     Info object used to unregister the listener, and refresh the template.
 
     """
-    tracker = TrackTemplateResultInfo(hass, track_templates, action, has_super_template)
+    tracker = TrackTemplateResultInfo(
+        hass, track_templates, action, has_super_template, batch_renders
+    )
     tracker.async_setup(strict=strict, log_fn=log_fn)
     return tracker
 
@@ -1565,6 +1727,152 @@ def _run_async_call_action(
     hass.async_run_hass_job(job, time_tracker_utcnow())
 
 
+def _job_domain(job: HassJob[..., Any]) -> str:
+    """Return the integration domain a job target belongs to."""
+    target = job.target
+    while isinstance(target, partial):
+        target = target.func
+    parts = (getattr(target, "__module__", None) or "").split(".")
+    if len(parts) > 2 and parts[:2] == ["homeassistant", "components"]:
+        return parts[2]
+    if len(parts) > 1 and parts[0] == "custom_components":
+        return parts[1]
+    return "homeassistant"
+
+
+class _WheelTimer:
+    """A timer sharing the wakeup of a timer wheel bucket."""
+
+    __slots__ = ("args", "cancelled", "job", "target")
+
+    def __init__(
+        self, job: HassJob[..., Any], target: Callable[..., None], args: tuple[Any, ...]
+    ) -> None:
+        """Initialize the timer."""
+        self.job = job
+        self.target = target
+        self.args = args
+        self.cancelled = False
+
+
+class _TimerWheel:
+    """Share event loop wakeups between timers that tolerate a delay.
+
+    Timers are rounded up to the next multiple of their precision in loop
+    time, and all timers due at the same bucket deadline fire from a single
+    loop.call_at handle instead of one handle each. Timers of jobs that are
+    cancelled on shutdown get their own buckets, whose handles are cancelled
+    on shutdown like the handles of those jobs.
+    """
+
+    __slots__ = ("_buckets", "_handles", "_hass", "_shutdown_job")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the timer wheel."""
+        self._hass = hass
+        # Keyed by the bucket deadline and whether it is cancelled on shutdown
+        self._buckets: dict[tuple[float, bool], dict[_WheelTimer, None]] = {}
+        self._handles: dict[tuple[float, bool], asyncio.TimerHandle] = {}
+        # Shutdown cancels timer handles whose first argument is a job
+        # marked to be cancelled on shutdown
+        self._shutdown_job = HassJob(self._fire, "timer wheel", cancel_on_shutdown=True)
+
+    @callback
+    def async_call_at(
+        self,
+        loop_time: float,
+        precision: float,
+        job: HassJob[..., Any],
+        target: Callable[..., None],
+        *args: Any,
+    ) -> CALLBACK_TYPE:
+        """Call target with args at or up to precision seconds after loop_time."""
+        key = (
+            math.ceil(loop_time / precision) * precision,
+            bool(job.cancel_on_shutdown),
+        )
+        timer = _WheelTimer(job, target, args)
+        if (bucket := self._buckets.get(key)) is None or self._handles[key].cancelled():
+            # A bucket whose handle was cancelled on shutdown never fires
+            bucket = self._buckets[key] = {}
+            if key[1]:
+                self._handles[key] = self._hass.loop.call_at(
+                    key[0], self._fire_cancellable, self._shutdown_job, key
+                )
+            else:
+                self._handles[key] = self._hass.loop.call_at(key[0], self._fire, key)
+        bucket[timer] = None
+        return partial(self._cancel, key, bucket, timer)
+
+    @callback
+    def _cancel(
+        self,
+        key: tuple[float, bool],
+        bucket: dict[_WheelTimer, None],
+        timer: _WheelTimer,
+    ) -> None:
+        """Cancel a timer, cancelling the bucket wakeup if it was the last one."""
+        timer.cancelled = True
+        if self._buckets.get(key) is not bucket:
+            return
+        bucket.pop(timer, None)
+        if not bucket:
+            del self._buckets[key]
+            self._handles.pop(key).cancel()
+
+    @callback
+    def _fire_cancellable(
+        self, _job: HassJob[..., Any], key: tuple[float, bool]
+    ) -> None:
+        """Run the timers of a bucket that is cancelled on shutdown."""
+        self._fire(key)
+
+    @callback
+    def _fire(self, key: tuple[float, bool]) -> None:
+        """Run the timers of a bucket."""
+        del self._handles[key]
+        for timer in self._buckets.pop(key):
+            # A timer earlier in the bucket may have cancelled this one
+            if timer.cancelled:
+                continue
+            try:
+                timer.target(*timer.args)
+            except Exception:
+                _LOGGER.exception("Error running timer %s", timer.job)
+
+    @callback
+    def async_active_timers(self) -> dict[str, int]:
+        """Return the number of active timers per integration."""
+        active: defaultdict[str, int] = defaultdict(int)
+        for key, bucket in self._buckets.items():
+            if self._handles[key].cancelled():
+                continue
+            for timer in bucket:
+                active[_job_domain(timer.job)] += 1
+        return dict(active)
+
+    @property
+    def wakeups(self) -> int:
+        """Return the number of scheduled bucket wakeups."""
+        return sum(not handle.cancelled() for handle in self._handles.values())
+
+
+@callback
+def _async_get_timer_wheel(hass: HomeAssistant) -> _TimerWheel:
+    """Return the timer wheel."""
+    if (wheel := hass.data.get(_TIMER_WHEEL)) is None:
+        wheel = hass.data[_TIMER_WHEEL] = _TimerWheel(hass)
+    return wheel
+
+
+@callback
+def async_timer_wheel_stats(hass: HomeAssistant) -> dict[str, Any]:
+    """Return statistics about the timers scheduled with a precision."""
+    if (wheel := hass.data.get(_TIMER_WHEEL)) is None:
+        return {"wakeups": 0, "active_timers": {}}
+    return {"wakeups": wheel.wakeups, "active_timers": wheel.async_active_timers()}
+
+
 @callback
 @bind_hass
 def async_call_at(
@@ -1572,16 +1880,25 @@ def async_call_at(
     action: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     | Callable[[datetime], Coroutine[Any, Any, None] | None],
     loop_time: float,
+    *,
+    precision: float | None = None,
 ) -> CALLBACK_TYPE:
     """Add a listener that fires at or after <loop_time>.
 
     The listener is passed the time it fires in UTC time.
+
+    Listeners that can fire up to precision seconds late share their
+    event loop wakeup with other listeners due in the same window.
     """
     job = (
         action
         if isinstance(action, HassJob)
         else HassJob(action, f"call_at {loop_time}")
     )
+    if precision:
+        return _async_get_timer_wheel(hass).async_call_at(
+            loop_time, precision, job, _run_async_call_action, hass, job
+        )
     return hass.loop.call_at(loop_time, _run_async_call_action, hass, job).cancel
 
 
@@ -1592,10 +1909,15 @@ def async_call_later(
     delay: float | timedelta,
     action: HassJob[[datetime], Coroutine[Any, Any, None] | None]
     | Callable[[datetime], Coroutine[Any, Any, None] | None],
+    *,
+    precision: float | None = None,
 ) -> CALLBACK_TYPE:
     """Add a listener that fires at or after <delay>.
 
     The listener is passed the time it fires in UTC time.
+
+    Listeners that can fire up to precision seconds late share their
+    event loop wakeup with other listeners due in the same window.
     """
     if isinstance(delay, timedelta):
         delay = delay.total_seconds()
@@ -1605,6 +1927,10 @@ def async_call_later(
         else HassJob(action, f"call_later {delay}")
     )
     loop = hass.loop
+    if precision:
+        return _async_get_timer_wheel(hass).async_call_at(
+            loop.time() + delay, precision, job, _run_async_call_action, hass, job
+        )
     return loop.call_at(loop.time() + delay, _run_async_call_action, hass, job).cancel
 
 
@@ -1620,9 +1946,11 @@ class _TrackTimeInterval:
     job_name: str
     action: Callable[[datetime], Coroutine[Any, Any, None] | None]
     cancel_on_shutdown: bool | None
+    precision: float | None = None
     _track_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
     _run_job: HassJob[[datetime], Coroutine[Any, Any, None] | None] | None = None
     _timer_handle: asyncio.TimerHandle | None = None
+    _cancel_wheel_timer: CALLBACK_TYPE | None = None
 
     def async_attach(self) -> None:
         """Initialize track job."""
@@ -1645,6 +1973,17 @@ class _TrackTimeInterval:
             assert self._track_job is not None
         hass = self.hass
         loop = hass.loop
+        if self.precision:
+            if TYPE_CHECKING:
+                assert self._run_job is not None
+            self._cancel_wheel_timer = _async_get_timer_wheel(hass).async_call_at(
+                loop.time() + self.seconds,
+                self.precision,
+                self._run_job,
+                self._interval_listener,
+                self._track_job,
+            )
+            return
         self._timer_handle = loop.call_at(
             loop.time() + self.seconds, self._interval_listener, self._track_job
         )
@@ -1660,6 +1999,9 @@ class _TrackTimeInterval:
     @callback
     def async_cancel(self) -> None:
         """Cancel the call_at."""
+        if self._cancel_wheel_timer is not None:
+            self._cancel_wheel_timer()
+            return
         if TYPE_CHECKING:
             assert self._timer_handle is not None
         self._timer_handle.cancel()
@@ -1674,16 +2016,22 @@ def async_track_time_interval(
     *,
     name: str | None = None,
     cancel_on_shutdown: bool | None = None,
+    precision: float | None = None,
 ) -> CALLBACK_TYPE:
     """Add a listener that fires repetitively at every timedelta interval.
 
     The listener is passed the time it fires in UTC time.
+
+    Listeners that can fire up to precision seconds late share their
+    event loop wakeup with other listeners due in the same window.
     """
     seconds = interval.total_seconds()
     job_name = f"track time interval {seconds} {action}"
     if name:
         job_name = f"{name}: {job_name}"
-    track = _TrackTimeInterval(hass, seconds, job_name, action, cancel_on_shutdown)
+    track = _TrackTimeInterval(
+        hass, seconds, job_name, action, cancel_on_shutdown, precision
+    )
     track.async_attach()
     return track.async_cancel
 
@@ -1790,57 +2138,149 @@ time_tracker_timestamp = time.time
 @dataclass(slots=True)
 class _TrackUTCTimeChange:
     hass: HomeAssistant
+    scheduler: _TimeChangeScheduler
     time_match_expression: tuple[list[int], list[int], list[int]]
-    microsecond: int
     local: bool
     job: HassJob[[datetime], Coroutine[Any, Any, None] | None]
-    listener_job_name: str
-    _pattern_time_change_listener_job: HassJob[[datetime], None] | None = None
-    _cancel_callback: CALLBACK_TYPE | None = None
+    cancelled: bool = False
 
     def async_attach(self) -> None:
         """Initialize track job."""
-        self._pattern_time_change_listener_job = HassJob(
-            self._pattern_time_change_listener,
-            self.listener_job_name,
-            job_type=HassJobType.Callback,
-        )
-        self._cancel_callback = async_track_point_in_utc_time(
-            self.hass,
-            self._pattern_time_change_listener_job,
-            self._calculate_next(dt_util.utcnow()),
-        )
+        self.scheduler.async_add(self)
 
-    def _calculate_next(self, utc_now: datetime) -> datetime:
-        """Calculate and set the next time the trigger should fire."""
+    def calculate_next(self, utc_now: datetime) -> datetime:
+        """Calculate the next time the trigger should fire."""
         localized_now = dt_util.as_local(utc_now) if self.local else utc_now
         return dt_util.find_next_time_expression_time(
             localized_now, *self.time_match_expression
-        ).replace(microsecond=self.microsecond)
+        ).replace(microsecond=self.scheduler.microsecond)
 
     @callback
-    def _pattern_time_change_listener(self, _: datetime) -> None:
-        """Listen for matching time_changed events."""
-        hass = self.hass
-        # Fetch time again because we want the actual time, not the
-        # time when the timer was scheduled
-        utc_now = time_tracker_utcnow()
+    def async_run(self, utc_now: datetime) -> None:
+        """Run the action for a matching time."""
         localized_now = dt_util.as_local(utc_now) if self.local else utc_now
-        if TYPE_CHECKING:
-            assert self._pattern_time_change_listener_job is not None
-        self._cancel_callback = async_track_point_in_utc_time(
-            hass,
-            self._pattern_time_change_listener_job,
-            self._calculate_next(utc_now + timedelta(seconds=1)),
-        )
-        hass.async_run_hass_job(self.job, localized_now, background=True)
+        self.hass.async_run_hass_job(self.job, localized_now, background=True)
 
     @callback
     def async_cancel(self) -> None:
         """Cancel the call_at."""
-        if TYPE_CHECKING:
-            assert self._cancel_callback is not None
-        self._cancel_callback()
+        self.scheduler.async_remove(self)
+
+
+class _TimeChangeScheduler:
+    """Dispatch all time pattern listeners from a single timer.
+
+    Listeners are kept in a heap ordered by the next time their pattern
+    matches and share the same fraction of a second, so all listeners
+    matching the same second run from one wakeup instead of each
+    scheduling its own timer.
+    """
+
+    __slots__ = (
+        "_active",
+        "_cancel_timer",
+        "_hass",
+        "_heap",
+        "_job",
+        "_next_fire",
+        "_sequence",
+        "microsecond",
+    )
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._heap: list[tuple[float, int, _TrackUTCTimeChange]] = []
+        self._sequence = count()
+        self._active = 0
+        self._cancel_timer: CALLBACK_TYPE | None = None
+        self._next_fire: float | None = None
+        self._job = HassJob(
+            self._async_tick, "time change scheduler", job_type=HassJobType.Callback
+        )
+        # Avoid aligning all time trackers to the same fraction of a second
+        # since it can create a thundering herd problem
+        # https://github.com/home-assistant/core/issues/82231
+        self.microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
+
+    @callback
+    def async_add(self, tracker: _TrackUTCTimeChange) -> None:
+        """Add a listener."""
+        self._active += 1
+        self._push(tracker, tracker.calculate_next(dt_util.utcnow()))
+
+    @callback
+    def async_remove(self, tracker: _TrackUTCTimeChange) -> None:
+        """Remove a listener, its heap entry is dropped lazily."""
+        if tracker.cancelled:
+            return
+        tracker.cancelled = True
+        self._active -= 1
+        if not self._active:
+            self._heap.clear()
+            self._async_schedule_timer()
+        elif len(self._heap) > 2 * self._active:
+            self._heap = [entry for entry in self._heap if not entry[2].cancelled]
+            heapify(self._heap)
+
+    def _push(self, tracker: _TrackUTCTimeChange, fire_time: datetime) -> None:
+        """Queue a listener to run at fire_time."""
+        timestamp = fire_time.timestamp()
+        heappush(self._heap, (timestamp, next(self._sequence), tracker))
+        if self._next_fire is None or timestamp < self._next_fire:
+            self._async_schedule_timer()
+
+    @callback
+    def _async_schedule_timer(self) -> None:
+        """Schedule the timer for the listener that runs first."""
+        next_fire = self._heap[0][0] if self._heap else None
+        if next_fire == self._next_fire:
+            return
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        self._next_fire = next_fire
+        if next_fire is not None:
+            self._cancel_timer = async_track_point_in_utc_time(
+                self._hass, self._job, dt_util.utc_from_timestamp(next_fire)
+            )
+
+    @callback
+    def _async_tick(self, _: datetime) -> None:
+        """Run the listeners matching the current time."""
+        self._cancel_timer = None
+        self._next_fire = None
+        # Fetch time again because we want the actual time, not the
+        # time when the timer was scheduled
+        utc_now = time_tracker_utcnow()
+        timestamp = utc_now.timestamp()
+        heap = self._heap
+        due: list[_TrackUTCTimeChange] = []
+        while heap and heap[0][0] <= timestamp:
+            due.append(heappop(heap)[2])
+        next_second = utc_now + timedelta(seconds=1)
+        for tracker in due:
+            # An earlier listener may have cancelled this one
+            if tracker.cancelled:
+                continue
+            heappush(
+                heap,
+                (
+                    tracker.calculate_next(next_second).timestamp(),
+                    next(self._sequence),
+                    tracker,
+                ),
+            )
+            tracker.async_run(utc_now)
+        self._async_schedule_timer()
+
+
+@callback
+def _async_get_time_change_scheduler(hass: HomeAssistant) -> _TimeChangeScheduler:
+    """Return the time change scheduler."""
+    if (scheduler := hass.data.get(_TIME_CHANGE_SCHEDULER)) is None:
+        scheduler = hass.data[_TIME_CHANGE_SCHEDULER] = _TimeChangeScheduler(hass)
+    return scheduler
 
 
 @callback
@@ -1871,18 +2311,12 @@ def async_track_utc_time_change(
     matching_seconds = dt_util.parse_time_expression(second, 0, 59)
     matching_minutes = dt_util.parse_time_expression(minute, 0, 59)
     matching_hours = dt_util.parse_time_expression(hour, 0, 23)
-    # Avoid aligning all time trackers to the same fraction of a second
-    # since it can create a thundering herd problem
-    # https://github.com/home-assistant/core/issues/82231
-    microsecond = randint(RANDOM_MICROSECOND_MIN, RANDOM_MICROSECOND_MAX)
-    listener_job_name = f"time change listener {hour}:{minute}:{second} {action}"
     track = _TrackUTCTimeChange(
         hass,
+        _async_get_time_change_scheduler(hass),
         (matching_seconds, matching_minutes, matching_hours),
-        microsecond,
         local,
         job,
-        listener_job_name,
     )
     track.async_attach()
     return track.async_cancel
@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Collection
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 import importlib
+from importlib.metadata import PackageNotFoundError, distribution
 import logging
 import sys
 from types import ModuleType
 
+from packaging.requirements import InvalidRequirement, Requirement
+
 from homeassistant.core import HomeAssistant
 from homeassistant.util.hass_dict import HassKey
 
@@ -20,6 +25,10 @@ DATA_IMPORT_FUTURES: HassKey[dict[str, asyncio.Future[ModuleType]]] = HassKey(
 )
 DATA_IMPORT_FAILURES: HassKey[dict[str, bool]] = HassKey("import_failures")
 
+# Imports mostly wait on the disk and on loading extension modules, so a few
+# threads are enough to overlap them without contending for the GIL
+PREIMPORT_WORKERS = 4
+
 
 def _get_module(cache: dict[str, ModuleType], name: str) -> ModuleType:
     """Get a module."""
@@ -63,3 +72,80 @@ async def async_import_module(hass: HomeAssistant, name: str) -> ModuleType:
         del import_futures[name]
 
     return module
+
+
+def _requirement_modules(requirement: str) -> list[str]:
+    """Return the top level modules of an installed requirement."""
+    try:
+        dist = distribution(Requirement(requirement).name)
+    except (InvalidRequirement, PackageNotFoundError):
+        return []
+    if top_level := dist.read_text("top_level.txt"):
+        names = top_level.split()
+    else:
+        names = [
+            file.parts[0] if len(file.parts) == 2 else file.stem
+            for file in dist.files or ()
+            if (len(file.parts) == 2 and file.name == "__init__.py")
+            or (len(file.parts) == 1 and file.suffix == ".py")
+        ]
+    return [
+        name
+        for name in dict.fromkeys(names)
+        if name.isidentifier() and not name.startswith("_")
+    ]
+
+
+def _preimport_module(name: str) -> bool:
+    """Import a module, returning if it was imported."""
+    try:
+        importlib.import_module(name)
+    except Exception:  # noqa: BLE001
+        # The module is imported again when the integration needs it,
+        # which raises the error where it can be handled
+        _LOGGER.debug("Failed to preimport %s", name, exc_info=True)
+        return False
+    return True
+
+
+def _preimport_modules(names: Collection[str], max_workers: int) -> list[str]:
+    """Import modules concurrently and return the ones that were imported.
+
+    Each module is imported by one worker while the per module import
+    locks of importlib serialize the dependencies modules share. A
+    circular import across workers raises a deadlock error in one of
+    them, which is ignored as the module is imported again on use.
+    """
+    if not (pending := [name for name in names if name not in sys.modules]):
+        return []
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="PreImport"
+    ) as executor:
+        imported = list(executor.map(_preimport_module, pending))
+    return [name for name, success in zip(pending, imported, strict=True) if success]
+
+
+def _preimport_requirements(requirements: Collection[str]) -> list[str]:
+    """Import the top level modules of requirements concurrently."""
+    modules = dict.fromkeys(
+        name
+        for requirement in requirements
+        for name in _requirement_modules(requirement)
+    )
+    return _preimport_modules(modules, PREIMPORT_WORKERS)
+
+
+async def async_preimport_requirements(
+    hass: HomeAssistant, requirements: Collection[str]
+) -> None:
+    """Import installed requirements of integrations before they are set up.
+
+    The packages integrations depend on do not import Home Assistant, so
+    they are leaves of the import graph that can be imported concurrently
+    instead of one at a time in the import executor when each integration
+    is loaded.
+    """
+    if not requirements:
+        return
+    imported = await hass.async_add_executor_job(_preimport_requirements, requirements)
+    _LOGGER.debug("Preimported %s", imported)
@@ -0,0 +1,126 @@
+"""Helper to cache integration discovery between restarts."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from typing import TYPE_CHECKING, Any, TypedDict
+
+from homeassistant import loader, requirements
+from homeassistant.const import __version__
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from . import storage
+
+STORAGE_KEY = "core.startup_cache"
+STORAGE_VERSION = 1
+SAVE_DELAY = 60
+
+DATA_STARTUP_CACHE: HassKey[StartupCache] = HassKey(STORAGE_KEY)
+
+# Built-in manifests can change without a version bump on development
+# builds, so only the requirement results are cached there
+CACHE_MANIFESTS = "dev" not in __version__
+
+
+class CachedManifest(TypedDict):
+    """Manifest and top level files of a built-in integration."""
+
+    manifest: loader.Manifest
+    files: list[str]
+
+
+class StartupCacheData(TypedDict):
+    """Startup cache data."""
+
+    fingerprint: dict[str, Any]
+    manifests: dict[str, CachedManifest]
+    installed_requirements: list[str]
+
+
+def _fingerprint() -> dict[str, Any]:
+    """Return what the cached results depend on.
+
+    Installing or removing packages changes the modification time
+    of the directory on sys.path they are installed in.
+    """
+    return {
+        "version": __version__,
+        "python": sys.version,
+        "paths": {
+            path: os.stat(path).st_mtime for path in sys.path if os.path.isdir(path)
+        },
+    }
+
+
+class StartupCache:
+    """Cache the built-in manifests and installed requirements.
+
+    Warm restarts of the same installation resolve built-in integrations
+    without reading their manifest from disk and skip checking which
+    requirements are installed.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the startup cache."""
+        self.hass = hass
+        self.loaded = False
+        self._fingerprint: dict[str, Any] | None = None
+        self._store = storage.Store[StartupCacheData](
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+
+    async def async_load(self) -> None:
+        """Load the cache if it is still valid for this installation."""
+        hass = self.hass
+        self._fingerprint, data = await asyncio.gather(
+            hass.async_add_executor_job(_fingerprint), self._store.async_load()
+        )
+        if not data or data["fingerprint"] != self._fingerprint:
+            return
+        self.loaded = True
+        if CACHE_MANIFESTS:
+            loader.async_set_cached_manifests(
+                hass,
+                {
+                    domain: (cached["manifest"], set(cached["files"]))
+                    for domain, cached in data["manifests"].items()
+                },
+            )
+        requirements.async_get_installed_requirements(hass).update(
+            data["installed_requirements"]
+        )
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the discovery results of this start."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> StartupCacheData:
+        """Return data to store in a file."""
+        if TYPE_CHECKING:
+            assert self._fingerprint is not None
+        hass = self.hass
+        manifests: dict[str, CachedManifest] = {}
+        if CACHE_MANIFESTS:
+            manifests = {
+                domain: {"manifest": cached[0], "files": sorted(cached[1])}
+                for domain, cached in loader.async_get_cacheable_manifests(hass).items()
+            }
+        return {
+            "fingerprint": self._fingerprint,
+            "manifests": manifests,
+            "installed_requirements": sorted(
+                requirements.async_get_installed_requirements(hass)
+            ),
+        }
+
+
+async def async_load(hass: HomeAssistant) -> StartupCache:
+    """Load the startup cache."""
+    cache = hass.data[DATA_STARTUP_CACHE] = StartupCache(hass)
+    await cache.async_load()
+    return cache
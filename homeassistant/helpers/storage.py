@@ -7,8 +7,11 @@ from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
 import inspect
+from itertools import islice
+import json
 from json import JSONDecodeError, JSONEncoder
 import logging
+from operator import ne
 import os
 from pathlib import Path
 from typing import Any
@@ -30,7 +33,7 @@ from homeassistant.core import (
 )
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
-from homeassistant.util import dt as dt_util, json as json_util
+from homeassistant.util import dt as dt_util, json as json_util, ulid as ulid_util
 from homeassistant.util.file import WriteError
 from homeassistant.util.hass_dict import HassKey
 
@@ -48,6 +51,10 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+# A journaled store rewrites the whole file once the journal grows
+# beyond this ratio of the size of the data written in the last full write.
+JOURNAL_COMPACT_RATIO = 0.5
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -226,6 +233,52 @@ class _StoreManager:
             self._files = set(os.listdir(self._storage_path))
 
 
+def _journal_items(value: Any) -> dict[str, Any] | None:
+    """Return the loaded items of a list journaled per item, keyed by their id."""
+    if not isinstance(value, list) or not value:
+        return None
+    items: dict[str, Any] = {}
+    for item in value:
+        if (
+            not isinstance(item, dict)
+            or type(item_id := item.get("id")) is not str
+            or item_id in items
+        ):
+            return None
+        items[item_id] = item
+    return items
+
+
+def _journal_item_changes(
+    old_items: dict[str, bytes], items: dict[str, bytes]
+) -> list[tuple[str, bytes | None]] | None:
+    """Return the changed items by id, None for removed items.
+
+    Replaying updates items in place and appends new items, so the remaining
+    old items have to come first and in the same order. Returns None if they
+    do not.
+    """
+    if removed := old_items.keys() - items.keys():
+        kept = [item_id for item_id in old_items if item_id not in removed]
+    else:
+        kept = list(old_items)
+    if list(islice(items, len(kept))) != kept:
+        return None
+    changes: list[tuple[str, bytes | None]] = []
+    # Compare in C, registries can have thousands of items
+    changed = list(
+        map(ne, map(old_items.__getitem__, kept), islice(items.values(), len(kept)))
+    )
+    index = -1
+    for _ in range(changed.count(True)):
+        index = changed.index(True, index + 1)
+        changes.append((item_id := kept[index], items[item_id]))
+    changes.extend(islice(items.items(), len(kept), None))
+    if removed:
+        changes.extend((item_id, None) for item_id in old_items if item_id in removed)
+    return changes
+
+
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     """Class to help storing data."""
@@ -239,10 +292,19 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         *,
         atomic_writes: bool = False,
         encoder: type[JSONEncoder] | None = None,
+        journal: bool = False,
         minor_version: int = 1,
         read_only: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        A journaled store expects the data to be a dict. Instead of rewriting
+        the whole file on every save, only the top level keys which changed
+        since the last save are appended to a journal next to the file. Lists
+        of dicts with a unique "id", like the entries of a registry, are
+        journaled per item. The journal is replayed on load and folded into
+        the file once it grows beyond JOURNAL_COMPACT_RATIO of the data.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,12 +320,27 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = journal
+        # Serialized values of the top level keys as they are on disk, a
+        # dict of serialized items for lists journaled per item. None until
+        # the first full write of a journaled store.
+        self._journal_records: dict[str, bytes | dict[str, bytes]] | None = None
+        self._journal_id: str | None = None
+        # Id and serialized form of the json fragments of the last save
+        self._journal_fragments: dict[json_helper.json_fragment, tuple[str, bytes]] = {}
+        self._journal_size = 0
+        self._journal_snapshot_size = 0
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the journal path."""
+        return f"{self.path}.journal"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -321,15 +398,20 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
             data = deepcopy(data)
-        elif cache := self._manager.async_fetch(self.key):
+        elif not self._journal and (cache := self._manager.async_fetch(self.key)):
             exists, data = cache
             if not exists:
                 return None
         else:
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                if self._journal:
+                    data = await self.hass.async_add_executor_job(
+                        self._load_journaled_data
+                    )
+                else:
+                    data = await self.hass.async_add_executor_job(
+                        json_util.load_json, self.path
+                    )
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -420,6 +502,61 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         return stored
 
+    def _load_journaled_data(self) -> json_util.JsonValueType:
+        """Load the data and replay the journal on top of it."""
+        data = json_util.load_json(self.path)
+        if (
+            not isinstance(data, dict)
+            or not (journal_id := data.pop("journal", None))
+            or not isinstance(records := data.get("data"), dict)
+        ):
+            return data
+        # Lists changed per item, keyed by id in their original order
+        journaled_items: dict[str, dict[str, Any]] = {}
+        try:
+            with open(self.journal_path, "rb") as journal:
+                header = json_util.json_loads(journal.readline() or b"{}")
+                if not isinstance(header, dict) or header.get("journal") != journal_id:
+                    _LOGGER.debug("Ignoring stale journal for %s", self.key)
+                    return data
+                for line_number, line in enumerate(journal, 2):
+                    try:
+                        entry = json_util.json_loads(line)
+                    except ValueError:
+                        entry = None
+                    if not isinstance(entry, list) or not 1 <= len(entry) <= 3:
+                        # The last append was interrupted, everything before
+                        # it was written completely.
+                        _LOGGER.warning(
+                            "Ignoring incomplete journal entry for %s at line %s",
+                            self.key,
+                            line_number,
+                        )
+                        break
+                    key = entry[0]
+                    if len(entry) == 3:
+                        if (items := journaled_items.get(key)) is None:
+                            items = journaled_items[key] = (
+                                _journal_items(records.get(key)) or {}
+                            )
+                        if entry[2] is None:
+                            items.pop(entry[1], None)
+                        else:
+                            items[entry[1]] = entry[2]
+                        continue
+                    journaled_items.pop(key, None)
+                    if len(entry) == 2:
+                        records[key] = entry[1]
+                    else:
+                        records.pop(key, None)
+        except FileNotFoundError:
+            pass
+        except ValueError:
+            _LOGGER.warning("Ignoring unreadable journal for %s", self.key)
+        for key, items in journaled_items.items():
+            records[key] = list(items.values())
+        return data
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
         self._data = {
@@ -551,6 +688,13 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if self._journal:
+            if self._append_journal(data["data"]):
+                return
+            # A journal left behind by a crash between writing the file and
+            # removing the journal must not be replayed on top of the file.
+            data["journal"] = self._journal_id = ulid_util.ulid_now()
+
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
             path,
@@ -560,6 +704,185 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             atomic_writes=self._atomic_writes,
         )
 
+        if self._journal:
+            self._reset_journal(data["data"])
+
+    def _serialize_records(
+        self, data: Any
+    ) -> dict[str, bytes | dict[str, bytes]] | None:
+        """Serialize the top level values of the data.
+
+        Lists of items with an id are serialized per item.
+        Returns None if the data can not be journaled.
+        """
+        if not isinstance(data, dict) or any(type(key) is not str for key in data):
+            return None
+        dumps: Callable[[Any], bytes]
+        if (encoder := self._encoder) and encoder is not JSONEncoder:
+
+            def dumps(value: Any) -> bytes:
+                return json.dumps(value, cls=encoder).encode()
+
+        else:
+            dumps = json_helper.json_bytes
+        records: dict[str, bytes | dict[str, bytes]] = {}
+        fragments: dict[json_helper.json_fragment, tuple[str, bytes]] = {}
+        try:
+            for key, value in data.items():
+                if (items := self._serialize_items(value, dumps, fragments)) is None:
+                    records[key] = dumps(value)
+                else:
+                    records[key] = items
+        except TypeError:
+            return None
+        self._journal_fragments = fragments
+        return records
+
+    def _serialize_items(
+        self,
+        value: Any,
+        dumps: Callable[[Any], bytes],
+        fragments: dict[json_helper.json_fragment, tuple[str, bytes]],
+    ) -> dict[str, bytes] | None:
+        """Serialize a list of items with a unique id, keyed by their id.
+
+        Registries save their entries as cached json fragments, which are
+        only decoded to find their id the first time they are seen.
+        """
+        if not isinstance(value, list) or not value:
+            return None
+        items: dict[str, bytes]
+        if type(value[0]) is not json_helper.json_fragment:
+            items = {}
+            for item in value:
+                if (
+                    not isinstance(item, dict)
+                    or type(item_id := item.get("id")) is not str
+                    or item_id in items
+                ):
+                    return None
+                items[item_id] = dumps(item)
+            return items
+        try:
+            found = list(map(self._journal_fragments.get, value))
+        except TypeError:
+            # Not every item is hashable, so not every item is a fragment
+            return None
+        index = -1
+        for _ in range(found.count(None)):
+            index = found.index(None, index + 1)
+            if type(item := value[index]) is not json_helper.json_fragment:
+                return None
+            item_bytes = dumps(item)
+            if (
+                not isinstance(decoded := json_util.json_loads(item_bytes), dict)
+                or type(item_id := decoded.get("id")) is not str
+            ):
+                return None
+            found[index] = (item_id, item_bytes)
+        if len(items := dict(found)) != len(value):
+            return None
+        fragments.update(zip(value, found, strict=True))
+        return items
+
+    def _append_journal(self, data: Any) -> bool:
+        """Append the changed top level keys to the journal.
+
+        Returns False if a full write is needed instead.
+        """
+        if (old_records := self._journal_records) is None or (
+            records := self._serialize_records(data)
+        ) is None:
+            return False
+        entries: list[bytes] = []
+        for key, value in records.items():
+            old_value = old_records.get(key)
+            key_bytes = json_helper.json_bytes(key)
+            if isinstance(value, dict):
+                if (
+                    isinstance(old_value, dict)
+                    and (changes := _journal_item_changes(old_value, value)) is not None
+                ):
+                    entries.extend(
+                        b"".join(
+                            (
+                                b"[",
+                                key_bytes,
+                                b",",
+                                json_helper.json_bytes(item_id),
+                                b",",
+                                b"null" if item is None else item,
+                                b"]\n",
+                            )
+                        )
+                        for item_id, item in changes
+                    )
+                    continue
+                value = b"".join((b"[", b",".join(value.values()), b"]"))
+            elif old_value == value:
+                continue
+            entries.append(b"".join((b"[", key_bytes, b",", value, b"]\n")))
+        entries.extend(
+            b"".join((b"[", json_helper.json_bytes(key), b"]\n"))
+            for key in old_records.keys() - records.keys()
+        )
+        if not entries:
+            return True
+        if not self._journal_size:
+            entries.insert(
+                0,
+                b"".join(
+                    (b'{"journal":', json_helper.json_bytes(self._journal_id), b"}\n")
+                ),
+            )
+        journal_entries = b"".join(entries)
+        journal_size = self._journal_size + len(journal_entries)
+        if journal_size > self._journal_snapshot_size * JOURNAL_COMPACT_RATIO:
+            return False
+        _LOGGER.debug(
+            "Appending %s changes for %s to %s",
+            len(entries),
+            self.key,
+            self.journal_path,
+        )
+        try:
+            fd = os.open(
+                self.journal_path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                os.write(fd, journal_entries)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as error:
+            # The journal may end with a partial entry now, which is
+            # discarded on load. Force a full write on the next save.
+            self._journal_records = None
+            _LOGGER.exception("Appending to journal failed: %s", self.journal_path)
+            raise WriteError(error) from error
+        self._journal_records = records
+        self._journal_size = journal_size
+        return True
+
+    def _reset_journal(self, data: Any) -> None:
+        """Remove the journal after the data was written in full."""
+        with suppress(FileNotFoundError):
+            os.unlink(self.journal_path)
+        self._journal_records = records = self._serialize_records(data)
+        self._journal_size = 0
+        self._journal_snapshot_size = (
+            sum(
+                len(value)
+                if isinstance(value, bytes)
+                else sum(len(item) for item in value.values())
+                for value in records.values()
+            )
+            if records
+            else 0
+        )
+
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
         raise NotImplementedError
@@ -572,3 +895,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+
+        if self._journal:
+            self._journal_records = None
+            self._journal_fragments = {}
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
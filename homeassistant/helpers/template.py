@@ -15,6 +15,7 @@ from functools import cache, lru_cache, partial, wraps
 import json
 import logging
 import math
+import operator
 from operator import contains
 import pathlib
 import random
@@ -164,6 +165,10 @@ template_cv: ContextVar[tuple[str, str] | None] = ContextVar(
 CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
+# Upper bound of distinct template sources kept in each compiled template
+# cache, see CompiledTemplateCache
+MAX_COMPILED_TEMPLATES = 16384
+
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
 
@@ -398,6 +403,7 @@ class RenderInfo:
         "has_time",
         "is_static",
         "rate_limit",
+        "references_complete",
         "template",
     )
 
@@ -417,6 +423,7 @@ class RenderInfo:
         self.entities: collections.abc.Set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
+        self.references_complete = False
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -473,16 +480,30 @@ class RenderInfo:
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
+    def _add_references(self, references: TemplateReferences) -> None:
+        """Add the states a template references found by static analysis."""
+        self.entities.update(references.entities)  # type: ignore[attr-defined]
+        self.domains.update(references.domains)  # type: ignore[attr-defined]
+        self.all_states |= references.all_states
+        self.has_time |= references.has_time
+        self.references_complete = True
+
     def _freeze(self) -> None:
         self._freeze_sets()
 
+        # When the render failed, what the rest of the template references
+        # is unknown unless static analysis filled it in
+        unknown_references = self.exception is not None and not (
+            self.references_complete
+        )
+
         if self.rate_limit is None:
-            if self.all_states or self.exception:
+            if self.all_states or unknown_references:
                 self.rate_limit = ALL_STATES_RATE_LIMIT
             elif self.domains or self.domains_lifecycle:
                 self.rate_limit = DOMAIN_STATES_RATE_LIMIT
 
-        if self.exception:
+        if unknown_references:
             return
 
         if not self.all_states_lifecycle:
@@ -502,6 +523,267 @@ class RenderInfo:
             self.filter = _false
 
 
+# Functions, filters and tests reading the state of the entity id they
+# get as first argument, or as input for filters and tests
+_ENTITY_STATE_FUNCTIONS = frozenset(
+    {"has_value", "is_state", "is_state_attr", "state_attr", "state_translated"}
+)
+# Functions and filters reading states of entities only known when rendering
+_DYNAMIC_STATE_FUNCTIONS = frozenset({"attr_entities", "closest", "distance", "expand"})
+_STATE_FUNCTIONS = _ENTITY_STATE_FUNCTIONS | _DYNAMIC_STATE_FUNCTIONS | {"states"}
+_TIME_FUNCTIONS = frozenset(
+    {"now", "relative_time", "time_since", "time_until", "today_at", "utcnow"}
+)
+# Tests selecting states by an equal attribute value
+_EQUAL_TESTS = frozenset({"==", "eq", "equalto"})
+# Names Jinja defines inside loops and macros
+_IMPLICIT_NAMES = frozenset({"caller", "kwargs", "loop", "varargs"})
+_IMPORT_NODES = (
+    jinja2.nodes.Extends,
+    jinja2.nodes.FromImport,
+    jinja2.nodes.Import,
+    jinja2.nodes.Include,
+)
+
+
+class TemplateReferences:
+    """States a template references, found without rendering it."""
+
+    __slots__ = ("all_states", "domains", "entities", "has_time", "names")
+
+    def __init__(
+        self,
+        entities: frozenset[str],
+        domains: frozenset[str],
+        all_states: bool,
+        has_time: bool,
+        names: frozenset[str],
+    ) -> None:
+        """Initialize the references."""
+        self.entities = entities
+        self.domains = domains
+        self.all_states = all_states
+        self.has_time = has_time
+        # Names that are not defined by the template itself
+        self.names = names
+
+    def __repr__(self) -> str:
+        """Representation of TemplateReferences."""
+        return (
+            f"<TemplateReferences entities={set(self.entities)}"
+            f" domains={set(self.domains)} all_states={self.all_states}"
+            f" has_time={self.has_time} names={set(self.names)}>"
+        )
+
+
+class _ReferenceCollector:
+    """Walk a template syntax tree and collect the states it references."""
+
+    __slots__ = (
+        "all_states",
+        "domains",
+        "entities",
+        "has_time",
+        "loaded",
+        "stored",
+        "unknown",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the collector."""
+        self.entities: set[str] = set()
+        self.domains: set[str] = set()
+        self.all_states = False
+        self.has_time = False
+        self.loaded: set[str] = set()
+        self.stored: set[str] = set()
+        self.unknown = False
+
+    def visit(self, node: jinja2.nodes.Node) -> None:
+        """Visit a node and its children."""
+        if self.unknown:
+            return
+        if isinstance(node, _IMPORT_NODES):
+            # Imported macros may reference anything
+            self.unknown = True
+            return
+        if isinstance(node, jinja2.nodes.Name):
+            if node.ctx == "load":
+                self.loaded.add(node.name)
+                if node.name != "states" and node.name in _STATE_FUNCTIONS:
+                    # Passed around instead of called with an entity id
+                    self.unknown = True
+                elif node.name == "states":
+                    # Used in another way than looking up a single
+                    # entity or domain, like iterating all states
+                    self.all_states = True
+                elif node.name in _TIME_FUNCTIONS:
+                    self.has_time = True
+            else:
+                self.stored.add(node.name)
+            return
+        if isinstance(node, jinja2.nodes.Call) and isinstance(
+            node.node, jinja2.nodes.Name
+        ):
+            name = node.node.name
+            if name in _DYNAMIC_STATE_FUNCTIONS:
+                self.unknown = True
+                return
+            if name == "states" or name in _ENTITY_STATE_FUNCTIONS:
+                self.loaded.add(name)
+                self._add_entity(node.args[0] if node.args else None)
+                self._visit_all(node.args[1:])
+                self._visit_all(node.kwargs)
+                self._visit_all((node.dyn_args, node.dyn_kwargs))
+                return
+        elif isinstance(node, (jinja2.nodes.Filter, jinja2.nodes.Test)):
+            if node.name in _DYNAMIC_STATE_FUNCTIONS or any(
+                # Applied by name, like select("is_state", "on")
+                isinstance(arg, jinja2.nodes.Const) and arg.value in _STATE_FUNCTIONS
+                for arg in node.args
+            ):
+                self.unknown = True
+                return
+            if (
+                isinstance(node, jinja2.nodes.Filter)
+                and node.name == "selectattr"
+                and _is_states_name(node.node)
+                and self._visit_states_selectattr(node)
+            ):
+                return
+            if node.name == "states" or node.name in _ENTITY_STATE_FUNCTIONS:
+                self._add_entity(node.node)
+                self._visit_all(node.args)
+                self._visit_all(node.kwargs)
+                self._visit_all((node.dyn_args, node.dyn_kwargs))
+                return
+        elif isinstance(node, (jinja2.nodes.Getattr, jinja2.nodes.Getitem)):
+            if self._visit_states_lookup(node):
+                return
+        self._visit_all(node.iter_child_nodes())
+
+    def _visit_all(self, nodes: Iterable[jinja2.nodes.Node | None]) -> None:
+        """Visit nodes."""
+        for node in nodes:
+            if node is not None:
+                self.visit(node)
+
+    def _add_entity(self, node: jinja2.nodes.Node | None) -> None:
+        """Add the entity id a node evaluates to."""
+        if not isinstance(node, jinja2.nodes.Const):
+            # Only known when rendering
+            self.unknown = True
+        elif isinstance(node.value, str):
+            self.entities.add(node.value.lower())
+
+    def _visit_states_selectattr(self, node: jinja2.nodes.Filter) -> bool:
+        """Visit states | selectattr("entity_id", "eq", "light.kitchen").
+
+        Selecting by a constant entity id or domain only depends on the
+        selected states. Return False if node selects in another way.
+        """
+        if node.kwargs or node.dyn_args or node.dyn_kwargs or len(node.args) != 3:
+            return False
+        attribute, test, value = node.args
+        if not (
+            isinstance(attribute, jinja2.nodes.Const)
+            and attribute.value in ("domain", "entity_id")
+            and isinstance(test, jinja2.nodes.Const)
+            and (test.value == "in" or test.value in _EQUAL_TESTS)
+        ):
+            return False
+        try:
+            values = value.as_const()
+        except jinja2.nodes.Impossible:
+            return False
+        if test.value != "in":
+            values = (values,)
+        elif not isinstance(values, (list, tuple)):
+            return False
+        if not all(isinstance(value, str) for value in values):
+            return False
+        self.loaded.add("states")
+        if attribute.value == "entity_id":
+            self.entities.update(value.lower() for value in values)
+        else:
+            self.domains.update(values)
+        return True
+
+    def _visit_states_lookup(
+        self, node: jinja2.nodes.Getattr | jinja2.nodes.Getitem
+    ) -> bool:
+        """Visit states.domain, states.domain.object_id and their item forms.
+
+        Return False if node is not a lookup on states.
+        """
+        inner = node.node
+        if _is_states_name(inner):
+            self.loaded.add("states")
+            if (key := _lookup_key(node)) is None:
+                self.unknown = True
+            elif "." in key:
+                self.entities.add(key.lower())
+            else:
+                self.domains.add(key)
+            return True
+        if not (
+            isinstance(inner, (jinja2.nodes.Getattr, jinja2.nodes.Getitem))
+            and _is_states_name(inner.node)
+        ):
+            return False
+        self.loaded.add("states")
+        if (domain := _lookup_key(inner)) is None:
+            self.unknown = True
+        elif "." in domain:
+            # An attribute of states["domain.object_id"]
+            self.entities.add(domain.lower())
+        elif (object_id := _lookup_key(node)) is None:
+            self.domains.add(domain)
+        else:
+            self.entities.add(f"{domain}.{object_id}".lower())
+        if isinstance(node, jinja2.nodes.Getitem):
+            self.visit(node.arg)
+        return True
+
+
+def _is_states_name(node: jinja2.nodes.Node) -> bool:
+    """Return if a node is the states global."""
+    return isinstance(node, jinja2.nodes.Name) and node.name == "states"
+
+
+def _lookup_key(node: jinja2.nodes.Getattr | jinja2.nodes.Getitem) -> str | None:
+    """Return the constant key of an attribute or item lookup."""
+    if isinstance(node, jinja2.nodes.Getattr):
+        return node.attr
+    if isinstance(node.arg, jinja2.nodes.Const) and isinstance(node.arg.value, str):
+        return node.arg.value
+    return None
+
+
+@lru_cache(maxsize=EVAL_CACHE_SIZE)
+def analyze_template_references(template: str) -> TemplateReferences | None:
+    """Find the states a template references without rendering it.
+
+    Returns None if they depend on values only known when rendering, like
+    entity ids in variables or imported macros.
+    """
+    try:
+        tree = _NO_HASS_ENV.parse(template)
+    except jinja2.TemplateSyntaxError:
+        return None
+    collector = _ReferenceCollector()
+    collector.visit(tree)
+    if collector.unknown:
+        return None
+    return TemplateReferences(
+        frozenset(collector.entities),
+        frozenset(collector.domains),
+        collector.all_states,
+        collector.has_time,
+        frozenset(collector.loaded - collector.stored - _IMPLICIT_NAMES),
+    )
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -510,6 +792,7 @@ class Template:
         "_compiled",
         "_compiled_code",
         "_exc_info",
+        "_fast_lane",
         "_hash_cache",
         "_limited",
         "_log_fn",
@@ -542,6 +825,7 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
         self._compiled: jinja2.Template | None = None
+        self._fast_lane: Callable[[], Any] | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: OptExcInfo | None = None
@@ -577,7 +861,7 @@ class Template:
         if self.is_static or self._compiled_code is not None:
             return
 
-        if compiled := self._env.template_cache.get(self.template):
+        if (compiled := self._env.template_cache.get(self.template)) is not None:
             self._compiled_code = compiled
             return
 
@@ -640,7 +924,13 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if (fast_lane := self._fast_lane) is not None and not (
+                # Variables shadowing the functions it calls
+                kwargs and not _FAST_LANE_FUNCTIONS.keys().isdisjoint(kwargs)
+            ):
+                render_result = _render_fast_lane(self.template, fast_lane)
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -765,9 +1055,46 @@ class Template:
         finally:
             _render_info.reset(token)
 
+        if render_info.exception is not None:
+            if (
+                # A template which failed to compile is never rendered, there
+                # is nothing to track until it is fixed
+                self._compiled_code is not None
+                and (references := self.async_static_references()) is not None
+            ):
+                # The render stopped at the error, add what the rest of the
+                # template references so it is still tracked precisely
+                render_info._add_references(references)  # noqa: SLF001
+        elif (render_info.all_states or render_info.all_states_lifecycle) and (
+            (references := self.async_static_references()) is not None
+            and not references.all_states
+        ):
+            # The render went over all states, like for selecting states by
+            # entity id, but the template only depends on the states it
+            # references
+            render_info.all_states = render_info.all_states_lifecycle = False
+            render_info._add_references(references)  # noqa: SLF001
+
         render_info._freeze()  # noqa: SLF001
         return render_info
 
+    @callback
+    def async_static_references(self) -> TemplateReferences | None:
+        """Return the states the template references, found without rendering.
+
+        Returns None if they are only known when rendering, including when
+        the template uses names that are not globals, since variables may
+        hold states.
+        """
+        if self.is_static:
+            return None
+        if (references := analyze_template_references(self.template)) is None:
+            return None
+        env = self._compiled.environment if self._compiled else self._env
+        if not references.names <= env.globals.keys():
+            return None
+        return references
+
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
         """Render template with value exposed.
 
@@ -858,11 +1185,18 @@ class Template:
         self._log_fn = log_fn
         env = self._env
 
-        self._compiled = jinja2.Template.from_code(
-            env, self._compiled_code, env.globals, None
-        )
+        # Templates with the same source bound to the same environment
+        # share the jinja2 template instead of each executing the code
+        if (compiled := env.bound_templates.get(self.template)) is None:
+            compiled = jinja2.Template.from_code(
+                env, self._compiled_code, env.globals, None
+            )
+            env.bound_templates[self.template] = compiled
+        self._compiled = compiled
+        if not limited and (program := _fast_lane_program(self.template)):
+            self._fast_lane = partial(program, self.hass)
 
-        return self._compiled
+        return compiled
 
     def __eq__(self, other):
         """Compare template with another."""
@@ -1901,6 +2235,25 @@ def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     return None
 
 
+def attr_entities(
+    hass: HomeAssistant, name: str, value: Any, domain: str | None = None
+) -> list[str]:
+    """Get entity ids of states with an attribute set to a value.
+
+    Uses the attribute index of the state machine if there is one.
+    Templates never add indexes since they can not be removed.
+    """
+    if (render_info := _render_info.get()) is not None:
+        if domain is None:
+            render_info.all_states = True
+        else:
+            render_info.domains.add(domain.lower())
+    return [
+        state.entity_id
+        for state in hass.states.async_all_with_attribute(name, value, domain)
+    ]
+
+
 def has_value(hass: HomeAssistant, entity_id: str) -> bool:
     """Test if an entity has a valid value."""
     state_obj = _get_state(hass, entity_id)
@@ -2756,6 +3109,145 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+# The fast lane evaluates templates made of a single expression using
+# states(), state_attr(), numeric filters and arithmetic directly, without
+# Jinja's context and sandbox machinery. It has to give the same results,
+# including the states collected in RenderInfo and the errors raised.
+type _FastLaneProgram = Callable[[HomeAssistant], Any]
+
+
+def _fast_lane_states(hass: HomeAssistant, entity_id: str) -> str:
+    """Return the state of an entity like states(entity_id)."""
+    if (state := hass.states.get(entity_id)) is None:
+        _collect_state(hass, entity_id)
+        return STATE_UNKNOWN
+    _collect_state(hass, state.entity_id)
+    return state.state
+
+
+def _fast_lane_state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
+    """Return an attribute of an entity like state_attr(entity_id, name)."""
+    if (state := hass.states.get(entity_id)) is None:
+        _collect_state(hass, entity_id)
+        return None
+    _collect_state(hass, state.entity_id)
+    return state.attributes.get(name)
+
+
+_FAST_LANE_FUNCTIONS: dict[str, tuple[Callable[..., Any], int]] = {
+    "states": (_fast_lane_states, 1),
+    "state_attr": (_fast_lane_state_attr, 2),
+}
+_FAST_LANE_FILTERS: dict[str, Callable[..., Any]] = {
+    "float": forgiving_float_filter,
+    "int": forgiving_int_filter,
+    "round": forgiving_round,
+}
+_FAST_LANE_BINOPS: dict[type[jinja2.nodes.BinExpr], Callable[[Any, Any], Any]] = {
+    jinja2.nodes.Add: operator.add,
+    jinja2.nodes.Sub: operator.sub,
+    jinja2.nodes.Mul: operator.mul,
+    jinja2.nodes.Div: operator.truediv,
+    jinja2.nodes.FloorDiv: operator.floordiv,
+    jinja2.nodes.Mod: operator.mod,
+}
+_FAST_LANE_UNARYOPS: dict[type[jinja2.nodes.UnaryExpr], Callable[[Any], Any]] = {
+    jinja2.nodes.Neg: operator.neg,
+    jinja2.nodes.Pos: operator.pos,
+}
+
+
+def _const_values(
+    args: list[jinja2.nodes.Expr], kwargs: list[jinja2.nodes.Keyword]
+) -> tuple[tuple[Any, ...], dict[str, Any]] | None:
+    """Return the values of constant arguments, None if one is not constant."""
+    if not all(isinstance(arg, jinja2.nodes.Const) for arg in args) or not all(
+        isinstance(kwarg.value, jinja2.nodes.Const) for kwarg in kwargs
+    ):
+        return None
+    return (
+        tuple(arg.value for arg in args),  # type: ignore[attr-defined]
+        {kwarg.key: kwarg.value.value for kwarg in kwargs},  # type: ignore[attr-defined]
+    )
+
+
+def _build_fast_lane(node: jinja2.nodes.Node) -> _FastLaneProgram | None:
+    """Build a fast lane program for an expression, None if not supported."""
+    if isinstance(node, jinja2.nodes.Const):
+        value = node.value
+        return lambda hass: value
+
+    if isinstance(node, jinja2.nodes.Call):
+        if (
+            not isinstance(node.node, jinja2.nodes.Name)
+            or node.node.name not in _FAST_LANE_FUNCTIONS
+            or node.dyn_args is not None
+            or node.dyn_kwargs is not None
+            or node.kwargs
+        ):
+            return None
+        function, arity = _FAST_LANE_FUNCTIONS[node.node.name]
+        if len(node.args) != arity or (consts := _const_values(node.args, [])) is None:
+            return None
+        function_args = consts[0]
+        return lambda hass: function(hass, *function_args)
+
+    if isinstance(node, jinja2.nodes.Filter):
+        if (
+            node.node is None
+            or node.name not in _FAST_LANE_FILTERS
+            or node.dyn_args is not None
+            or node.dyn_kwargs is not None
+            or (consts := _const_values(node.args, node.kwargs)) is None
+            or (operand := _build_fast_lane(node.node)) is None
+        ):
+            return None
+        filter_ = _FAST_LANE_FILTERS[node.name]
+        args, kwargs = consts
+        return lambda hass: filter_(operand(hass), *args, **kwargs)
+
+    if isinstance(node, jinja2.nodes.BinExpr):
+        if (
+            (binop := _FAST_LANE_BINOPS.get(type(node))) is None
+            or (left := _build_fast_lane(node.left)) is None
+            or (right := _build_fast_lane(node.right)) is None
+        ):
+            return None
+        return lambda hass: binop(left(hass), right(hass))
+
+    if isinstance(node, jinja2.nodes.UnaryExpr):
+        if (unaryop := _FAST_LANE_UNARYOPS.get(type(node))) is None or (
+            operand := _build_fast_lane(node.node)
+        ) is None:
+            return None
+        return lambda hass: unaryop(operand(hass))
+
+    return None
+
+
+@lru_cache(maxsize=EVAL_CACHE_SIZE)
+def _fast_lane_program(template: str) -> _FastLaneProgram | None:
+    """Return a fast lane program for a template, None if not supported."""
+    try:
+        tree = _NO_HASS_ENV.parse(template)
+    except jinja2.TemplateSyntaxError:
+        return None
+    if (
+        len(tree.body) != 1
+        or not isinstance(output := tree.body[0], jinja2.nodes.Output)
+        or len(output.nodes) != 1
+    ):
+        return None
+    return _build_fast_lane(output.nodes[0])
+
+
+def _render_fast_lane(template_str: str, fast_lane: Callable[[], Any]) -> str:
+    """Render a template with its fast lane program bound to hass."""
+    with _template_context_manager as cm:
+        cm.set_template(template_str, "rendering")
+        return str(fast_lane())
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -2862,6 +3354,67 @@ class HassLoader(jinja2.BaseLoader):
         return self._sources[template], template, lambda: cur_reload == self._reload
 
 
+class CompiledTemplateCache:
+    """Bounded, reference counted cache of compiled template code.
+
+    Entries are weakly referenced: they are kept alive by the templates
+    using them and dropped once the last of those is garbage collected.
+    """
+
+    __slots__ = ("_cache", "hits", "max_size", "misses")
+
+    def __init__(self, max_size: int) -> None:
+        """Initialize the cache."""
+        self._cache: weakref.WeakValueDictionary[
+            str | jinja2.nodes.Template, CodeType
+        ] = weakref.WeakValueDictionary()
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source: str | jinja2.nodes.Template) -> CodeType | None:
+        """Return the compiled code of a source and record a hit or a miss."""
+        if (code := self._cache.get(source)) is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return code
+
+    def __setitem__(self, source: str | jinja2.nodes.Template, code: CodeType) -> None:
+        """Cache the compiled code of a source unless the cache is full."""
+        if len(self._cache) < self.max_size:
+            self._cache[source] = code
+
+    def __len__(self) -> int:
+        """Return the number of cached sources."""
+        return len(self._cache)
+
+    def cache_info(self) -> dict[str, int]:
+        """Return the cache statistics."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "max_size": self.max_size,
+        }
+
+
+# Compiled code only depends on which filters and tests exist, so it is shared
+# process wide by all environments that have the same set of them, keyed by
+# (has hass, limited).
+_COMPILED_TEMPLATE_CACHES: dict[tuple[bool, bool], CompiledTemplateCache] = {}
+
+
+def compiled_template_cache_info() -> dict[str, dict[str, int]]:
+    """Return the statistics of the compiled template caches."""
+    return {
+        f"{'hass' if has_hass else 'no_hass'}{'_limited' if limited else ''}": (
+            cache.cache_info()
+        )
+        for (has_hass, limited), cache in _COMPILED_TEMPLATE_CACHES.items()
+    }
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -2875,9 +3428,15 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
-        self.template_cache: weakref.WeakValueDictionary[
-            str | jinja2.nodes.Template, CodeType | None
-        ] = weakref.WeakValueDictionary()
+        cache_key = (hass is not None, bool(limited))
+        if (template_cache := _COMPILED_TEMPLATE_CACHES.get(cache_key)) is None:
+            template_cache = _COMPILED_TEMPLATE_CACHES[cache_key] = (
+                CompiledTemplateCache(MAX_COMPILED_TEMPLATES)
+            )
+        self.template_cache = template_cache
+        self.bound_templates: weakref.WeakValueDictionary[str, jinja2.Template] = (
+            weakref.WeakValueDictionary()
+        )
         self.add_extension("jinja2.ext.loopcontrols")
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
@@ -3088,6 +3647,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 "is_state",
                 "is_state_attr",
                 "state_attr",
+                "attr_entities",
                 "states",
                 "state_translated",
                 "has_value",
@@ -3148,6 +3708,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         self.tests["is_state_attr"] = hassfunction(is_state_attr, pass_eval_context)
         self.globals["state_attr"] = hassfunction(state_attr)
         self.filters["state_attr"] = self.globals["state_attr"]
+        self.globals["attr_entities"] = hassfunction(attr_entities)
         self.globals["states"] = AllStates(hass)
         self.filters["states"] = self.globals["states"]
         self.globals["state_translated"] = StateTranslated(hass)
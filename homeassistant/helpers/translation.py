@@ -5,10 +5,11 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Iterable, Mapping
 from contextlib import suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import logging
 import pathlib
 import string
+import time
 from typing import Any
 
 from homeassistant.const import (
@@ -32,6 +33,10 @@ _LOGGER = logging.getLogger(__name__)
 TRANSLATION_FLATTEN_CACHE = "translation_flatten_cache"
 LOCALE_EN = "en"
 
+# Translations of languages other than English and the configured
+# language are evicted when they have not been requested for this long
+LANGUAGE_IDLE_TIMEOUT = 3600
+
 
 def recursive_flatten(
     prefix: str, data: dict[str, dict[str, Any] | str]
@@ -142,10 +147,26 @@ class _TranslationsCacheData:
 
     loaded: dict[str, set[str]]
     cache: dict[str, dict[str, dict[str, dict[str, str]]]]
+    # Strings of loaded components by language and category which are
+    # flattened into the cache when the category is first requested.
+    # None means the language has no strings of its own for the component
+    # and falls back to English.
+    pending: dict[str, dict[str, dict[str, dict[str, Any] | str | None]]] = field(
+        default_factory=dict
+    )
+    last_used: dict[str, float] = field(default_factory=dict)
 
 
 class _TranslationCache:
-    """Cache for flattened translations."""
+    """Cache for flattened translations.
+
+    Translation files are loaded per language for all their categories,
+    but each category is only flattened when it is first requested. The
+    flattened strings of other languages share the keys and, when a
+    component is not translated, the strings of the English fallback.
+    Languages other than English and the configured language are
+    evicted when they have not been requested for a while.
+    """
 
     __slots__ = ("cache_data", "hass", "lock")
 
@@ -166,16 +187,19 @@ class _TranslationCache:
         components: set[str],
     ) -> None:
         """Load resources into the cache."""
+        self.cache_data.last_used[language] = time.monotonic()
         loaded = self.cache_data.loaded.setdefault(language, set())
         if components_to_load := components - loaded:
-            # Translations are never unloaded so if there are no components to load
-            # we can skip the lock which reduces contention when multiple different
-            # translations categories are being fetched at the same time which is
-            # common from the frontend.
+            # Translations are only unloaded for idle languages so if there are no
+            # components to load we can skip the lock which reduces contention when
+            # multiple different translations categories are being fetched at the
+            # same time which is common from the frontend.
             async with self.lock:
                 # Check components to load again, as another task might have loaded
                 # them while we were waiting for the lock.
+                loaded = self.cache_data.loaded.setdefault(language, set())
                 if components_to_load := components - loaded:
+                    self._async_evict_idle_languages(language)
                     await self._async_load(language, components_to_load)
 
     async def async_fetch(
@@ -196,6 +220,8 @@ class _TranslationCache:
         components: set[str],
     ) -> dict[str, str]:
         """Read resources from the cache."""
+        if (pending := self.cache_data.pending.get(language)) and category in pending:
+            self._flatten_category(language, category)
         category_cache = self.cache_data.cache.get(language, {}).get(category, {})
         # If only one component was requested, return it directly
         # to avoid merging the dictionaries and keeping additional
@@ -216,8 +242,13 @@ class _TranslationCache:
             language,
             components,
         )
-        # Fetch the English resources, as a fallback for missing keys
-        languages = [LOCALE_EN] if language == LOCALE_EN else [LOCALE_EN, language]
+        # Fetch the English resources, as a fallback for missing keys,
+        # unless they are already loaded
+        loaded_english_components = loaded.setdefault(LOCALE_EN, set())
+        english_components = components - loaded_english_components
+        languages = [language]
+        if language != LOCALE_EN and english_components:
+            languages.insert(0, LOCALE_EN)
 
         integrations: dict[str, Integration] = {}
         ints_or_excs = await async_get_integrations(self.hass, components)
@@ -233,28 +264,107 @@ class _TranslationCache:
             self.hass, languages, components, integrations
         )
 
-        # English is always the fallback language so we load them first
-        self._build_category_cache(
-            language, components, translation_by_language_strings[LOCALE_EN]
-        )
+        # English is always the fallback language so we queue it first
+        if english_components:
+            self._queue_strings(
+                LOCALE_EN,
+                english_components,
+                translation_by_language_strings[LOCALE_EN],
+            )
+            loaded_english_components.update(english_components)
 
         if language != LOCALE_EN:
-            # Now overlay the requested language on top of the English
-            self._build_category_cache(
+            self._queue_strings(
                 language, components, translation_by_language_strings[language]
             )
 
-            loaded_english_components = loaded.setdefault(LOCALE_EN, set())
-            # Since we just loaded english anyway we can avoid loading
-            # again if they switch back to english.
-            if loaded_english_components.isdisjoint(components):
-                self._build_category_cache(
-                    LOCALE_EN, components, translation_by_language_strings[LOCALE_EN]
-                )
-                loaded_english_components.update(components)
-
         loaded[language].update(components)
 
+    @callback
+    def _async_evict_idle_languages(self, language: str) -> None:
+        """Evict the translations of languages that were not requested recently."""
+        cache_data = self.cache_data
+        idle_since = time.monotonic() - LANGUAGE_IDLE_TIMEOUT
+        for idle_language in [
+            lang
+            for lang, last_used in cache_data.last_used.items()
+            if last_used < idle_since
+            and lang not in (LOCALE_EN, language, self.hass.config.language)
+        ]:
+            _LOGGER.debug("Evicting idle translations for %s", idle_language)
+            del cache_data.last_used[idle_language]
+            cache_data.loaded.pop(idle_language, None)
+            cache_data.cache.pop(idle_language, None)
+            cache_data.pending.pop(idle_language, None)
+
+    @callback
+    def _queue_strings(
+        self,
+        language: str,
+        components: set[str],
+        translation_strings: dict[str, dict[str, Any]],
+    ) -> None:
+        """Queue loaded strings to be flattened when their category is requested."""
+        pending = self.cache_data.pending.setdefault(language, {})
+        fallback_categories: dict[str, set[str]] = {}
+        if language != LOCALE_EN:
+            # Components translated in English but not in this language
+            # fall back to the English strings of the category
+            for categories in (
+                self.cache_data.cache.get(LOCALE_EN, {}),
+                self.cache_data.pending.get(LOCALE_EN, {}),
+            ):
+                for category, category_components in categories.items():
+                    fallback_categories.setdefault(category, set()).update(
+                        components.intersection(category_components)
+                    )
+
+        for component in components:
+            component_strings = translation_strings.get(component, {})
+            for category, resource in component_strings.items():
+                if resource:
+                    pending.setdefault(category, {})[component] = resource
+
+        for category, category_components in fallback_categories.items():
+            category_pending = pending.setdefault(category, {})
+            for component in category_components:
+                category_pending.setdefault(component, None)
+
+    @callback
+    def _flatten_category(self, language: str, category: str) -> None:
+        """Flatten the pending strings of a category into the cache."""
+        pending = self.cache_data.pending[language]
+        resources = pending.pop(category)
+        category_cache = self.cache_data.cache.setdefault(language, {}).setdefault(
+            category, {}
+        )
+        fallback: dict[str, dict[str, str]] = {}
+        if language != LOCALE_EN:
+            if (
+                english_pending := self.cache_data.pending.get(LOCALE_EN)
+            ) and category in english_pending:
+                self._flatten_category(LOCALE_EN, category)
+            fallback = self.cache_data.cache.get(LOCALE_EN, {}).get(category, {})
+
+        for component, resource in resources.items():
+            english = fallback.get(component)
+            if resource is None:
+                if english is not None:
+                    category_cache[component] = english
+                continue
+
+            # Copying the English strings shares their keys
+            component_cache = dict(english) if english else {}
+            if not isinstance(resource, dict):
+                component_cache[f"component.{component}.{category}"] = resource
+            else:
+                prefix = f"component.{component}.{category}."
+                flat = recursive_flatten(prefix, resource)
+                component_cache.update(
+                    self._validate_placeholders(language, flat, english)
+                )
+            category_cache[component] = component_cache
+
     def _validate_placeholders(
         self,
         language: str,
@@ -299,38 +409,6 @@ class _TranslationCache:
 
         return updated_resources
 
-    @callback
-    def _build_category_cache(
-        self,
-        language: str,
-        components: set[str],
-        translation_strings: dict[str, dict[str, Any]],
-    ) -> None:
-        """Extract resources into the cache."""
-        resource: dict[str, Any] | str
-        cached = self.cache_data.cache.setdefault(language, {})
-        categories = {
-            category
-            for component in translation_strings.values()
-            for category in component
-        }
-
-        for category in categories:
-            new_resources = build_resources(translation_strings, components, category)
-            category_cache = cached.setdefault(category, {})
-
-            for component, resource in new_resources.items():
-                component_cache = category_cache.setdefault(component, {})
-
-                if not isinstance(resource, dict):
-                    component_cache[f"component.{component}.{category}"] = resource
-                    continue
-
-                prefix = f"component.{component}.{category}."
-                flat = recursive_flatten(prefix, resource)
-                flat = self._validate_placeholders(language, flat, component_cache)
-                component_cache.update(flat)
-
 
 @bind_hass
 async def async_get_translations(
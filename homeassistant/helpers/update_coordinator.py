@@ -5,6 +5,7 @@ from __future__ import annotations
 from abc import abstractmethod
 import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Generator
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from functools import partial
 import logging
@@ -19,7 +20,14 @@ import requests
 
 from homeassistant import config_entries
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    HassJob,
+    HassJobType,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import (
     ConfigEntryAuthFailed,
     ConfigEntryError,
@@ -27,6 +35,7 @@ from homeassistant.exceptions import (
     HomeAssistantError,
 )
 from homeassistant.util.dt import utcnow
+from homeassistant.util.hass_dict import HassKey
 
 from . import entity, event
 from .debounce import Debouncer
@@ -35,9 +44,16 @@ from .typing import UNDEFINED, UndefinedType
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
 REQUEST_REFRESH_DEFAULT_IMMEDIATE = True
+# Factor the interval of adaptive coordinators grows by
+# for each scheduled refresh that returns unchanged data
+ADAPTIVE_BACKOFF_FACTOR = 2
 
 _DataT = TypeVar("_DataT", default=dict[str, Any])
 
+DATA_REFRESH_GROUPS: HassKey[dict[str, RefreshGroup]] = HassKey(
+    "update_coordinator_refresh_groups"
+)
+
 
 class UpdateFailed(HomeAssistantError):
     """Raised when an update has failed."""
@@ -53,12 +69,169 @@ class BaseDataUpdateCoordinatorProtocol(Protocol):
         """Listen for data updates."""
 
 
+class RefreshGroup:
+    """Group the refreshes of coordinators polling the same device or service.
+
+    Scheduled refreshes of members with the same update interval happen on
+    a shared tick aligned to that interval. Members that refresh together
+    are fetched with a single call to :meth:`_async_update_data` when the
+    group has an ``update_method`` or a subclass overrides it. Otherwise
+    each member is fetched on its own. At most ``max_concurrent`` requests
+    of the group run at the same time.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        *,
+        max_concurrent: int | None = None,
+        update_method: Callable[
+            [list[DataUpdateCoordinator[Any]]],
+            Awaitable[dict[DataUpdateCoordinator[Any], Any]],
+        ]
+        | None = None,
+    ) -> None:
+        """Initialize the refresh group."""
+        self.hass = hass
+        self.name = name
+        self.update_method = update_method
+        self._semaphore = asyncio.Semaphore(max_concurrent) if max_concurrent else None
+        self._batched = (
+            update_method is not None
+            or type(self)._async_update_data  # noqa: SLF001
+            is not RefreshGroup._async_update_data
+        )
+        self._pending: dict[DataUpdateCoordinator[Any], asyncio.Future[Any]] = {}
+        self._members: set[DataUpdateCoordinator[Any]] = set()
+
+    @callback
+    def async_add_member(self, coordinator: DataUpdateCoordinator[Any]) -> None:
+        """Add a coordinator to the group."""
+        self._members.add(coordinator)
+
+    @callback
+    def async_remove_member(self, coordinator: DataUpdateCoordinator[Any]) -> None:
+        """Remove a coordinator that shut down from the group.
+
+        The group is dropped from the registered groups with its last member,
+        so a config entry that reloads gets a new group with its new options.
+        """
+        self._members.discard(coordinator)
+        if (
+            not self._members
+            and (groups := self.hass.data.get(DATA_REFRESH_GROUPS)) is not None
+            and groups.get(self.name) is self
+        ):
+            del groups[self.name]
+
+    async def _async_update_data(
+        self, coordinators: list[DataUpdateCoordinator[Any]]
+    ) -> dict[DataUpdateCoordinator[Any], Any]:
+        """Fetch the latest data of the coordinators with a single request.
+
+        Coordinators missing from the result fail to update, an exception
+        as the value of a coordinator is raised by its refresh.
+        """
+        if self.update_method is None:
+            raise NotImplementedError("Update method not implemented")
+        return await self.update_method(coordinators)
+
+    async def async_fetch(self, coordinator: DataUpdateCoordinator[_DataT]) -> _DataT:
+        """Fetch the latest data of a member of the group."""
+        if not self._batched:
+            async with self._semaphore or nullcontext():
+                return await coordinator._async_update_data()  # noqa: SLF001
+
+        if (future := self._pending.get(coordinator)) is None:
+            if not self._pending:
+                # Members refreshing on the same tick join the batch
+                # before it starts on the next iteration of the loop
+                self.hass.loop.call_soon(self._async_start_batch)
+            future = self._pending[coordinator] = self.hass.loop.create_future()
+        data: _DataT = await asyncio.shield(future)
+        return data
+
+    @callback
+    def _async_start_batch(self) -> None:
+        """Start fetching the data of the pending members."""
+        batch, self._pending = self._pending, {}
+        self.hass.async_create_background_task(
+            self._async_run_batch(batch),
+            name=f"{self.name} - refresh group",
+            eager_start=True,
+        )
+
+    async def _async_run_batch(
+        self, batch: dict[DataUpdateCoordinator[Any], asyncio.Future[Any]]
+    ) -> None:
+        """Fetch the data of a batch of members and pass it on."""
+        try:
+            async with self._semaphore or nullcontext():
+                results = await self._async_update_data(list(batch))
+        except Exception as err:  # noqa: BLE001
+            for future in batch.values():
+                future.set_exception(err)
+            return
+        except BaseException:
+            for future in batch.values():
+                future.cancel()
+            raise
+
+        for coordinator, future in batch.items():
+            if future.done():
+                continue
+            if coordinator not in results:
+                future.set_exception(
+                    UpdateFailed(f"No data for {coordinator.name} in batch")
+                )
+            elif isinstance(result := results[coordinator], Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+@callback
+def async_get_refresh_group(
+    hass: HomeAssistant,
+    key: str,
+    *,
+    max_concurrent: int | None = None,
+    update_method: Callable[
+        [list[DataUpdateCoordinator[Any]]],
+        Awaitable[dict[DataUpdateCoordinator[Any], Any]],
+    ]
+    | None = None,
+) -> RefreshGroup:
+    """Return the refresh group for a key, creating it on first use.
+
+    The options are only used when the group is created. The group is
+    removed once all coordinators using it have shut down, like when their
+    config entry unloads.
+    """
+    groups = hass.data.setdefault(DATA_REFRESH_GROUPS, {})
+    if (group := groups.get(key)) is None:
+        group = groups[key] = RefreshGroup(
+            hass, key, max_concurrent=max_concurrent, update_method=update_method
+        )
+    return group
+
+
 class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     """Class to manage fetching data from single endpoint.
 
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Coordinators polling the same device or service can share a
+    :class:`RefreshGroup` to refresh together.
+
+    Setting ``max_update_interval`` makes the polling adaptive. Every
+    scheduled refresh that returns data equal to the previous data backs
+    off the interval, up to ``max_update_interval``. Changed data and
+    requested refreshes, like those after entity service calls, return to
+    :attr:`update_interval`.
     """
 
     def __init__(
@@ -73,6 +246,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         setup_method: Callable[[], Awaitable[None]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        refresh_group: RefreshGroup | None = None,
+        max_update_interval: timedelta | None = None,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -81,6 +256,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self.update_method = update_method
         self.setup_method = setup_method
         self._update_interval_seconds: float | None = None
+        self._effective_update_interval_seconds: float | None = None
+        self._max_update_interval_seconds = (
+            max_update_interval.total_seconds() if max_update_interval else None
+        )
         self.update_interval = update_interval
         self._shutdown_requested = False
         if config_entry is UNDEFINED:
@@ -90,6 +269,15 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         else:
             self.config_entry = config_entry
         self.always_update = always_update
+        self.refresh_group = refresh_group
+        self._refresh_group_job: HassJob[[datetime], None] | None = None
+        if refresh_group is not None:
+            refresh_group.async_add_member(self)
+            self._refresh_group_job = HassJob(
+                self._handle_refresh_group_tick,
+                f"{name} - refresh group tick",
+                job_type=HassJobType.Callback,
+            )
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -183,6 +371,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._async_unsub_refresh()
         self._async_unsub_shutdown()
         self._debounced_refresh.async_shutdown()
+        if self.refresh_group is not None:
+            self.refresh_group.async_remove_member(self)
 
     @callback
     def _unschedule_refresh(self) -> None:
@@ -218,11 +408,39 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         """Set interval between updates."""
         self._update_interval = value
         self._update_interval_seconds = value.total_seconds() if value else None
+        self._effective_update_interval_seconds = self._update_interval_seconds
+
+    @property
+    def effective_update_interval(self) -> timedelta | None:
+        """Interval between updates after adapting to unchanged data."""
+        if self._effective_update_interval_seconds is None:
+            return None
+        return timedelta(seconds=self._effective_update_interval_seconds)
+
+    @callback
+    def _async_adapt_update_interval(self, changed: bool) -> None:
+        """Back off the interval between updates while data does not change."""
+        if (
+            self._max_update_interval_seconds is None
+            or self._update_interval_seconds is None
+            or self._effective_update_interval_seconds is None
+        ):
+            return
+        if changed:
+            interval = self._update_interval_seconds
+        else:
+            interval = min(
+                self._effective_update_interval_seconds * ADAPTIVE_BACKOFF_FACTOR,
+                self._max_update_interval_seconds,
+            )
+        if interval != self._effective_update_interval_seconds:
+            self.logger.debug("Updating %s data every %s seconds", self.name, interval)
+            self._effective_update_interval_seconds = interval
 
     @callback
     def _schedule_refresh(self) -> None:
         """Schedule a refresh."""
-        if self._update_interval_seconds is None:
+        if self._effective_update_interval_seconds is None:
             return
 
         if self.config_entry and self.config_entry.pref_disable_polling:
@@ -238,8 +456,23 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         hass = self.hass
         loop = hass.loop
 
+        if self._refresh_group_job is not None:
+            # Members of a refresh group share a tick aligned to their
+            # update interval, which is between half and one and a half
+            # intervals away
+            interval = self._effective_update_interval_seconds
+            self._unsub_refresh = event.async_call_at(
+                hass,
+                self._refresh_group_job,
+                loop.time() + interval / 2,
+                precision=interval,
+            )
+            return
+
         next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
+            int(loop.time())
+            + self._microsecond
+            + self._effective_update_interval_seconds
         )
         self._unsub_refresh = loop.call_at(
             next_refresh, self.__wrap_handle_refresh_interval
@@ -262,6 +495,11 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 eager_start=True,
             )
 
+    @callback
+    def _handle_refresh_group_tick(self, _now: datetime) -> None:
+        """Handle a tick of the refresh group."""
+        self.__wrap_handle_refresh_interval()
+
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
@@ -272,6 +510,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
         Refresh will wait a bit to see if it can batch them.
         """
+        self._async_adapt_update_interval(True)
         await self._debounced_refresh.async_call()
 
     async def _async_update_data(self) -> _DataT:
@@ -377,7 +616,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         previous_data = self.data
 
         try:
-            self.data = await self._async_update_data()
+            if self.refresh_group is None:
+                self.data = await self._async_update_data()
+            else:
+                self.data = await self.refresh_group.async_fetch(self)
 
         except (TimeoutError, requests.exceptions.Timeout) as err:
             self.last_exception = err
@@ -454,6 +696,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             if not self.last_update_success:
                 self.last_update_success = True
                 self.logger.info("Fetching %s data recovered", self.name)
+            if self._max_update_interval_seconds is not None:
+                changed = not previous_update_success or previous_data != self.data
+                # Only scheduled refreshes back off, refreshes that are
+                # requested right after a change may not see it yet
+                if changed or scheduled:
+                    self._async_adapt_update_interval(changed)
 
         finally:
             if log_timing:
@@ -502,12 +750,16 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._async_unsub_refresh()
         self._debounced_refresh.async_cancel()
 
+        previous_data = self.data
         self.data = data
         self.last_update_success = True
         self.logger.debug(
             "Manually updated %s data",
             self.name,
         )
+        # Only scheduled refreshes back off, pushed data can only reset it
+        if previous_data != data:
+            self._async_adapt_update_interval(True)
 
         if self._listeners:
             self._schedule_refresh()
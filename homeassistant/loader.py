@@ -133,6 +133,9 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_CACHED_MANIFESTS: HassKey[dict[str, tuple[Manifest, set[str]]]] = HassKey(
+    "cached_manifests"
+)
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -1322,6 +1325,53 @@ def _version_blocked(
     return True
 
 
+@callback
+def async_set_cached_manifests(
+    hass: HomeAssistant, manifests: dict[str, tuple[Manifest, set[str]]]
+) -> None:
+    """Set built-in manifests and top level files read on a previous start.
+
+    Built-in integrations found in the cache are resolved without reading
+    their manifest from disk.
+    """
+    hass.data[DATA_CACHED_MANIFESTS] = manifests
+
+
+@callback
+def async_get_cacheable_manifests(
+    hass: HomeAssistant,
+) -> dict[str, tuple[Manifest, set[str]]]:
+    """Return the manifests and top level files of loaded built-in integrations."""
+    return {
+        domain: (int_or_fut.manifest, int_or_fut._top_level_files)  # noqa: SLF001
+        for domain, int_or_fut in hass.data[DATA_INTEGRATIONS].items()
+        # Integration is never subclassed, so we can check for type
+        if type(int_or_fut) is Integration and int_or_fut.is_built_in
+    }
+
+
+def _resolve_integrations_from_cache(
+    hass: HomeAssistant, root_module: ModuleType, domains: Iterable[str]
+) -> dict[str, Integration]:
+    """Resolve multiple integrations from the cached manifests."""
+    if not (cached_manifests := hass.data.get(DATA_CACHED_MANIFESTS)):
+        return {}
+    base = pathlib.Path(root_module.__path__[0])
+    integrations: dict[str, Integration] = {}
+    for domain in domains:
+        if (cached := cached_manifests.get(domain)) is None:
+            continue
+        manifest, top_level_files = cached
+        integrations[domain] = Integration(
+            hass,
+            f"{root_module.__name__}.{domain}",
+            base / domain,
+            manifest,
+            top_level_files,
+        )
+    return integrations
+
+
 def _resolve_integrations_from_root(
     hass: HomeAssistant, root_module: ModuleType, domains: Iterable[str]
 ) -> dict[str, Integration]:
@@ -1415,9 +1465,15 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
-        integrations = await hass.async_add_executor_job(
-            _resolve_integrations_from_root, hass, components, needed
+        integrations: dict[str, Integration] = _resolve_integrations_from_cache(
+            hass, components, needed
         )
+        if not_cached := [domain for domain in needed if domain not in integrations]:
+            integrations.update(
+                await hass.async_add_executor_job(
+                    _resolve_integrations_from_root, hass, components, not_cached
+                )
+            )
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
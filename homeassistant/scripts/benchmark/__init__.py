@@ -7,6 +7,8 @@ import asyncio
 from collections.abc import Callable
 from contextlib import suppress
 import logging
+import os
+import time
 from timeit import default_timer as timer
 
 from homeassistant import core
@@ -308,3 +310,787 @@ async def json_serialize_states(hass: core.HomeAssistant) -> float:
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def mqtt_topic_matching(hass: core.HomeAssistant) -> float:
+    """Match 100k topics against a growing number of wildcard subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.mqtt.client import Subscription, SubscriptionTrie
+
+    job = core.HassJob(lambda msg: None)
+    messages = 10**5
+    total = 0.0
+
+    for subscription_count in (100, 1000, 3000):
+        trie = SubscriptionTrie()
+        for idx in range(subscription_count):
+            trie.add(Subscription(f"zigbee2mqtt/device{idx}/+", False, job))
+            trie.add(Subscription(f"tasmota/discovery/{idx}/#", False, job))
+        topics = [
+            f"zigbee2mqtt/device{idx % subscription_count}/state"
+            for idx in range(messages)
+        ]
+
+        start = timer()
+        for topic in topics:
+            trie.matches(topic)
+        runtime = timer() - start
+        total += runtime
+        print(
+            f"{subscription_count * 2} subscriptions: "
+            f"{messages / runtime:.0f} messages/sec"
+        )
+
+    return total
+
+
+@benchmark
+async def recorder_bulk_write(hass: core.HomeAssistant) -> float:
+    """Write 100k states in batches with the ORM and with the bulk writer.
+
+    Set RECORDER_BENCHMARK_DB_URL to run against a MariaDB or PostgreSQL
+    database instead of an in-memory SQLite database.
+    """
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.bulk_writer import BulkWriter
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+
+    db_url = os.environ.get("RECORDER_BENCHMARK_DB_URL", "sqlite://")
+    entities = 4000
+    batches = 25
+
+    def _run(bulk: bool) -> tuple[float, float]:
+        engine = create_engine(db_url)
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        bulk_writer = BulkWriter()
+        states_meta = [
+            StatesMeta(entity_id=f"sensor.power_{idx}") for idx in range(entities)
+        ]
+        attributes = StateAttributes(shared_attrs='{"unit_of_measurement":"W"}', hash=1)
+        previous: list[States | None] = [None] * entities
+        wall_start = timer()
+        cpu_start = time.thread_time()
+        with Session(engine, expire_on_commit=False) as session:
+            for batch in range(batches):
+                rows: list[object] = []
+                if batch == 0:
+                    rows.extend(states_meta)
+                    rows.append(attributes)
+                for idx in range(entities):
+                    db_state = States(
+                        state=str(batch),
+                        origin_idx=0,
+                        last_updated_ts=time.time(),
+                    )
+                    db_state.states_meta_rel = states_meta[idx]
+                    db_state.state_attributes = attributes
+                    db_state.old_state = previous[idx]
+                    previous[idx] = db_state
+                    rows.append(db_state)
+                if bulk:
+                    for row in rows:
+                        bulk_writer.add(row)
+                    bulk_writer.flush(session)
+                else:
+                    session.add_all(rows)
+                session.commit()
+        runtime = timer() - wall_start
+        cpu = time.thread_time() - cpu_start
+        engine.dispose()
+        return runtime, cpu
+
+    total = 0.0
+    for name, bulk in (("orm", False), ("bulk", True)):
+        runtime, cpu = await hass.async_add_executor_job(_run, bulk)
+        total += runtime
+        print(
+            f"{name}: {entities * batches / runtime:.0f} states/sec, "
+            f"{cpu:.2f}s thread CPU"
+        )
+
+    return total
+
+
+@benchmark
+async def sensor_state_buffer(hass: core.HomeAssistant) -> float:
+    """Fetch the states of a 5 minute period from the sensor state buffer."""
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+
+    from homeassistant.components.sensor.recorder import SensorStateBuffer
+    from homeassistant.util import dt as dt_util
+
+    attributes = {"state_class": "measurement", "unit_of_measurement": "W"}
+    period = timedelta(minutes=5)
+    total = 0.0
+
+    for sensor_count in (100, 1000, 5000):
+        entity_ids = [f"sensor.power_{idx}" for idx in range(sensor_count)]
+        for entity_id in entity_ids:
+            hass.states.async_remove(entity_id)
+        start = dt_util.utcnow()
+        start_ts = start.timestamp()
+        for entity_id in entity_ids:
+            hass.states.async_set(entity_id, "0", attributes, timestamp=start_ts - 1)
+        state_buffer = SensorStateBuffer(hass, None)
+        state_buffer.async_start()
+        # One state change every 10 seconds for two periods
+        for step in range(1, 60):
+            for entity_id in entity_ids:
+                hass.states.async_set(
+                    entity_id, str(step), attributes, timestamp=start_ts + step * 10
+                )
+        await hass.async_block_till_done()
+
+        bench_start = timer()
+        state_buffer.async_get_history(start, start + period, entity_ids, True)
+        state_buffer.async_get_history(
+            start + period, start + 2 * period, entity_ids, True
+        )
+        runtime = timer() - bench_start
+        state_buffer.async_stop()
+        total += runtime
+        print(f"{sensor_count} sensors: {runtime / 2 * 1000:.1f} ms per period")
+
+    return total
+
+
+@benchmark
+async def sensor_statistics_mean(hass: core.HomeAssistant) -> float:
+    """Compute mean, min and max of 5 minute windows with 10k states each."""
+    # pylint: disable=import-outside-toplevel
+    from datetime import timedelta
+
+    from homeassistant.components.sensor.recorder import (
+        _float_states_to_arrays,
+        _time_weighted_average_arrays,
+    )
+    from homeassistant.util import dt as dt_util
+
+    start = dt_util.utcnow()
+    end = start + timedelta(minutes=5)
+    fstates = [
+        (
+            float(idx % 100),
+            core.State(
+                "sensor.power",
+                str(idx % 100),
+                last_updated=start + timedelta(microseconds=idx * 30000),
+            ),
+        )
+        for idx in range(10**4)
+    ]
+    windows = 100
+
+    bench_start = timer()
+    for _ in range(windows):
+        values, timestamps = _float_states_to_arrays(fstates)
+        values.max()
+        values.min()
+        _time_weighted_average_arrays(values, timestamps, start, end)
+    runtime = timer() - bench_start
+    print(f"{runtime / windows * 1000:.2f} ms per window")
+    return runtime
+
+
+@benchmark
+async def recorder_state_attributes_cache(hass: core.HomeAssistant) -> float:
+    """Resolve rotating state attributes with and without the hash cache."""
+    # pylint: disable=import-outside-toplevel
+    from types import SimpleNamespace
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.const import DEFAULT_MAX_BIND_VARS
+    from homeassistant.components.recorder.db_schema import Base, StateAttributes
+    from homeassistant.components.recorder.table_managers.state_attributes import (
+        HASH_CACHE_MAX_BYTES,
+        StateAttributesManager,
+    )
+
+    # Media players and weather forecasts change their attributes with
+    # almost every state write, more than the LRU can hold
+    attribute_sets = 5000
+    writes = 20000
+
+    def _run(hash_cache_bytes: int) -> tuple[float, int]:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        recorder = SimpleNamespace(max_bind_vars=DEFAULT_MAX_BIND_VARS)
+        manager = StateAttributesManager(recorder)  # type: ignore[arg-type]
+        manager._hash_cache.max_bytes = hash_cache_bytes  # noqa: SLF001
+        shared_attrs = [
+            f'{{"media_position":{idx},"media_title":"Track {idx}"}}'
+            for idx in range(attribute_sets)
+        ]
+        hashes = [
+            StateAttributes.hash_shared_attrs_bytes(attrs.encode())
+            for attrs in shared_attrs
+        ]
+        with Session(engine) as session:
+            session.add_all(
+                StateAttributes(shared_attrs=attrs, hash=data_hash)
+                for attrs, data_hash in zip(shared_attrs, hashes, strict=True)
+            )
+            session.commit()
+            start = timer()
+            for idx in range(writes):
+                attrs_idx = (idx * 7) % attribute_sets
+                if manager.get_from_cache(shared_attrs[attrs_idx]) is None:
+                    manager.get(shared_attrs[attrs_idx], hashes[attrs_idx], session)
+            runtime = timer() - start
+        engine.dispose()
+        return runtime, manager.misses
+
+    total = 0.0
+    for name, hash_cache_bytes in (
+        ("lru only", 0),
+        ("hash cache", HASH_CACHE_MAX_BYTES),
+    ):
+        runtime, misses = await hass.async_add_executor_job(_run, hash_cache_bytes)
+        total += runtime
+        print(
+            f"{name}: {misses * 1000 / writes:.0f} database lookups "
+            f"per 1000 state writes"
+        )
+
+    return total
+
+
+@benchmark
+async def storage_journal(hass: core.HomeAssistant) -> float:
+    """Save single entity changes to a registry sized store."""
+    # pylint: disable=import-outside-toplevel
+    from tempfile import TemporaryDirectory
+
+    from homeassistant.helpers.json import json_bytes, json_fragment
+    from homeassistant.helpers.storage import Store
+
+    entities = 5000
+    updates = 200
+
+    def _entry(idx: int, name: str | None) -> json_fragment:
+        """Return an entry the way the entity registry caches it."""
+        return json_fragment(
+            json_bytes(
+                {
+                    "entity_id": f"sensor.entity_{idx}",
+                    "id": f"{idx:032x}",
+                    "name": name,
+                    "options": {"sensor": {"suggested_display_precision": 2}},
+                    "platform": "benchmark",
+                    "unique_id": f"unique_{idx}",
+                }
+            )
+        )
+
+    def _file_state(store: Store) -> tuple[int, int, int]:
+        stat = os.stat(store.path)
+        try:
+            journal_size = os.path.getsize(store.journal_path)
+        except FileNotFoundError:
+            journal_size = 0
+        return stat.st_ino, stat.st_size, journal_size
+
+    total = 0.0
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        for name, journal in (("full rewrite", False), ("journal", True)):
+            store: Store[dict] = Store(hass, 1, f"registry_{name}", journal=journal)
+            # The layout of core.entity_registry
+            data: dict[str, list[json_fragment]] = {
+                "entities": [_entry(idx, None) for idx in range(entities)],
+                "deleted_entities": [],
+            }
+            await store.async_save(data)
+            inode, _, journal_size = await hass.async_add_executor_job(
+                _file_state, store
+            )
+            written = 0
+            start = timer()
+            for idx in range(updates):
+                entry = idx * 7 % entities
+                data["entities"][entry] = _entry(entry, f"Name {idx}")
+                await store.async_save(data)
+                new_inode, size, new_journal_size = await hass.async_add_executor_job(
+                    _file_state, store
+                )
+                if new_inode != inode:
+                    written += size
+                written += new_journal_size - (
+                    journal_size if new_journal_size >= journal_size else 0
+                )
+                inode, journal_size = new_inode, new_journal_size
+            total += timer() - start
+            print(f"{name}: {written / updates:.0f} bytes written per update")
+
+    return total
+
+
+@benchmark
+async def state_machine_attribute_lookup(hass: core.HomeAssistant) -> float:
+    """Look up states by device class with and without an index."""
+    entities = 10000
+    lookups = 1000
+    device_classes = ("power", "energy", "temperature", "humidity", "voltage")
+
+    for idx in range(entities):
+        hass.states.async_set(
+            f"sensor.sensor_{idx}",
+            str(idx),
+            {
+                "device_class": device_classes[idx % len(device_classes)],
+                "unit_of_measurement": "W",
+            },
+        )
+
+    total = 0.0
+    for name in ("scan", "index"):
+        if name == "index":
+            hass.states.async_add_attribute_index("device_class")
+        start = timer()
+        for _ in range(lookups):
+            hass.states.async_all_with_attribute("device_class", "power")
+        runtime = timer() - start
+        total += runtime
+        print(f"{name}: {runtime * 1e6 / lookups:.1f}us per lookup")
+
+    return total
+
+
+@benchmark
+async def fire_events_many_listeners(hass: core.HomeAssistant) -> float:
+    """Fire events for single entities with 1k and 10k listeners."""
+    events_to_fire = 10**4
+    event_name = "benchmark_event"
+    count = 0
+
+    @core.callback
+    def listener(_):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    total = 0.0
+    for listeners in (1000, 10000):
+        entity_ids = [f"sensor.sensor_{idx}" for idx in range(listeners)]
+        for name in ("event_filter", "entity"):
+            unsubs = []
+            for entity_id in entity_ids:
+                if name == "entity":
+                    unsubs.append(
+                        hass.bus.async_listen_entity(event_name, entity_id, listener)
+                    )
+                    continue
+
+                @core.callback
+                def event_filter(event_data, entity_id=entity_id):
+                    """Filter events for the entity."""
+                    return event_data["entity_id"] == entity_id
+
+                unsubs.append(
+                    hass.bus.async_listen(
+                        event_name, listener, event_filter=event_filter
+                    )
+                )
+
+            start = timer()
+            for idx in range(events_to_fire):
+                hass.bus.async_fire(
+                    event_name, {"entity_id": entity_ids[idx % listeners]}
+                )
+            runtime = timer() - start
+            total += runtime
+            print(
+                f"{listeners} listeners with {name}: "
+                f"{events_to_fire / runtime:.0f} events per second"
+            )
+            for unsub in unsubs:
+                unsub()
+
+    assert count == events_to_fire * 4
+    return total
+
+
+@benchmark
+async def template_shared_compile(hass: core.HomeAssistant) -> float:
+    """Set up 5k MQTT style value templates with shared and unique sources."""
+    # pylint: disable=import-outside-toplevel
+    import tracemalloc
+
+    from homeassistant.helpers.template import Template
+
+    sensors = 5000
+    payload = '{"temperature": 21.5}'
+
+    total = 0.0
+    for name in ("unique", "shared"):
+        tracemalloc.start()
+        start = timer()
+        templates = []
+        for idx in range(sensors):
+            source = "{{ value_json.temperature }}"
+            if name == "unique":
+                source += f"{{# sensor {idx} #}}"
+            template = Template(source, hass)
+            template.async_render_with_possible_json_value(payload)
+            templates.append(template)
+        runtime = timer() - start
+        allocated = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        total += runtime
+        print(
+            f"{name}: {runtime:.3f}s and {allocated / 1024 / 1024:.1f}MiB"
+            f" for {sensors} templates"
+        )
+        del templates
+
+    return total
+
+
+@benchmark
+async def template_static_analysis(hass: core.HomeAssistant) -> float:
+    """Find the references of common real world templates without rendering."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.template import Template, analyze_template_references
+
+    corpus = (
+        "{{ states('sensor.outside_temperature') | float(0) }}",
+        "{{ is_state('binary_sensor.front_door', 'on') }}",
+        "{{ state_attr('climate.living_room', 'current_temperature') }}",
+        "{{ states.sensor.power.state | int(0) > 1000 }}",
+        "{{ (states('sensor.a') | float(0) + states('sensor.b') | float(0)) | round(1) }}",
+        "{{ states.light | selectattr('state', 'eq', 'on') | list | count }}",
+        "{{ states | selectattr('state', 'eq', 'unavailable') | list | count }}",
+        "{{ expand('group.downstairs') | selectattr('state', 'eq', 'on') | list }}",
+        "{{ ['light.a', 'light.b'] | select('is_state', 'on') | list | count }}",
+        "{{ now().hour >= 22 or now().hour < 6 }}",
+        "{{ (as_timestamp(now()) - as_timestamp(states.sun.sun.last_changed)) > 60 }}",
+        "{% if is_state('person.a', 'home') %}home{% else %}away{% endif %}",
+        "{{ 'on' if states('sensor.lux') | int(0) < 50 else 'off' }}",
+        "{{ this.state }}",
+        "{{ trigger.to_state.state }}",
+        "{{ value_json.temperature }}",
+    )
+    iterations = 1000
+
+    templates = [Template(source, hass) for source in corpus]
+    known = sum(
+        template.async_static_references() is not None for template in templates
+    )
+    start = timer()
+    for _ in range(iterations):
+        for source in corpus:
+            analyze_template_references.__wrapped__(source)
+    runtime = timer() - start
+    print(
+        f"{known} of {len(corpus)} templates have statically known references, "
+        f"{runtime * 1e6 / iterations / len(corpus):.1f}us per analysis"
+    )
+    return runtime
+
+
+@benchmark
+async def template_batch_renders(hass: core.HomeAssistant) -> float:
+    """Update 5 power meters feeding 200 template trackers with and without batching."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+    from homeassistant.helpers.template import Template
+
+    trackers = 200
+    updates = 100
+    meters = [f"sensor.power_{idx}" for idx in range(5)]
+    template_str = " + ".join(f"states('{meter}') | float(0)" for meter in meters)
+    results = 0
+
+    @core.callback
+    def listener(*_):
+        """Count results."""
+        nonlocal results
+        results += 1
+
+    total = 0.0
+    for batch_renders in (False, True):
+        unsubs = [
+            async_track_template_result(
+                hass,
+                [
+                    TrackTemplate(
+                        Template(f"{{{{ ({template_str}) * {idx} }}}}", hass), None
+                    )
+                ],
+                listener,
+                batch_renders=batch_renders,
+            ).async_remove
+            for idx in range(1, trackers + 1)
+        ]
+        results = 0
+        start = timer()
+        for update in range(updates):
+            for meter in meters:
+                hass.states.async_set(meter, str(update))
+            await hass.async_block_till_done()
+        runtime = timer() - start
+        total += runtime
+        print(
+            f"batch_renders={batch_renders}: {runtime * 1000 / updates:.2f}ms and"
+            f" {results / updates:.0f} results per update of {len(meters)} meters"
+        )
+        for unsub in unsubs:
+            unsub()
+
+    return total
+
+
+@benchmark
+async def template_fast_lane(hass: core.HomeAssistant) -> float:
+    """Render simple numeric templates with and without the fast lane."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    renders = 10**5
+    hass.states.async_set("sensor.power", "1234.5", {"phases": 3})
+    template_str = (
+        "{{ (states('sensor.power') | float(0) / state_attr('sensor.power',"
+        " 'phases')) | round(1) }}"
+    )
+
+    total = 0.0
+    for name in ("jinja", "fast_lane"):
+        template = Template(template_str, hass)
+        template.async_render()
+        if name == "jinja":
+            template._fast_lane = None  # noqa: SLF001
+        start = timer()
+        for _ in range(renders):
+            template.async_render()
+        runtime = timer() - start
+        total += runtime
+        print(f"{name}: {renders / runtime:.0f} renders per second")
+
+    return total
+
+
+@benchmark
+async def timer_wheel(hass: core.HomeAssistant) -> float:
+    """Run 10,000 timers spread over 1 second with and without a precision."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.event import async_call_later
+
+    timers = 10**4
+    calls = 0
+    loop = hass.loop
+
+    @core.callback
+    def action(*_):
+        """Count calls."""
+        nonlocal calls
+        calls += 1
+
+    total = 0.0
+    for precision in (None, 0.25):
+        calls = 0
+        handles_before = len(loop._scheduled)  # noqa: SLF001
+        start = timer()
+        for idx in range(timers):
+            async_call_later(hass, idx / timers, action, precision=precision)
+        runtime = timer() - start
+        total += runtime
+        handles = len(loop._scheduled) - handles_before  # noqa: SLF001
+        while calls < timers:
+            await asyncio.sleep(0.05)
+        print(
+            f"precision={precision}: {handles} loop timer handles,"
+            f" {runtime * 1000:.2f}ms to schedule"
+        )
+
+    return total
+
+
+@benchmark
+async def time_pattern_triggers(hass: core.HomeAssistant) -> float:
+    """Run 1,000 time pattern listeners matching every second for 3 seconds."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.event import async_track_utc_time_change
+
+    listeners = 1000
+    seconds = 3
+    calls = 0
+    loop = hass.loop
+
+    @core.callback
+    def action(*_):
+        """Count calls."""
+        nonlocal calls
+        calls += 1
+
+    handles_before = len(loop._scheduled)  # noqa: SLF001
+    unsubs = [
+        async_track_utc_time_change(hass, action, second="/1") for _ in range(listeners)
+    ]
+    handles = len(loop._scheduled) - handles_before  # noqa: SLF001
+    start = time.process_time()
+    await asyncio.sleep(seconds)
+    runtime = time.process_time() - start
+    print(
+        f"{handles} loop timer handles, {calls} calls,"
+        f" {runtime * 1000 / seconds:.2f}ms cpu per second"
+    )
+    for unsub in unsubs:
+        unsub()
+
+    return runtime
+
+
+@benchmark
+async def preimport_requirements(hass: core.HomeAssistant) -> float:
+    """Import the requirements of 150 integrations one by one and concurrently."""
+    # pylint: disable=import-outside-toplevel
+    import json
+    import pathlib
+    import subprocess
+    import sys
+
+    from homeassistant.helpers import importlib as importlib_helper
+    from homeassistant.util import package as pkg_util
+
+    integrations = 150
+
+    def _find_modules() -> list[str]:
+        """Return the modules of the first integrations with installed requirements."""
+        components = pathlib.Path(__file__).parents[2] / "components"
+        modules: dict[str, None] = {}
+        found = 0
+        for manifest_path in sorted(components.glob("*/manifest.json")):
+            manifest = json.loads(manifest_path.read_text())
+            if (
+                not (reqs := manifest.get("requirements"))
+                or not manifest.get("import_executor", True)
+                or not all(pkg_util.is_installed(req) for req in reqs)
+            ):
+                continue
+            for req in reqs:
+                modules.update(
+                    dict.fromkeys(importlib_helper._requirement_modules(req))  # noqa: SLF001
+                )
+            if (found := found + 1) == integrations:
+                break
+        return list(modules)
+
+    # Each run imports the modules in a new interpreter so nothing is
+    # imported yet, the disk cache is warm after the first run
+    code = (
+        "import sys, time\n"
+        "from homeassistant.helpers.importlib import _preimport_modules\n"
+        "start = time.perf_counter()\n"
+        "_preimport_modules(sys.argv[2:], int(sys.argv[1]))\n"
+        "print(time.perf_counter() - start)\n"
+    )
+
+    def _run(workers: int, modules: list[str]) -> float:
+        """Import the modules in a new interpreter."""
+        result = subprocess.run(
+            [sys.executable, "-c", code, str(workers), *modules],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        return float(result.stdout.split()[-1])
+
+    modules = await hass.async_add_executor_job(_find_modules)
+    print(f"Importing {len(modules)} modules")
+    total = 0.0
+    for workers in (1, importlib_helper.PREIMPORT_WORKERS) * 2:
+        runtime = await hass.async_add_executor_job(_run, workers, modules)
+        total += runtime
+        print(f"workers={workers}: {runtime * 1000:.0f}ms")
+
+    return total
+
+
+def _translated_components(limit: int) -> set[str]:
+    """Return the first built-in integrations with translations."""
+    # pylint: disable-next=import-outside-toplevel
+    import pathlib
+
+    components = pathlib.Path(__file__).parents[2] / "components"
+    return {
+        path.parent.parent.name
+        for path in sorted(components.glob("*/translations/en.json"))[:limit]
+    }
+
+
+@benchmark
+async def translations_memory(hass: core.HomeAssistant) -> float:
+    """Load the translations of 200 integrations in 5 languages."""
+    # pylint: disable=import-outside-toplevel
+    import tracemalloc
+
+    from homeassistant import loader
+    from homeassistant.helpers import translation
+
+    loader.async_setup(hass)
+    components = await hass.async_add_executor_job(_translated_components, 200)
+    languages = ("en", "de", "fr", "nl", "es")
+    categories = ("entity", "entity_component", "exceptions", "title")
+
+    tracemalloc.start()
+    start = timer()
+    for language in languages:
+        for category in categories:
+            await translation.async_get_translations(
+                hass, language, category, components
+            )
+    runtime = timer() - start
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(
+        f"{allocated / 1024 / 1024:.1f}MiB for {len(components)} integrations"
+        f" in {len(languages)} languages"
+    )
+    return runtime
+
+
+@benchmark
+async def translations_get_latency(hass: core.HomeAssistant) -> float:
+    """Fetch translations like frontend/get_translations does."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import loader
+    from homeassistant.helpers import translation
+
+    loader.async_setup(hass)
+    components = await hass.async_add_executor_job(_translated_components, 200)
+    hass.config.components.update(components)
+    categories = ("entity", "entity_component", "exceptions", "title", "services")
+    requests = 100
+
+    total = 0.0
+    for language in ("en", "de"):
+        start = timer()
+        for category in categories:
+            await translation.async_get_translations(hass, language, category)
+        cold = timer() - start
+
+        start = timer()
+        for _ in range(requests):
+            for category in categories:
+                await translation.async_get_translations(hass, language, category)
+        warm = (timer() - start) / requests
+        total += cold + warm * requests
+        print(
+            f"{language}: cold {cold * 1000:.1f}ms,"
+            f" warm {warm * 1000:.2f}ms for {len(categories)} categories"
+        )
+
+    return total
@@ -0,0 +1,96 @@
+"""Script to report the time spent in each phase of starting Home Assistant."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import defaultdict
+from collections.abc import Sequence
+import os
+from timeit import default_timer as timer
+
+from homeassistant import bootstrap, runner
+from homeassistant.config import get_default_config_dir
+from homeassistant.helpers.startup_cache import DATA_STARTUP_CACHE
+from homeassistant.setup import (
+    SetupPhases,
+    async_get_domain_setup_times,
+    async_get_setup_timings,
+)
+
+# mypy: allow-untyped-calls, allow-untyped-defs
+
+LOG_FILENAME = "startup_timings.log"
+
+
+def run(args: Sequence[str] | None) -> int:
+    """Handle startup timings commandline script."""
+    parser = argparse.ArgumentParser(
+        description=(
+            "Start Home Assistant, report the time spent in each setup phase"
+            " and stop. Run it twice to compare a cold and a warm start."
+        )
+    )
+    parser.add_argument("--script", choices=["startup_timings"])
+    parser.add_argument(
+        "-c",
+        "--config",
+        default=get_default_config_dir(),
+        help="Directory that contains the Home Assistant configuration",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="Number of slowest integrations to report",
+    )
+    parser.add_argument(
+        "--skip-pip", action="store_true", help="Skips pip install of required packages"
+    )
+
+    asyncio.set_event_loop_policy(runner.HassEventLoopPolicy(False))
+    return asyncio.run(async_run(parser.parse_args(args)))
+
+
+async def async_run(args: argparse.Namespace) -> int:
+    """Start Home Assistant and report the setup timings."""
+    config_dir = os.path.join(os.getcwd(), args.config)
+    runtime_config = runner.RuntimeConfig(
+        config_dir=config_dir,
+        skip_pip=args.skip_pip,
+        log_file=os.path.join(config_dir, LOG_FILENAME),
+    )
+
+    start = timer()
+    if (hass := await bootstrap.async_setup_hass(runtime_config)) is None:
+        print("Unable to set up Home Assistant")
+        return 1
+    bootstrap_time = timer() - start
+
+    cache = hass.data.get(DATA_STARTUP_CACHE)
+    print("Startup cache:", "loaded" if cache and cache.loaded else "not loaded")
+    print(f"Bootstrap: {bootstrap_time:.3f}s")
+
+    setup_timings = async_get_setup_timings(hass)
+    phase_totals: defaultdict[SetupPhases, float] = defaultdict(float)
+    for domain in setup_timings:
+        for group_timings in async_get_domain_setup_times(hass, domain).values():
+            for phase, duration in group_timings.items():
+                phase_totals[phase] += duration
+
+    print()
+    print("Time per setup phase, summed over all integrations:")
+    for phase, duration in sorted(
+        phase_totals.items(), key=lambda item: item[1], reverse=True
+    ):
+        print(f"  {phase}: {duration:.3f}s")
+
+    print()
+    print(f"Slowest {args.limit} of {len(setup_timings)} integrations:")
+    for domain, duration in sorted(
+        setup_timings.items(), key=lambda item: item[1], reverse=True
+    )[: args.limit]:
+        print(f"  {domain}: {duration:.3f}s")
+
+    await hass.async_stop()
+    return 0
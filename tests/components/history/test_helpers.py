@@ -0,0 +1,55 @@
+"""The tests for the history helpers."""
+
+import pytest
+
+from homeassistant.components.history.helpers import (
+    downsample_compressed_states,
+    largest_triangle_three_buckets,
+)
+
+
+def test_largest_triangle_three_buckets() -> None:
+    """Test the largest triangle three buckets downsampling."""
+    x = [float(idx) for idx in range(7)]
+    y = [0.0, 1.0, 0.0, 10.0, 0.0, 1.0, 0.0]
+
+    assert largest_triangle_three_buckets(x, y, 10) == list(range(7))
+    assert largest_triangle_three_buckets(x, y, 2) == [0, 6]
+    # The peak is always kept
+    assert 3 in largest_triangle_three_buckets(x, y, 3)
+    indices = largest_triangle_three_buckets(x, y, 4)
+    assert len(indices) == 4
+    assert indices[0] == 0
+    assert indices[-1] == 6
+
+
+@pytest.mark.parametrize("max_points", [2, 10, 100])
+def test_downsample_compressed_states(max_points: int) -> None:
+    """Test downsampling keeps non-numeric states and the series bounds."""
+    states = [{"s": str(idx % 7), "lu": float(idx)} for idx in range(1000)]
+    states[500] = {"s": "unavailable", "lu": 500.0}
+    non_numeric = [{"s": "on", "lu": float(idx)} for idx in range(1000)]
+
+    result = downsample_compressed_states(
+        {"sensor.power": states, "switch.power": non_numeric}, max_points
+    )
+
+    downsampled = result["sensor.power"]
+    assert len(downsampled) <= max(max_points, 5)
+    assert downsampled[0] is states[0]
+    assert downsampled[-1] is states[-1]
+    assert states[499] in downsampled
+    assert states[500] in downsampled
+    assert states[501] in downsampled
+    timestamps = [state["lu"] for state in downsampled]
+    assert timestamps == sorted(timestamps)
+    # Non-numeric entities are never downsampled
+    assert result["switch.power"] is non_numeric
+
+
+def test_downsample_compressed_states_below_max_points() -> None:
+    """Test states are returned unchanged when there are few enough."""
+    states = [{"s": str(idx), "lu": float(idx)} for idx in range(10)]
+    assert downsample_compressed_states({"sensor.power": states}, 10) == {
+        "sensor.power": states
+    }
@@ -173,6 +173,46 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_max_points(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples numeric entities."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    for value in range(20):
+        hass.states.async_set("sensor.power", str(value % 5))
+        hass.states.async_set("switch.power", "on" if value % 2 else "off")
+        await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.power", "unavailable")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.power", "switch.power"],
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "max_points": 5,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    sensor_history = response["result"]["sensor.power"]
+    assert len(sensor_history) == 5
+    assert sensor_history[0]["s"] == "0"
+    assert sensor_history[-1]["s"] == "unavailable"
+    assert len(response["result"]["switch.power"]) == 20
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -543,6 +583,113 @@ async def test_history_stream_historical_only(
     }
 
 
+async def test_history_stream_historical_only_per_entity(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream sending a message per entity."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    sensor_one_last_updated_timestamp = hass.states.get(
+        "sensor.one"
+    ).last_updated_timestamp
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.two", "off", attributes={"any": "attr"})
+    sensor_two_last_updated_timestamp = hass.states.get(
+        "sensor.two"
+    ).last_updated_timestamp
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "start_time": now.isoformat(),
+            "end_time": end_time.isoformat(),
+            "include_start_time_state": True,
+            "significant_changes_only": False,
+            "no_attributes": True,
+            "minimal_response": True,
+            "stream_per_entity": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["id"] == 1
+    assert response["type"] == "result"
+
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "end_time": pytest.approx(sensor_one_last_updated_timestamp),
+            "start_time": pytest.approx(now.timestamp()),
+            "states": {
+                "sensor.one": [
+                    {"lu": pytest.approx(sensor_one_last_updated_timestamp), "s": "on"}
+                ],
+            },
+        },
+        "id": 1,
+        "type": "event",
+    }
+
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "end_time": pytest.approx(sensor_two_last_updated_timestamp),
+            "start_time": pytest.approx(now.timestamp()),
+            "states": {
+                "sensor.two": [
+                    {"lu": pytest.approx(sensor_two_last_updated_timestamp), "s": "off"}
+                ],
+            },
+        },
+        "id": 1,
+        "type": "event",
+    }
+
+
+async def test_history_stream_per_entity_no_states(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history stream per entity sends an empty message without states."""
+    await async_setup_component(hass, "history", {})
+    await async_wait_recording_done(hass)
+    now = dt_util.utcnow()
+    start_time = now - timedelta(seconds=10)
+    end_time = now - timedelta(seconds=5)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 1,
+            "type": "history/stream",
+            "entity_ids": ["sensor.never_recorded"],
+            "start_time": start_time.isoformat(),
+            "end_time": end_time.isoformat(),
+            "stream_per_entity": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    response = await client.receive_json()
+    assert response == {
+        "event": {
+            "end_time": pytest.approx(end_time.timestamp()),
+            "start_time": pytest.approx(start_time.timestamp()),
+            "states": {},
+        },
+        "id": 1,
+        "type": "event",
+    }
+
+
 async def test_history_stream_significant_domain_historical_only(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
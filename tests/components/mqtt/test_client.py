@@ -13,7 +13,11 @@ import paho.mqtt.client as paho_mqtt
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -23,7 +27,13 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     UnitOfTemperature,
 )
-from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    CoreState,
+    HassJob,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.util.dt import utcnow
 
@@ -2170,3 +2180,93 @@ async def test_loop_write_failure(
     await hass.async_block_till_done()
 
     assert "Disconnected from MQTT server test-broker:1883" in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("topic", "expected"),
+    [
+        ("a", ["#", "+", "a/#"]),
+        ("a/b", ["#", "a/#", "a/+", "+/b/#", "+/+", "a/b/#"]),
+        ("a/b/c", ["#", "a/#", "a/+/c", "+/b/#", "a/b/c", "a/b/#"]),
+        ("a/b/c/d", ["#", "a/#", "+/b/#", "a/b/#"]),
+        ("/x", ["#", "+/+", "/+"]),
+        ("$SYS/x", ["$SYS/#"]),
+        ("$SYS/y/x", ["$SYS/#", "$SYS/+/x"]),
+        ("$SYS", ["$SYS/#"]),
+    ],
+)
+def test_subscription_trie_matches(topic: str, expected: list[str]) -> None:
+    """Test the subscription trie matches topics in subscription order."""
+    trie = SubscriptionTrie()
+    for topic_filter in (
+        "#",
+        "+",
+        "a/#",
+        "a/+",
+        "a/+/c",
+        "+/b/#",
+        "$SYS/#",
+        "$SYS/+/x",
+        "a/b/c",
+        "+/+",
+        "a/#/b",
+        "/+",
+        "a/b/#",
+    ):
+        trie.add(Subscription(topic_filter, False, HassJob(lambda msg: None)))
+
+    assert [subscription.topic for subscription in trie.matches(topic)] == expected
+
+
+def test_subscription_trie_remove() -> None:
+    """Test removing subscriptions from the subscription trie."""
+    trie = SubscriptionTrie()
+    sub1 = Subscription("a/+/c", False, HassJob(lambda msg: None))
+    sub2 = Subscription("a/+/c", False, HassJob(lambda msg: None))
+    sub3 = Subscription("a/#", False, HassJob(lambda msg: None))
+    for subscription in (sub1, sub2, sub3):
+        trie.add(subscription)
+
+    assert trie.matches("a/b/c") == [sub1, sub2, sub3]
+    assert trie.has_filter("a/+/c")
+
+    trie.remove(sub1)
+    assert trie.matches("a/b/c") == [sub2, sub3]
+    assert trie.has_filter("a/+/c")
+
+    trie.remove(sub2)
+    assert trie.matches("a/b/c") == [sub3]
+    assert not trie.has_filter("a/+/c")
+    assert not trie.has_filter("a/+")
+
+    with pytest.raises(KeyError):
+        trie.remove(sub2)
+
+    trie.remove(sub3)
+    assert trie.matches("a/b/c") == []
+    assert not trie.has_filter("a/#")
+
+
+async def test_subscribe_many_wildcard_topics(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test messages are routed to matching wildcard subscriptions only."""
+    await mqtt_mock_entry()
+    unsubs = [
+        await mqtt.async_subscribe(hass, f"zigbee2mqtt/device{idx}/+", record_calls)
+        for idx in range(100)
+    ]
+    await mqtt.async_subscribe(hass, "zigbee2mqtt/#", record_calls)
+
+    async_fire_mqtt_message(hass, "zigbee2mqtt/device42/state", "on")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 2
+
+    unsubs[42]()
+    async_fire_mqtt_message(hass, "zigbee2mqtt/device42/state", "off")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 3
+    assert recorded_calls[2].payload == "off"
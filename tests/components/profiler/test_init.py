@@ -1,7 +1,7 @@
 """Test the Profiler config flow."""
 
 from datetime import timedelta
-from functools import lru_cache
+from functools import lru_cache, partial
 import logging
 import os
 from pathlib import Path
@@ -31,12 +31,19 @@ from homeassistant.components.profiler import (
     SERVICE_STOP_LOG_OBJECTS,
 )
 from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.components.profiler.job_profiler import JobProfiler
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HassJob, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.setup import async_setup_component
 from homeassistant.util import dt as dt_util
 
-from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    get_system_health_info,
+)
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -447,3 +454,65 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+@callback
+def _slow_callback(calls: list[int]) -> None:
+    """Record a call."""
+    calls.append(1)
+
+
+async def test_job_stats(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test callback jobs are sampled and reported."""
+    assert await async_setup_component(hass, "system_health", {})
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    with patch(
+        "homeassistant.components.profiler.JobProfiler", partial(JobProfiler, 1)
+    ):
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    calls: list[int] = []
+    job = HassJob(_slow_callback)
+    with patch(
+        "homeassistant.components.profiler.job_profiler.perf_counter",
+        side_effect=[0, 0.2, 1, 1.00001],
+    ):
+        hass.async_run_hass_job(job, calls)
+        hass.async_run_hass_job(job, calls)
+    assert calls == [1, 1]
+    assert (
+        "Callback tests.components.profiler.test_init._slow_callback from"
+        " integration homeassistant blocked the event loop for 0.200 seconds"
+    ) in caplog.text
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/job_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["sample_rate"] == 1
+    stats = response["result"]["jobs"][0]
+    assert stats["function"] == "tests.components.profiler.test_init._slow_callback"
+    assert stats["samples"] == 2
+    assert stats["slow"] == 1
+    assert stats["max"] == pytest.approx(0.2)
+    assert stats["buckets"]["0.0001"] == 1
+    assert stats["buckets"]["0.5"] == 1
+
+    info = await get_system_health_info(hass, DOMAIN)
+    assert info["slow_callbacks"] == 1
+    assert info["slowest_callback"] == (
+        "tests.components.profiler.test_init._slow_callback"
+    )
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    calls.clear()
+    hass.async_run_hass_job(job, calls)
+    assert calls == [1]
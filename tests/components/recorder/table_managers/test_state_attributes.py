@@ -0,0 +1,78 @@
+"""The tests for the state attributes table manager."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+from homeassistant.components.recorder.table_managers.state_attributes import (
+    HASH_CACHE_ENTRY_OVERHEAD,
+    StateAttributesHashCache,
+)
+from homeassistant.core import HomeAssistant
+
+from ..common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceGenerator
+
+
+def test_hash_cache_memory_budget() -> None:
+    """Test the hash cache evicts the least recently used entries over budget."""
+    entry_size = len('{"a":1}') + HASH_CACHE_ENTRY_OVERHEAD
+    hash_cache = StateAttributesHashCache(2 * entry_size)
+
+    hash_cache.add('{"a":1}', 1, 10)
+    hash_cache.add('{"a":2}', 2, 20)
+    assert len(hash_cache) == 2
+    assert hash_cache.size_bytes == 2 * entry_size
+    assert hash_cache.evictions == 0
+
+    hash_cache.add('{"a":3}', 3, 30)
+    assert len(hash_cache) == 2
+    assert hash_cache.evictions == 1
+    assert hash_cache.pop('{"a":1}', 1) is None
+
+    # A hash collision is not a match
+    assert hash_cache.pop('{"b":2}', 2) is None
+    assert hash_cache.pop('{"a":2}', 2) == 20
+    assert hash_cache.size_bytes == entry_size
+
+    hash_cache.evict_ids({30})
+    assert len(hash_cache) == 0
+    assert hash_cache.size_bytes == 0
+
+
+async def test_evicted_attributes_are_resolved_without_database(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test attributes evicted from the LRU are resolved from the hash cache."""
+    with (
+        patch(
+            "homeassistant.components.recorder.table_managers.state_attributes.CACHE_SIZE",
+            1,
+        ),
+        patch(
+            "homeassistant.components.recorder.core.Recorder._adjust_lru_size",
+        ),
+    ):
+        instance = await async_setup_recorder_instance(hass)
+        manager = instance.state_attributes_manager
+
+        hass.states.async_set("sensor.test", "1", {"forecast": 1})
+        await async_wait_recording_done(hass)
+        hass.states.async_set("sensor.test", "2", {"forecast": 2})
+        await async_wait_recording_done(hass)
+        misses = manager.misses
+        hits = manager.hits
+
+        for state in range(3, 9):
+            hass.states.async_set(
+                "sensor.test", str(state), {"forecast": 1 + state % 2}
+            )
+            await async_wait_recording_done(hass)
+
+        assert manager.misses == misses
+        assert manager.hits > hits
+        stats = manager.cache_stats
+        assert stats["lru_entries"] == 1
+        assert stats["hash_cache_entries"] == 1
+        assert stats["evictions"] == 0
@@ -0,0 +1,246 @@
+"""The tests for the recorder bulk writer."""
+
+from __future__ import annotations
+
+from itertools import pairwise
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from homeassistant.components.recorder import CONF_BULK_WRITE, CONF_COMMIT_INTERVAL
+from homeassistant.components.recorder.bulk_writer import BulkWriter
+from homeassistant.components.recorder.core import Recorder
+from homeassistant.components.recorder.db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from .common import async_wait_recording_done
+
+from tests.typing import RecorderInstanceContextManager
+
+
+@pytest.fixture
+async def mock_recorder_before_hass(
+    async_test_recorder: RecorderInstanceContextManager,
+) -> None:
+    """Set up recorder."""
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_BULK_WRITE: True}])
+async def test_bulk_write_states_and_events(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test states and events are written by the bulk writer."""
+    assert recorder_mock._bulk_writer is not None
+
+    hass.states.async_set("sensor.power", "1", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.power", "2", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.power", "3", {"unit_of_measurement": "kW"})
+    hass.states.async_set("sensor.energy", "10", {"unit_of_measurement": "kWh"})
+    hass.bus.async_fire("bulk_event", {"a": 1})
+    hass.bus.async_fire("bulk_event", {"a": 1})
+    hass.bus.async_fire("bulk_event")
+    await async_wait_recording_done(hass)
+
+    hass.states.async_set("sensor.power", "4", {"unit_of_measurement": "W"})
+    await async_wait_recording_done(hass)
+
+    assert not recorder_mock._bulk_writer.has_pending_writes
+
+    with session_scope(hass=hass, read_only=True) as session:
+        metadata_id = (
+            session.query(StatesMeta.metadata_id)
+            .filter(StatesMeta.entity_id == "sensor.power")
+            .scalar()
+        )
+        db_states = (
+            session.query(States)
+            .filter(States.metadata_id == metadata_id)
+            .order_by(States.state_id)
+            .all()
+        )
+        assert [db_state.state for db_state in db_states] == ["1", "2", "3", "4"]
+        assert db_states[0].old_state_id is None
+        for older, newer in pairwise(db_states):
+            assert newer.old_state_id == older.state_id
+        # Identical attributes are shared
+        assert db_states[0].attributes_id == db_states[1].attributes_id
+        assert db_states[0].attributes_id == db_states[3].attributes_id
+        assert db_states[0].attributes_id != db_states[2].attributes_id
+
+        event_type_id = (
+            session.query(EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "bulk_event")
+            .scalar()
+        )
+        db_events = (
+            session.query(Events)
+            .filter(Events.event_type_id == event_type_id)
+            .order_by(Events.event_id)
+            .all()
+        )
+        assert len(db_events) == 3
+        assert db_events[0].data_id == db_events[1].data_id
+        assert db_events[2].data_id is None
+        shared_data = (
+            session.query(EventData.shared_data)
+            .filter(EventData.data_id == db_events[0].data_id)
+            .scalar()
+        )
+        assert shared_data == '{"a":1}'
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{CONF_BULK_WRITE: True, CONF_COMMIT_INTERVAL: 0}]
+)
+async def test_bulk_write_commit_interval_zero(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the bulk writer links old states across commits."""
+    for state in ("on", "off", "on"):
+        hass.states.async_set("light.kitchen", state)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = session.query(States).order_by(States.state_id).all()
+        assert [db_state.state for db_state in db_states] == ["on", "off", "on"]
+        assert db_states[1].old_state_id == db_states[0].state_id
+        assert db_states[2].old_state_id == db_states[1].state_id
+
+
+async def test_bulk_write_disabled_when_unsupported(
+    hass: HomeAssistant,
+    async_test_recorder: RecorderInstanceContextManager,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the bulk writer is disabled if the database lacks support."""
+    with patch(
+        "sqlalchemy.engine.default.DefaultDialect.insert_executemany_returning_sort_by_parameter_order",
+        False,
+    ):
+        async with async_test_recorder(hass, {CONF_BULK_WRITE: True}) as instance:
+            assert instance._bulk_writer is None
+            assert instance.bulk_write is False
+
+            hass.states.async_set("light.kitchen", "on")
+            await async_wait_recording_done(hass)
+
+            with session_scope(hass=hass, read_only=True) as session:
+                assert session.query(States).count() == 1
+
+    assert "bulk writing is disabled" in caplog.text
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_BULK_WRITE: True}])
+async def test_bulk_write_retried_after_failed_commit(
+    hass: HomeAssistant, recorder_mock: Recorder, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the rows of a batch are written again when the commit fails."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    await async_wait_recording_done(hass)
+
+    session = recorder_mock.event_session
+    commit = session.commit
+    calls = 0
+
+    def _fail_first_commit() -> None:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            # A failed commit rolls back the transaction
+            session.rollback()
+            raise OperationalError("commit", {}, Exception("forced to fail"))
+        commit()
+
+    with (
+        patch("time.sleep"),
+        patch.object(session, "commit", side_effect=_fail_first_commit),
+    ):
+        hass.states.async_set("light.kitchen", "off", {"brightness": 0})
+        hass.states.async_set("light.bedroom", "on", {"brightness": 50})
+        hass.bus.async_fire("bulk_event", {"a": 1})
+        await async_wait_recording_done(hass)
+
+    assert "Error executing query" in caplog.text
+    assert not recorder_mock._bulk_writer.has_pending_writes
+
+    hass.states.async_set("light.kitchen", "on", {"brightness": 0})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = session.query(States).order_by(States.state_id).all()
+        assert len(db_states) == 4
+        states_meta = {
+            db_states_meta.metadata_id: db_states_meta.entity_id
+            for db_states_meta in session.query(StatesMeta)
+        }
+        assert sorted(states_meta.values()) == ["light.bedroom", "light.kitchen"]
+        kitchen = [
+            db_state
+            for db_state in db_states
+            if states_meta[db_state.metadata_id] == "light.kitchen"
+        ]
+        assert [db_state.state for db_state in kitchen] == ["on", "off", "on"]
+        assert kitchen[1].old_state_id == kitchen[0].state_id
+        assert kitchen[2].old_state_id == kitchen[1].state_id
+        # The attributes written with the retried commit are reused
+        assert kitchen[1].attributes_id == kitchen[2].attributes_id
+        assert kitchen[1].attributes_id is not None
+        assert (
+            session.query(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "bulk_event")
+            .count()
+            == 1
+        )
+
+
+def test_bulk_writer_rejects_unknown_objects() -> None:
+    """Test the bulk writer only accepts recorder rows it knows how to write."""
+    bulk_writer = BulkWriter()
+    bulk_writer.add(States(state="on"))
+    assert bulk_writer.has_pending_writes
+
+    with pytest.raises(TypeError):
+        bulk_writer.add(object())
+
+    bulk_writer.clear()
+    assert not bulk_writer.has_pending_writes
+
+
+@pytest.mark.parametrize(
+    "recorder_config", [{CONF_BULK_WRITE: True}, {CONF_BULK_WRITE: False}]
+)
+async def test_write_state_linked_to_unwritten_pending_state(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test a state linked to a pending state that was not added is written.
+
+    A state whose attributes fail to serialize is pending as the old state
+    of its entity but never added for writing.
+    """
+    hass.states.async_set("light.kitchen", "on")
+    with patch.object(
+        recorder_mock.state_attributes_manager,
+        "serialize_from_event",
+        return_value=None,
+    ):
+        hass.states.async_set("light.kitchen", "off")
+        await async_wait_recording_done(hass)
+    hass.states.async_set("light.kitchen", "on")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = session.query(States).order_by(States.state_id).all()
+        states = {db_state.state: db_state for db_state in db_states}
+        assert len(db_states) == 3
+        assert states["off"].old_state_id == db_states[0].state_id
+        assert db_states[-1].state == "on"
+        assert db_states[-1].old_state_id == states["off"].state_id
@@ -443,6 +443,40 @@ async def test_get_significant_states(hass: HomeAssistant) -> None:
     assert_dict_of_states_equal_without_context_and_last_changed(states, hist)
 
 
+@pytest.mark.parametrize("minimal_response", [True, False])
+async def test_stream_significant_states_with_session(
+    hass: HomeAssistant, minimal_response: bool
+) -> None:
+    """Test streaming significant states matches the non-streamed result."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+    entity_ids = list(states)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        expected = history.get_significant_states_with_session(
+            hass,
+            session,
+            zero,
+            four,
+            entity_ids,
+            minimal_response=minimal_response,
+            compressed_state_format=True,
+        )
+        streamed = list(
+            history.stream_significant_states_with_session(
+                hass,
+                session,
+                zero,
+                four,
+                entity_ids,
+                minimal_response=minimal_response,
+            )
+        )
+
+    assert len(streamed) == len(expected)
+    assert dict(streamed) == expected
+
+
 async def test_get_significant_states_minimal_response(
     hass: HomeAssistant,
 ) -> None:
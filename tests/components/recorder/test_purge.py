@@ -25,7 +25,7 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import PurgeProgress, purge_old_data
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -223,6 +223,69 @@ async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) ->
         assert state_attributes.count() == 3
 
 
+async def test_purge_old_states_time_boxed(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test a time boxed purge stops after each batch and reports progress."""
+    await _add_test_states(hass)
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    progress = PurgeProgress(purge_before)
+
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 1),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 1),
+    ):
+        finished = purge_old_data(
+            recorder_mock,
+            purge_before,
+            repack=False,
+            max_duration=0,
+            progress=progress,
+        )
+        assert not finished
+        assert progress.states == 1
+        assert progress.chunks == 1
+        assert not progress.finished
+
+        with session_scope(hass=hass) as session:
+            assert session.query(States).count() == 5
+
+        for _ in range(10):
+            if purge_old_data(
+                recorder_mock,
+                purge_before,
+                repack=False,
+                max_duration=0,
+                progress=progress,
+            ):
+                break
+
+    assert progress.finished
+    assert progress.states == 4
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 2
+
+
+async def test_purge_service_reports_progress(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test the purge service keeps track of the purge progress."""
+    assert recorder_mock.purge_progress is None
+    await _add_test_states(hass)
+
+    await hass.services.async_call(RECORDER_DOMAIN, SERVICE_PURGE, {"keep_days": 4})
+    await hass.async_block_till_done()
+
+    await async_recorder_block_till_done(hass)
+    await async_wait_purge_done(hass)
+
+    progress = recorder_mock.purge_progress
+    assert progress is not None
+    assert progress.finished
+    assert progress.states == 4
+    assert progress.as_dict()["states_purged"] == 4
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("recorder_mock", "skip_by_db_engine")
 async def test_purge_old_states_encouters_database_corruption(
@@ -2564,7 +2564,16 @@ async def test_recorder_info(
         "max_backlog": 65000,
         "migration_in_progress": False,
         "migration_is_live": False,
+        "purge_progress": None,
         "recording": True,
+        "state_attributes_cache": {
+            "hits": ANY,
+            "misses": ANY,
+            "evictions": 0,
+            "lru_entries": ANY,
+            "hash_cache_entries": 0,
+            "hash_cache_bytes": 0,
+        },
         "thread_running": True,
     }
 
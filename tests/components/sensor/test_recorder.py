@@ -3,6 +3,7 @@
 from collections.abc import Iterable
 from datetime import datetime, timedelta
 import math
+import random
 from statistics import mean
 from typing import Any, Literal
 from unittest.mock import ANY, patch
@@ -35,8 +36,18 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
-from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    DOMAIN,
+    SensorDeviceClass,
+    SensorStateClass,
+    recorder as sensor_recorder,
+)
+from homeassistant.const import (
+    ATTR_FRIENDLY_NAME,
+    EVENT_STATE_CHANGED,
+    STATE_UNAVAILABLE,
+)
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.setup import async_setup_component
@@ -306,6 +317,248 @@ async def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+async def test_compile_hourly_statistics_min_max_without_mean(
+    hass: HomeAssistant,
+) -> None:
+    """Test min and max are compiled when the mean is not wanted."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+    attributes = {
+        "device_class": "temperature",
+        "state_class": "measurement",
+        "unit_of_measurement": "°C",
+    }
+    with freeze_time(zero) as freezer:
+        await async_record_states(hass, freezer, zero, "sensor.test1", attributes)
+    await async_wait_recording_done(hass)
+
+    with patch.dict(
+        sensor_recorder.DEFAULT_STATISTICS,
+        {SensorStateClass.MEASUREMENT: {"min", "max"}},
+    ):
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": None,
+                "min": pytest.approx(-10),
+                "max": pytest.approx(30),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ]
+    }
+
+
+async def test_compile_statistics_from_state_buffer(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test short term statistics are compiled from the state buffer."""
+    zero = get_start_time(dt_util.utcnow())
+    await async_setup_component(hass, "sensor", {})
+    # Wait for the sensor recorder platform to be added
+    await async_recorder_block_till_done(hass)
+
+    freezer.move_to(zero + timedelta(minutes=1))
+    hass.states.async_set("sensor.test1", "10", POWER_SENSOR_ATTRIBUTES)
+    hass.states.async_set("sensor.test2", "100", ENERGY_SENSOR_ATTRIBUTES)
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        history,
+        "get_full_significant_states_with_session",
+        wraps=history.get_full_significant_states_with_session,
+    ) as get_history_mock:
+        # The buffer is started by the first compile, so the states
+        # of the first period are fetched from the database
+        freezer.move_to(zero + timedelta(minutes=5, seconds=10))
+        do_adhoc_statistics(hass, start=zero)
+        await async_wait_recording_done(hass)
+        assert get_history_mock.call_count == 2
+
+        freezer.move_to(zero + timedelta(minutes=6))
+        hass.states.async_set("sensor.test1", "20", POWER_SENSOR_ATTRIBUTES)
+        hass.states.async_set("sensor.test2", "110", ENERGY_SENSOR_ATTRIBUTES)
+        freezer.move_to(zero + timedelta(minutes=8))
+        hass.states.async_set("sensor.test1", "30", POWER_SENSOR_ATTRIBUTES)
+        hass.states.async_set("sensor.test2", "130", ENERGY_SENSOR_ATTRIBUTES)
+        await async_wait_recording_done(hass)
+
+        freezer.move_to(zero + timedelta(minutes=10, seconds=10))
+        do_adhoc_statistics(hass, start=zero + timedelta(minutes=5))
+        await async_wait_recording_done(hass)
+        assert get_history_mock.call_count == 2
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": pytest.approx(10.0),
+                "min": pytest.approx(10.0),
+                "max": pytest.approx(10.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+            {
+                "start": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=10)).timestamp(),
+                "mean": pytest.approx(22.0),
+                "min": pytest.approx(10.0),
+                "max": pytest.approx(30.0),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            },
+        ],
+        "sensor.test2": [
+            {
+                "start": process_timestamp(zero).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": pytest.approx(100.0),
+                "sum": pytest.approx(0.0),
+            },
+            {
+                "start": process_timestamp(zero + timedelta(minutes=5)).timestamp(),
+                "end": process_timestamp(zero + timedelta(minutes=10)).timestamp(),
+                "mean": None,
+                "min": None,
+                "max": None,
+                "last_reset": None,
+                "state": pytest.approx(130.0),
+                "sum": pytest.approx(30.0),
+            },
+        ],
+    }
+
+
+async def test_state_buffer_entity_filter_and_stop(hass: HomeAssistant) -> None:
+    """Test the state buffer skips excluded sensors and stops listening."""
+    start = dt_util.utcnow()
+    start_ts = start.timestamp()
+    end = start + timedelta(minutes=5)
+    for entity_id in ("sensor.included", "sensor.excluded"):
+        hass.states.async_set(
+            entity_id, "1", POWER_SENSOR_ATTRIBUTES, timestamp=start_ts - 1
+        )
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    state_buffer = sensor_recorder.SensorStateBuffer(
+        hass, lambda entity_id: entity_id != "sensor.excluded"
+    )
+    state_buffer.async_start()
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+
+    for entity_id in ("sensor.included", "sensor.excluded", "sensor.new_excluded"):
+        hass.states.async_set(
+            entity_id, "2", POWER_SENSOR_ATTRIBUTES, timestamp=start_ts + 1
+        )
+    await hass.async_block_till_done()
+
+    entity_ids = ["sensor.included", "sensor.excluded", "sensor.new_excluded"]
+    history = state_buffer.async_get_history(start, end, entity_ids, False)
+    assert [state.state for state in history["sensor.included"]] == ["1", "2"]
+    assert history["sensor.excluded"] is None
+    assert history["sensor.new_excluded"] is None
+
+    state_buffer.async_stop()
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+    history = state_buffer.async_get_history(start, end, entity_ids, False)
+    assert history["sensor.included"] is None
+
+
+@pytest.mark.parametrize("seed", range(25))
+async def test_time_weighted_average_matches_per_state_calculation(
+    seed: int,
+) -> None:
+    """Test the vectorized statistics match a calculation one state at a time."""
+    pytest.importorskip("numpy")
+    rng = random.Random(seed)
+    start = get_start_time(dt_util.utcnow())
+    end = start + timedelta(minutes=5)
+    period_us = 5 * 60 * 10**6
+    first_offset = rng.randrange(-3600 * 10**6, period_us)
+    offsets = sorted(
+        rng.randrange(max(first_offset, 0) + 1, period_us)
+        for _ in range(rng.randrange(0, 2000))
+    )
+    fstates = [
+        (
+            value := rng.uniform(-1000, 1000),
+            State(
+                "sensor.test",
+                str(value),
+                last_updated=start + timedelta(microseconds=offset),
+            ),
+        )
+        for offset in (first_offset, *offsets)
+    ]
+
+    values, timestamps = sensor_recorder._float_states_to_arrays(fstates)
+    assert float(values.min()) == min(fstate for fstate, _ in fstates)
+    assert float(values.max()) == max(fstate for fstate, _ in fstates)
+    assert sensor_recorder._time_weighted_average_arrays(
+        values, timestamps, start, end
+    ) == pytest.approx(
+        sensor_recorder._time_weighted_average(fstates, start, end),
+        rel=1e-9,
+        abs=1e-9,
+    )
+
+
+@pytest.mark.parametrize("numpy_available", [True, False])
+async def test_mean_min_max_without_numpy(numpy_available: bool) -> None:
+    """Test mean, min and max are calculated with or without NumPy."""
+    if numpy_available:
+        pytest.importorskip("numpy")
+    start = get_start_time(dt_util.utcnow())
+    end = start + timedelta(minutes=5)
+    fstates = [
+        (10.0, State("sensor.test", "10", last_updated=start - timedelta(hours=1))),
+        (30.0, State("sensor.test", "30", last_updated=start + timedelta(minutes=4))),
+    ]
+
+    with patch.object(
+        sensor_recorder, "_numpy_available", return_value=numpy_available
+    ):
+        mean, min_, max_ = sensor_recorder._mean_min_max(
+            fstates, start, end, {"mean", "min", "max"}
+        )
+        assert mean == pytest.approx(14.0)
+        assert min_ == 10.0
+        assert max_ == 30.0
+
+        # Only the wanted statistics are calculated
+        assert sensor_recorder._mean_min_max(fstates, start, end, {"min", "max"}) == (
+            None,
+            10.0,
+            30.0,
+        )
+        assert sensor_recorder._mean_min_max(fstates, start, end, {"max"}) == (
+            None,
+            None,
+            30.0,
+        )
+        assert sensor_recorder._mean_min_max(fstates, start, end, {"sum"}) == (
+            None,
+            None,
+            None,
+        )
+
+
 @pytest.mark.parametrize(
     (
         "device_class",
@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -17,16 +18,25 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
+from homeassistant.components.websocket_api.commands import STATES_SNAPSHOT
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
-from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
+from homeassistant.core import (
+    Context,
+    HomeAssistant,
+    State,
+    StateMachine,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -34,6 +44,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -692,6 +703,98 @@ async def test_get_states(
     assert msg["result"] == states
 
 
+async def test_get_states_snapshot(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test get_states and subscribe_entities share a states snapshot."""
+    hass.states.async_set("greeting.hello", "world")
+
+    await websocket_client.send_json({"id": 5, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert [state["state"] for state in msg["result"]] == ["world"]
+
+    snapshot = hass.data[STATES_SNAPSHOT]
+    generation = snapshot.generation
+
+    with patch.object(
+        StateMachine, "async_all", autospec=True, side_effect=StateMachine.async_all
+    ) as async_all_mock:
+        await websocket_client.send_json({"id": 6, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+        assert [state["state"] for state in msg["result"]] == ["world"]
+
+        await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["a"]["greeting.hello"]["s"] == "world"
+
+        await websocket_client.send_json({"id": 8, "type": "subscribe_entities"})
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["a"]["greeting.hello"]["s"] == "world"
+
+    # The compressed states are built once and the full states are reused
+    assert async_all_mock.call_count == 3
+    assert snapshot.generation == generation
+
+    hass.states.async_set("greeting.hello", "universe")
+    assert snapshot.generation == generation + 1
+    for _ in range(2):
+        msg = await websocket_client.receive_json()
+        assert msg["event"]["c"]["greeting.hello"]["+"]["s"] == "universe"
+
+    await websocket_client.send_json({"id": 9, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert [state["state"] for state in msg["result"]] == ["universe"]
+
+
+async def test_get_states_snapshot_updates_changed_states(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test the states snapshot only serializes the changed states again."""
+    for entity_id in ("light.one", "light.two", "light.three"):
+        hass.states.async_set(entity_id, "on")
+
+    await websocket_client.send_json({"id": 5, "type": "get_states"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    snapshot = hass.data[STATES_SNAPSHOT]
+
+    hass.states.async_set("light.two", "off")
+    hass.states.async_remove("light.one")
+    hass.states.async_set("light.one", "off")
+    hass.states.async_set("light.four", "on")
+    hass.states.async_set("light.four", "off")
+    hass.states.async_set("light.five", "on")
+    hass.states.async_remove("light.five")
+
+    with patch.object(
+        StateMachine, "async_all", autospec=True, side_effect=StateMachine.async_all
+    ) as async_all_mock:
+        await websocket_client.send_json({"id": 6, "type": "get_states"})
+        msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert async_all_mock.call_count == 0
+    assert msg["result"] == [state.as_dict() for state in hass.states.async_all()]
+    assert [state["entity_id"] for state in msg["result"]] == [
+        "light.two",
+        "light.three",
+        "light.one",
+        "light.four",
+    ]
+
+    await hass.async_stop()
+    assert STATES_SNAPSHOT not in hass.data
+    generation = snapshot.generation
+    hass.states.async_set("light.two", "on")
+    assert snapshot.generation == generation
+
+
 async def test_get_services(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -1029,6 +1132,47 @@ async def test_subscribe_entities_with_unserializable_state(
     }
 
 
+async def test_subscribe_entities_coalesces_changes_under_backpressure(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe_entities merges changes while the client is behind."""
+    hass.states.async_set("light.changed", "off", {"color": "red"})
+    hass.states.async_set("light.removed", "on")
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["a"].keys() == {"light.changed", "light.removed"}
+
+    with patch.object(const, "PENDING_MSG_COALESCE_DIFFS", 0):
+        hass.states.async_set("light.changed", "on", {"color": "red"})
+        hass.states.async_set("light.changed", "on", {"color": "blue"})
+        hass.states.async_set("light.changed", "off", {"color": "green"})
+        hass.states.async_set("light.added", "on")
+        hass.states.async_remove("light.removed")
+        hass.states.async_set("light.added_and_removed", "on")
+        hass.states.async_remove("light.added_and_removed")
+        # The client is still behind so nothing is sent
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {"light.changed": {"+": {"a": {"color": "green"}, "c": ANY, "lc": ANY}}},
+        "r": ["light.removed"],
+    }
+
+    hass.states.async_set("light.changed", "on", {"color": "green"})
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.changed": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+    }
+
+
 async def test_subscribe_unsubscribe_entities(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
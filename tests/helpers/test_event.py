@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+import math
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -26,10 +27,13 @@ from homeassistant.exceptions import TemplateError
 from homeassistant.helpers.device_registry import EVENT_DEVICE_REGISTRY_UPDATED
 from homeassistant.helpers.entity_registry import EVENT_ENTITY_REGISTRY_UPDATED
 from homeassistant.helpers.event import (
+    _TIME_CHANGE_SCHEDULER,
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
+    async_call_at,
     async_call_later,
+    async_timer_wheel_stats,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -2251,6 +2255,218 @@ async def test_track_template_result_iterator(hass: HomeAssistant) -> None:
     assert filter_runs == ["", "sensor.new"]
 
 
+async def test_track_template_result_batch_renders(hass: HomeAssistant) -> None:
+    """Test batched trackers render once per loop iteration."""
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    template_str = "{{ states('sensor.one') | int + states('sensor.two') | int }}"
+    template_one = Template(template_str, hass)
+    template_two = Template(template_str, hass)
+    runs_one = []
+    runs_two = []
+
+    @ha.callback
+    def listener_one(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs_one.append((event.data["entity_id"], updates.pop().result))
+
+    @ha.callback
+    def listener_two(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs_two.append((event.data["entity_id"], updates.pop().result))
+
+    info_one = async_track_template_result(
+        hass, [TrackTemplate(template_one, None)], listener_one, batch_renders=True
+    )
+    async_track_template_result(
+        hass, [TrackTemplate(template_two, None)], listener_two, batch_renders=True
+    )
+    await hass.async_block_till_done()
+    # Both trackers rendered once during setup
+    renders = template_one._renders
+    assert renders
+    assert template_two._renders == renders
+
+    hass.states.async_set("sensor.one", "3")
+    hass.states.async_set("sensor.two", "4")
+    await hass.async_block_till_done()
+
+    assert runs_one == [("sensor.two", 7)]
+    assert runs_two == [("sensor.two", 7)]
+    # Rendered once for both state changes and shared by both trackers
+    assert template_one._renders + template_two._renders == 3 * renders
+
+    info_one.async_remove()
+    hass.states.async_set("sensor.one", "5")
+    await hass.async_block_till_done()
+
+    assert runs_one == [("sensor.two", 7)]
+    assert runs_two == [("sensor.two", 7), ("sensor.one", 9)]
+
+
+async def test_track_template_result_batch_renders_in_event_order(
+    hass: HomeAssistant,
+) -> None:
+    """Test batched results are in the order of the state changes."""
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+    template_one = Template("{{ states('sensor.one') }}", hass)
+    template_two = Template("{{ states('sensor.two') }}", hass)
+    runs = []
+
+    @ha.callback
+    def listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append([(update.template, update.result) for update in updates])
+
+    info = async_track_template_result(
+        hass,
+        [TrackTemplate(template_two, None), TrackTemplate(template_one, None)],
+        listener,
+        batch_renders=True,
+    )
+    await hass.async_block_till_done()
+    runs.clear()
+
+    hass.states.async_set("sensor.one", "3")
+    hass.states.async_set("sensor.two", "4")
+    await hass.async_block_till_done()
+    assert runs == [[(template_one, 3), (template_two, 4)]]
+
+    info.async_remove()
+
+
+async def test_track_template_result_batch_renders_log_fn(
+    hass: HomeAssistant,
+) -> None:
+    """Test batched templates logging to different functions are not shared."""
+    hass.states.async_set("sensor.one", "1")
+    template_str = "{{ states('sensor.one') }}"
+    templates = [Template(template_str, hass) for _ in range(3)]
+
+    def log_one(level: int, msg: str) -> None:
+        pass
+
+    def log_two(level: int, msg: str) -> None:
+        pass
+
+    log_fns = [log_one, log_two]
+    infos = [
+        async_track_template_result(
+            hass,
+            [TrackTemplate(template, None)],
+            lambda event, updates: None,
+            log_fn=log_fn,
+            batch_renders=True,
+        )
+        for template, log_fn in zip(templates, (*log_fns, log_fns[0]), strict=True)
+    ]
+    await hass.async_block_till_done()
+    renders = [template._renders for template in templates]
+
+    hass.states.async_set("sensor.one", "2")
+    await hass.async_block_till_done()
+    # The first and last template log to the same function and share a render
+    rendered = [
+        template._renders > before
+        for template, before in zip(templates, renders, strict=True)
+    ]
+    assert rendered == [True, True, False]
+
+    for info in infos:
+        info.async_remove()
+
+
+async def test_track_template_result_error_tracks_static_references(
+    hass: HomeAssistant,
+) -> None:
+    """Test a template failing to render tracks all entities it references."""
+    hass.states.async_set("sensor.one", "unavailable")
+    hass.states.async_set("sensor.two", "2")
+    template_sum = Template(
+        "{{ states('sensor.one') | float + states('sensor.two') | float }}", hass
+    )
+    runs = []
+
+    @ha.callback
+    def sum_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_sum, None)], sum_listener
+    )
+    await hass.async_block_till_done()
+
+    assert info.listeners == {
+        "all": False,
+        "domains": set(),
+        "entities": {"sensor.one", "sensor.two"},
+        "time": False,
+    }
+
+    hass.states.async_set("sensor.one", "1")
+    await hass.async_block_till_done()
+    assert runs == [3.0]
+
+    hass.states.async_set("sensor.two", "3")
+    await hass.async_block_till_done()
+    assert runs == [3.0, 4.0]
+
+
+async def test_track_template_result_selecting_states_static_references(
+    hass: HomeAssistant,
+) -> None:
+    """Test selecting states by entity id does not listen to all states."""
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "off")
+    template_on = Template(
+        "{{ states | selectattr('entity_id', 'in', ['light.one', 'light.two'])"
+        " | selectattr('state', 'eq', 'on') | list | count }}",
+        hass,
+    )
+    runs = []
+
+    @ha.callback
+    def on_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_on, None)], on_listener
+    )
+    await hass.async_block_till_done()
+
+    assert info.listeners == {
+        "all": False,
+        "domains": set(),
+        "entities": {"light.one", "light.two"},
+        "time": False,
+    }
+
+    hass.states.async_set("light.three", "on")
+    await hass.async_block_till_done()
+    assert runs == []
+
+    hass.states.async_set("light.two", "on")
+    await hass.async_block_till_done()
+    assert runs == [2]
+
+    hass.states.async_remove("light.one")
+    await hass.async_block_till_done()
+    assert runs == [2, 1]
+
+
 async def test_track_template_result_errors(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -3998,6 +4214,60 @@ async def test_periodic_task_hour(
     assert len(specific_runs) == 3
 
 
+async def test_periodic_tasks_share_timer(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test periodic tasks matching the same second run from a single timer."""
+    specific_runs = []
+
+    now = dt_util.utcnow()
+
+    time_that_will_not_match_right_away = datetime(
+        now.year + 1, 5, 24, 11, 59, 55, tzinfo=dt_util.UTC
+    )
+    freezer.move_to(time_that_will_not_match_right_away)
+
+    unsubs = [
+        async_track_utc_time_change(
+            hass,
+            # pylint: disable-next=unnecessary-lambda
+            callback(lambda x: specific_runs.append(x)),
+            minute=minute,
+            second=0,
+        )
+        for minute in ("/1", "/5", "/10", 0, 1)
+    ]
+    scheduler = hass.data[_TIME_CHANGE_SCHEDULER]
+    assert len(scheduler._heap) == 5
+    assert scheduler._cancel_timer is not None
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 0, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 4
+
+    unsubs[0]()
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 1, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 5
+
+    for unsub in unsubs[1:]:
+        unsub()
+    assert not scheduler._heap
+    assert scheduler._cancel_timer is None
+
+    async_fire_time_changed(
+        hass, datetime(now.year + 1, 5, 24, 12, 10, 0, 999999, tzinfo=dt_util.UTC)
+    )
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 5
+
+
 async def test_periodic_task_wrong_input(hass: HomeAssistant) -> None:
     """Test periodic tasks with wrong input."""
     specific_runs = []
@@ -4468,6 +4738,134 @@ async def test_async_call_later_cancel(hass: HomeAssistant) -> None:
             assert await future, "callback not canceled"
 
 
+async def test_async_call_at_precision_shares_wakeup(hass: HomeAssistant) -> None:
+    """Test timers with a precision share a single event loop wakeup."""
+    calls = []
+    loop = hass.loop
+    bucket = math.ceil(loop.time() / 10) * 10 + 10
+
+    removes = [
+        async_call_at(
+            hass,
+            callback(lambda now, offset=offset: calls.append(offset)),
+            bucket - offset,
+            precision=10,
+        )
+        for offset in (1, 2, 3)
+    ]
+    assert async_timer_wheel_stats(hass) == {
+        "wakeups": 1,
+        "active_timers": {"homeassistant": 3},
+    }
+
+    removes[1]()
+    assert async_timer_wheel_stats(hass)["active_timers"] == {"homeassistant": 2}
+
+    async_fire_time_changed_exact(
+        hass, dt_util.utcnow() + timedelta(seconds=bucket - 3.5 - loop.time())
+    )
+    await hass.async_block_till_done()
+    assert calls == []
+
+    # Fire a bit late, converting the wall clock to loop time is not exact
+    async_fire_time_changed_exact(
+        hass, dt_util.utcnow() + timedelta(seconds=bucket + 0.5 - loop.time())
+    )
+    await hass.async_block_till_done()
+    assert calls == [1, 3]
+    assert async_timer_wheel_stats(hass) == {"wakeups": 0, "active_timers": {}}
+
+    # Cancelling a timer that already fired is a no-op
+    removes[0]()
+
+
+async def test_track_time_interval_precision_cancel_on_shutdown(
+    hass: HomeAssistant,
+) -> None:
+    """Test precision timers marked to be cancelled do not fire on shutdown."""
+    calls = []
+    unsub = async_track_time_interval(
+        hass,
+        callback(lambda now: calls.append("cancelled")),
+        timedelta(seconds=10),
+        cancel_on_shutdown=True,
+        precision=1,
+    )
+    unsub_kept = async_track_time_interval(
+        hass,
+        callback(lambda now: calls.append("kept")),
+        timedelta(seconds=10),
+        precision=1,
+    )
+    assert async_timer_wheel_stats(hass)["wakeups"] == 2
+
+    await hass.async_stop()
+    assert async_timer_wheel_stats(hass) == {
+        "wakeups": 1,
+        "active_timers": {"homeassistant": 1},
+    }
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=12))
+    await hass.async_block_till_done()
+    assert calls == ["kept"]
+
+    unsub()
+    unsub_kept()
+    assert async_timer_wheel_stats(hass) == {"wakeups": 0, "active_timers": {}}
+
+
+async def test_async_call_later_precision_cancel(hass: HomeAssistant) -> None:
+    """Test cancelling all timers of a bucket cancels its wakeup."""
+    calls = []
+
+    @callback
+    def action(now: datetime, /) -> None:
+        calls.append(now)
+
+    remove1 = async_call_later(hass, 5, action, precision=1)
+    remove2 = async_call_later(hass, 5, action, precision=1)
+    assert async_timer_wheel_stats(hass)["wakeups"] == 1
+
+    remove1()
+    remove2()
+    assert async_timer_wheel_stats(hass) == {"wakeups": 0, "active_timers": {}}
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=10))
+    await hass.async_block_till_done()
+    assert calls == []
+
+
+async def test_track_time_interval_precision(hass: HomeAssistant) -> None:
+    """Test tracking time interval with a precision."""
+    specific_runs = []
+
+    utc_now = dt_util.utcnow()
+    unsub = async_track_time_interval(
+        hass,
+        # pylint: disable-next=unnecessary-lambda
+        callback(lambda x: specific_runs.append(x)),
+        timedelta(seconds=10),
+        precision=1,
+    )
+    assert async_timer_wheel_stats(hass)["wakeups"] == 1
+
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 0
+
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=13))
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 1
+    assert async_timer_wheel_stats(hass)["wakeups"] == 1
+
+    unsub()
+    assert async_timer_wheel_stats(hass)["wakeups"] == 0
+
+    async_fire_time_changed(hass, utc_now + timedelta(seconds=30))
+    await hass.async_block_till_done()
+    assert len(specific_runs) == 1
+
+
 async def test_track_state_change_event_chain_multple_entity(
     hass: HomeAssistant,
 ) -> None:
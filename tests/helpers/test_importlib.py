@@ -109,3 +109,60 @@ async def test_async_import_module_concurrency(
 
     assert module1 is mock_module
     assert module2 is mock_module
+
+
+def test_requirement_modules() -> None:
+    """Test finding the top level modules of a requirement."""
+    assert importlib._requirement_modules("voluptuous==0.1") == ["voluptuous"]
+    assert importlib._requirement_modules("not-installed-package==1.0") == []
+    assert importlib._requirement_modules("invalid requirement ===") == []
+
+
+def test_preimport_modules_failures() -> None:
+    """Test modules that fail to import are skipped."""
+
+    def _import_module(name: str) -> MockModule:
+        if name == "broken_module":
+            raise ValueError
+        return MockModule()
+
+    with patch(
+        "homeassistant.helpers.importlib.importlib.import_module",
+        side_effect=_import_module,
+    ) as mock_import:
+        assert importlib._preimport_modules(
+            ["good_module", "broken_module", "sys"], 2
+        ) == ["good_module"]
+
+    # Modules that are already imported are skipped
+    assert sorted(call.args[0] for call in mock_import.call_args_list) == [
+        "broken_module",
+        "good_module",
+    ]
+
+
+async def test_async_preimport_requirements(hass: HomeAssistant) -> None:
+    """Test importing the modules of requirements ahead of use."""
+    requirement_modules = {
+        "package-a==1.0": ["package_a"],
+        "package-b==1.0": ["package_b", "package_a"],
+    }
+    with (
+        patch(
+            "homeassistant.helpers.importlib._requirement_modules",
+            side_effect=requirement_modules.__getitem__,
+        ),
+        patch(
+            "homeassistant.helpers.importlib.importlib.import_module",
+            return_value=MockModule(),
+        ) as mock_import,
+    ):
+        await importlib.async_preimport_requirements(hass, [])
+        assert not mock_import.called
+
+        await importlib.async_preimport_requirements(hass, list(requirement_modules))
+
+    assert sorted(call.args[0] for call in mock_import.call_args_list) == [
+        "package_a",
+        "package_b",
+    ]
@@ -0,0 +1,86 @@
+"""Tests for the startup cache helper."""
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant import loader, requirements
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import startup_cache
+from homeassistant.util import dt as dt_util
+
+from tests.common import async_fire_time_changed
+
+
+async def _async_save(hass: HomeAssistant, cache: startup_cache.StartupCache) -> None:
+    """Save the startup cache."""
+    cache.async_schedule_save()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=startup_cache.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+
+@patch.object(startup_cache, "CACHE_MANIFESTS", True)
+async def test_save_and_load(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test the startup cache primes the loader and requirements on load."""
+    cache = await startup_cache.async_load(hass)
+    assert not cache.loaded
+
+    await loader.async_get_integration(hass, "sun")
+    requirements.async_get_installed_requirements(hass).add("fake-package==1.0")
+    await _async_save(hass, cache)
+
+    data = hass_storage[startup_cache.STORAGE_KEY]["data"]
+    assert data["manifests"]["sun"]["manifest"]["domain"] == "sun"
+    assert "__init__.py" in data["manifests"]["sun"]["files"]
+    assert "fake-package==1.0" in data["installed_requirements"]
+
+    hass.data.pop(loader.DATA_CACHED_MANIFESTS, None)
+    requirements.async_get_installed_requirements(hass).clear()
+
+    cache = await startup_cache.async_load(hass)
+    assert cache.loaded
+    manifest, files = hass.data[loader.DATA_CACHED_MANIFESTS]["sun"]
+    assert manifest["domain"] == "sun"
+    assert "__init__.py" in files
+    assert "fake-package==1.0" in requirements.async_get_installed_requirements(hass)
+
+
+async def test_fingerprint_changed(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the startup cache is ignored when the installation changed."""
+    hass_storage[startup_cache.STORAGE_KEY] = {
+        "version": startup_cache.STORAGE_VERSION,
+        "minor_version": 1,
+        "key": startup_cache.STORAGE_KEY,
+        "data": {
+            "fingerprint": {"version": "0.1.0", "python": "", "paths": {}},
+            "manifests": {"sun": {"manifest": {"domain": "sun"}, "files": []}},
+            "installed_requirements": ["fake-package==1.0"],
+        },
+    }
+
+    cache = await startup_cache.async_load(hass)
+
+    assert not cache.loaded
+    assert loader.DATA_CACHED_MANIFESTS not in hass.data
+    assert "fake-package==1.0" not in requirements.async_get_installed_requirements(
+        hass
+    )
+
+
+@patch.object(startup_cache, "CACHE_MANIFESTS", False)
+async def test_manifests_not_cached(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test only requirements are cached when manifests can change."""
+    cache = await startup_cache.async_load(hass)
+    await loader.async_get_integration(hass, "sun")
+    requirements.async_get_installed_requirements(hass).add("fake-package==1.0")
+    await _async_save(hass, cache)
+
+    data = hass_storage[startup_cache.STORAGE_KEY]["data"]
+    assert data["manifests"] == {}
+    assert data["installed_requirements"] == ["fake-package==1.0"]
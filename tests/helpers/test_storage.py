@@ -1,6 +1,7 @@
 """Tests for the storage helper."""
 
 import asyncio
+from collections.abc import Callable
 from datetime import timedelta
 import json
 import os
@@ -20,7 +21,7 @@ from homeassistant.const import (
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
-from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.json import json_bytes, json_fragment
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
 
@@ -1180,3 +1181,174 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journaled_store(tmpdir: py.path.local) -> None:
+    """Test a journaled store only appends the changed keys."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = {"a": 1, "b": {"nested": True}, "padding": "x" * 1000}
+        await store.async_save(data)
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        await store.async_save({**data, "a": 2})
+        await store.async_save({"a": 2, "padding": data["padding"], "c": [1]})
+
+        def _read_files() -> tuple[dict[str, Any], list[Any]]:
+            with open(store.path, encoding="utf8") as file:
+                snapshot = json.load(file)
+            with open(store.journal_path, encoding="utf8") as file:
+                journal = [json.loads(line) for line in file]
+            return snapshot, journal
+
+        snapshot, journal = await hass.async_add_executor_job(_read_files)
+        assert snapshot["data"] == data
+        assert journal == [
+            {"journal": snapshot["journal"]},
+            ["a", 2],
+            ["c", [1]],
+            ["b"],
+        ]
+
+        loaded = await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load()
+        assert loaded == {"a": 2, "padding": data["padding"], "c": [1]}
+
+        # Saving the same data again does not write anything
+        await store.async_save(loaded)
+        assert (await hass.async_add_executor_job(_read_files))[1] == journal
+
+        await store.async_remove()
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        await hass.async_stop(force=True)
+
+
+@pytest.mark.parametrize(
+    "as_item",
+    [lambda entity: entity, lambda entity: json_fragment(json_bytes(entity))],
+    ids=["dict", "fragment"],
+)
+async def test_journaled_store_items(
+    tmpdir: py.path.local, as_item: Callable[[dict[str, Any]], Any]
+) -> None:
+    """Test a journaled store appends the changed items of a registry list."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        entities = [
+            {"id": f"id_{index}", "name": None, "padding": "x" * 100}
+            for index in range(10)
+        ]
+        # Registries only create a new item for changed entries
+        items = [as_item(entity) for entity in entities]
+        await store.async_save({"entities": items, "deleted_entities": []})
+
+        entities[3] = {**entities[3], "name": "Renamed"}
+        items[3] = as_item(entities[3])
+        entities.pop(5)
+        items.pop(5)
+        entities.append({"id": "id_new", "name": None})
+        items.append(as_item(entities[-1]))
+        await store.async_save({"entities": items, "deleted_entities": []})
+
+        def _read_journal() -> list[Any]:
+            with open(store.journal_path, encoding="utf8") as file:
+                return [json.loads(line) for line in file]
+
+        assert (await hass.async_add_executor_job(_read_journal))[1:] == [
+            ["entities", "id_3", entities[3]],
+            ["entities", "id_new", {"id": "id_new", "name": None}],
+            ["entities", "id_5", None],
+        ]
+        loaded = await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load()
+        assert loaded == {"entities": entities, "deleted_entities": []}
+
+        # Reordered items can not be replayed per item, the list is rewritten
+        entities.reverse()
+        items.reverse()
+        await store.async_save({"entities": items, "deleted_entities": []})
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        loaded = await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load()
+        assert loaded == {"entities": entities, "deleted_entities": []}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_compaction(tmpdir: py.path.local) -> None:
+    """Test a journaled store rewrites the file once the journal grows."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = {f"key{index}": "x" * 100 for index in range(10)}
+        await store.async_save(data)
+
+        for index in range(4):
+            data[f"key{index}"] = "y" * 100
+            await store.async_save(data)
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        # The journal would exceed half of the data
+        data["key4"] = "y" * 100
+        await store.async_save(data)
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        loaded = await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load()
+        assert loaded == data
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_crash_recovery(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test loading a journaled store after an unclean shutdown."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = {"a": 1, "b": 1, "padding": "x" * 1000}
+        await store.async_save(data)
+        await store.async_save({**data, "a": 2})
+
+        def _append_to_journal(content: bytes) -> None:
+            with open(store.journal_path, "ab") as file:
+                file.write(content)
+
+        # An append interrupted halfway is ignored
+        await hass.async_add_executor_job(_append_to_journal, b'["b",2]\n["a",')
+        loaded = await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load()
+        assert loaded == {**data, "a": 2, "b": 2}
+        assert "Ignoring incomplete journal entry for storage-test" in caplog.text
+
+        # The first save after loading rewrites the file and drops the journal
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        loaded = await store.async_load()
+        await store.async_save(loaded)
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        # A journal left behind after writing the file is not replayed
+        def _write_stale_journal() -> None:
+            with open(store.journal_path, "wb") as file:
+                file.write(b'{"journal":"stale"}\n["a",1]\n')
+
+        await hass.async_add_executor_job(_write_stale_journal)
+        loaded = await storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True
+        ).async_load()
+        assert loaded == {**data, "a": 2, "b": 2}
+
+        await hass.async_stop(force=True)
@@ -2058,6 +2058,40 @@ def test_state_attr(hass: HomeAssistant) -> None:
     assert tpl.async_render() == "action"
 
 
+def test_attr_entities(hass: HomeAssistant) -> None:
+    """Test attr_entities method."""
+    hass.states.async_set("sensor.power", "1", {"device_class": "power"})
+    hass.states.async_set("switch.power", "on", {"device_class": "power"})
+    hass.states.async_set("sensor.energy", "2", {"device_class": "energy"})
+
+    info = render_to_info(hass, "{{ attr_entities('device_class', 'power') }}")
+    assert_result_info(info, ["sensor.power", "switch.power"], all_states=True)
+
+    info = render_to_info(
+        hass, "{{ attr_entities('device_class', 'power', 'sensor') }}"
+    )
+    assert_result_info(info, ["sensor.power"], domains=["sensor"])
+
+    hass.states.async_set("sensor.energy", "2", {"device_class": "power"})
+    info = render_to_info(
+        hass, "{{ attr_entities('device_class', 'power', 'sensor') | sort }}"
+    )
+    assert_result_info(info, ["sensor.energy", "sensor.power"], domains=["sensor"])
+
+    info = render_to_info(hass, "{{ attr_entities('device_class', 'missing') }}")
+    assert_result_info(info, [], all_states=True)
+
+    # Templates do not add attribute indexes
+    assert not hass.states._states._attribute_indexes
+
+    # but use the existing ones
+    hass.states.async_add_attribute_index("device_class")
+    hass.states.async_set("switch.energy", "on", {"device_class": "energy"})
+    info = render_to_info(hass, "{{ attr_entities('device_class', 'energy') }}")
+    assert_result_info(info, ["switch.energy"], all_states=True)
+    assert list(hass.states._states._attribute_indexes) == ["device_class"]
+
+
 def test_states_function(hass: HomeAssistant) -> None:
     """Test using states as a function."""
     hass.states.async_set("test.object", "available")
@@ -5189,6 +5223,101 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compiled_template_cache_shared(hass: HomeAssistant) -> None:
+    """Test templates with the same source share compiled code."""
+    template_string = "{{ value_json.temperature }}"
+    # The environments are created by the first render
+    assert template.Template("{{ 1 }}", hass).async_render() == 1
+    cache = hass.data[template._ENVIRONMENT].template_cache
+    hits = cache.hits
+    misses = cache.misses
+
+    tpl = template.Template(template_string, hass)
+    tpl2 = template.Template(template_string, hass)
+    tpl_strict = template.Template(template_string, hass)
+    for value in ("21", "22"):
+        assert (
+            tpl.async_render_with_possible_json_value(f'{{"temperature": {value}}}')
+            == value
+        )
+    assert tpl2.async_render_with_possible_json_value('{"temperature": 23}') == "23"
+    assert tpl_strict.async_render({"value_json": {"temperature": 24}}, strict=True)
+
+    assert cache.misses == misses + 1
+    assert cache.hits == hits + 2
+    assert hass.data[template._ENVIRONMENT_STRICT].template_cache is cache
+    assert tpl._compiled_code is tpl2._compiled_code is tpl_strict._compiled_code
+    assert tpl._compiled is tpl2._compiled
+    assert tpl._compiled is not tpl_strict._compiled
+    assert template.compiled_template_cache_info()["hass"]["size"] == len(cache)
+
+    del tpl, tpl2, tpl_strict
+    assert cache.get(template_string) is None
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states('sensor.power') | float * 2 }}",
+        "{{ (states('sensor.power') | float + 1) / 3 | round(2) }}",
+        "{{ (states('sensor.power') | float / 3) | round(3) }}",
+        "{{ states('sensor.power') | float | round(1, 'floor') }}",
+        "{{ -(states('Sensor.Power') | float(0)) }}",
+        "{{ states('sensor.power') | int // 2 % 3 }}",
+        "{{ states('sensor.unavailable') | float(default=5) }}",
+        "{{ states('sensor.unavailable') | float }}",
+        "{{ states('sensor.missing') }}",
+        "{{ state_attr('sensor.power', 'phases') * 2 }}",
+        "{{ state_attr('sensor.missing', 'phases') }}",
+        "{{ states('sensor.power') | float / 0 }}",
+    ],
+)
+async def test_fast_lane_parity(hass: HomeAssistant, template_str: str) -> None:
+    """Test the fast lane renders like Jinja."""
+    hass.states.async_set("sensor.power", "12.5", {"phases": 3})
+    hass.states.async_set("sensor.unavailable", "unavailable")
+    fast = template.Template(template_str, hass)
+    fast_info = fast.async_render_to_info()
+    assert fast._fast_lane is not None
+    jinja = template.Template(template_str, hass)
+    jinja._ensure_compiled()
+    jinja._fast_lane = None
+    jinja_info = jinja.async_render_to_info()
+
+    if jinja_info.exception:
+        assert str(fast_info.exception) == str(jinja_info.exception)
+    else:
+        assert fast_info.result() == jinja_info.result()
+    assert fast_info.entities == jinja_info.entities
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states('sensor.power') }} W",
+        "{{ states.sensor.power.state | float }}",
+        "{{ states(entity_id) | float }}",
+        "{{ states('sensor.power', rounded=True) }}",
+        "{{ states('sensor.power') | float | abs }}",
+    ],
+)
+async def test_fast_lane_not_supported(hass: HomeAssistant, template_str: str) -> None:
+    """Test templates the fast lane does not handle are rendered by Jinja."""
+    hass.states.async_set("sensor.power", "12.5")
+    tpl = template.Template(template_str, hass)
+    assert tpl.async_render({"entity_id": "sensor.power"})
+    assert tpl._fast_lane is None
+
+
+async def test_fast_lane_shadowed_by_variables(hass: HomeAssistant) -> None:
+    """Test variables shadowing fast lane functions are used."""
+    hass.states.async_set("sensor.power", "12.5")
+    tpl = template.Template("{{ states('sensor.power') | float * 2 }}", hass)
+    assert tpl.async_render() == 25.0
+    assert tpl._fast_lane is not None
+    assert tpl.async_render({"states": lambda entity_id: "3"}) == 6.0
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -5624,6 +5753,172 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+async def test_render_to_info_with_exception_static_references(
+    hass: HomeAssistant,
+) -> None:
+    """Test references after an exception are found by static analysis."""
+    hass.states.async_set("sensor.a", "unavailable")
+    info = render_to_info(
+        hass,
+        "{{ states('sensor.a') | float + states.sensor.b.state | float"
+        " + states.light | count }}",
+    )
+    with pytest.raises(TemplateError, match="no default was specified"):
+        info.result()
+
+    assert info.all_states is False
+    assert info.entities == {"sensor.a", "sensor.b"}
+    assert info.domains == {"light"}
+    assert info.rate_limit == template.DOMAIN_STATES_RATE_LIMIT
+    assert info.filter("sensor.b")
+    assert not info.filter("sensor.c")
+
+    info = render_to_info(
+        hass, "{{ states(entity_id) | float }}", {"entity_id": "sensor.a"}
+    )
+    with pytest.raises(TemplateError, match="no default was specified"):
+        info.result()
+
+    assert info.entities == {"sensor.a"}
+    assert info.rate_limit == template.ALL_STATES_RATE_LIMIT
+    assert info.filter("sensor.c")
+
+    # A template which fails to compile is not analyzed
+    info = render_to_info(hass, "{{ states.light | count | no_such_filter }}")
+    with pytest.raises(TemplateError, match="No filter named 'no_such_filter'"):
+        info.result()
+
+    assert info.domains == set()
+    assert info.rate_limit == template.ALL_STATES_RATE_LIMIT
+
+
+async def test_render_to_info_selecting_states_static_references(
+    hass: HomeAssistant,
+) -> None:
+    """Test selecting states by entity id does not depend on all states."""
+    hass.states.async_set("light.a", "on")
+    hass.states.async_set("light.b", "off")
+    hass.states.async_set("sensor.c", "on")
+
+    info = render_to_info(
+        hass,
+        "{{ states | selectattr('entity_id', 'in', ['light.a', 'light.b'])"
+        " | selectattr('state', 'eq', 'on') | map(attribute='entity_id') | list }}",
+    )
+    assert_result_info(info, ["light.a"], ["light.a", "light.b"])
+    assert info.all_states_lifecycle is False
+    assert info.rate_limit is None
+    assert info.filter("light.b")
+    assert not info.filter("sensor.c")
+    assert not info.filter_lifecycle("sensor.c")
+
+    # Selecting by another attribute depends on all states
+    info = render_to_info(
+        hass,
+        "{{ states | selectattr('state', 'eq', 'on')"
+        " | map(attribute='entity_id') | list }}",
+    )
+    assert_result_info(info, ["light.a", "sensor.c"], all_states=True)
+
+    # Variables may hold states
+    info = render_to_info(
+        hass,
+        "{{ states | selectattr('entity_id', 'eq', entity_id) | list | count }}",
+        {"entity_id": "light.a"},
+    )
+    assert_result_info(info, 1, all_states=True)
+
+
+@pytest.mark.parametrize(
+    ("template_str", "entities", "domains", "all_states"),
+    [
+        (
+            "{% if is_state('light.x', 'on') %}"
+            "{{ state_attr('light.y', 'brightness') }}{% endif %}",
+            {"light.x", "light.y"},
+            set(),
+            False,
+        ),
+        (
+            "{{ 'binary_sensor.d' is is_state('on') }} {{ 'Sensor.E' | states }}",
+            {"binary_sensor.d", "sensor.e"},
+            set(),
+            False,
+        ),
+        (
+            "{{ states['sensor.c'].attributes.x }} {{ states.sensor['d'].state }}",
+            {"sensor.c", "sensor.d"},
+            set(),
+            False,
+        ),
+        (
+            "{% for state in states.sensor %}{{ loop.index }}{% endfor %}",
+            set(),
+            {"sensor"},
+            False,
+        ),
+        ("{{ states | count }}", set(), set(), True),
+        (
+            "{{ states | selectattr('entity_id', 'in', ['light.A', 'light.b'])"
+            " | selectattr('state', 'eq', 'on') | list | count }}",
+            {"light.a", "light.b"},
+            set(),
+            False,
+        ),
+        (
+            "{{ states | selectattr('domain', '==', 'cover') | list }}",
+            set(),
+            {"cover"},
+            False,
+        ),
+        ("{{ states | selectattr('state', 'eq', 'on') | list }}", set(), set(), True),
+        (
+            "{{ states | rejectattr('domain', 'eq', 'cover') | list }}",
+            set(),
+            set(),
+            True,
+        ),
+        (
+            "{{ states | selectattr('entity_id', 'in', 'light.a') | list }}",
+            set(),
+            set(),
+            True,
+        ),
+    ],
+)
+async def test_async_static_references(
+    hass: HomeAssistant,
+    template_str: str,
+    entities: set[str],
+    domains: set[str],
+    all_states: bool,
+) -> None:
+    """Test finding the states a template references without rendering it."""
+    references = template.Template(template_str, hass).async_static_references()
+    assert references is not None
+    assert references.entities == entities
+    assert references.domains == domains
+    assert references.all_states is all_states
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states[entity_id].state }}",
+        "{{ expand('group.x') | list }}",
+        "{{ ['light.a', 'light.b'] | select('is_state', 'on') | list }}",
+        "{% from 'macros.jinja' import m %}{{ m() }}",
+        "{{ this.state }}",
+        "static",
+    ],
+)
+async def test_async_static_references_unknown(
+    hass: HomeAssistant, template_str: str
+) -> None:
+    """Test templates with references only known when rendering."""
+    assert template.Template(template_str, hass).async_static_references() is None
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
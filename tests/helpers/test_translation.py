@@ -446,14 +446,15 @@ async def test_caching(hass: HomeAssistant) -> None:
 
     # Patch with same method so we can count invocations
     with patch(
-        "homeassistant.helpers.translation.build_resources",
-        side_effect=translation.build_resources,
-    ) as mock_build_resources:
+        "homeassistant.helpers.translation.recursive_flatten",
+        side_effect=translation.recursive_flatten,
+    ) as mock_flatten:
         load1 = await translation.async_get_translations(hass, "en", "entity_component")
-        assert len(mock_build_resources.mock_calls) == 7
+        flatten_calls = len(mock_flatten.mock_calls)
+        assert flatten_calls > 0
 
         load2 = await translation.async_get_translations(hass, "en", "entity_component")
-        assert len(mock_build_resources.mock_calls) == 7
+        assert len(mock_flatten.mock_calls) == flatten_calls
 
         assert load1 == load2
 
@@ -483,21 +484,21 @@ async def test_caching(hass: HomeAssistant) -> None:
 
     # Patch with same method so we can count invocations
     with patch(
-        "homeassistant.helpers.translation.build_resources",
-        side_effect=translation.build_resources,
-    ) as mock_build:
+        "homeassistant.helpers.translation.recursive_flatten",
+        side_effect=translation.recursive_flatten,
+    ) as mock_flatten:
         load_sensor_only = await translation.async_get_translations(
             hass, "en", "title", integrations={"sensor"}
         )
         assert load_sensor_only
         for key in load_sensor_only:
             assert key == "component.sensor.title"
-        assert len(mock_build.mock_calls) == 0
+        assert len(mock_flatten.mock_calls) == 0
 
         assert await translation.async_get_translations(
             hass, "en", "title", integrations={"sensor"}
         )
-        assert len(mock_build.mock_calls) == 0
+        assert len(mock_flatten.mock_calls) == 0
 
         load_light_only = await translation.async_get_translations(
             hass, "en", "title", integrations={"media_player"}
@@ -505,7 +506,13 @@ async def test_caching(hass: HomeAssistant) -> None:
         assert load_light_only
         for key in load_light_only:
             assert key == "component.media_player.title"
-        assert len(mock_build.mock_calls) > 1
+        # Only the requested category is flattened
+        assert len(mock_flatten.mock_calls) == 0
+
+        assert await translation.async_get_translations(
+            hass, "en", "entity_component", integrations={"media_player"}
+        )
+        assert len(mock_flatten.mock_calls) > 0
 
 
 @pytest.mark.usefixtures("enable_custom_integrations")
@@ -577,6 +584,62 @@ async def test_get_cached_translations(hass: HomeAssistant, mock_config_flows) -
     }
 
 
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_untranslated_language_shares_english(hass: HomeAssistant) -> None:
+    """Test an untranslated component shares the flattened English strings."""
+    cache = translation._async_get_translations_cache(hass)
+    await cache.async_load("invalid-language", {"test"})
+
+    assert "entity" in cache.cache_data.pending["en"]
+    assert "entity" in cache.cache_data.pending["invalid-language"]
+
+    untranslated = cache.get_cached("invalid-language", "entity", {"test"})
+    assert untranslated
+    assert untranslated is cache.get_cached("en", "entity", {"test"})
+    assert "entity" not in cache.cache_data.pending["en"]
+    assert "entity" not in cache.cache_data.pending["invalid-language"]
+
+    partial = await cache.async_fetch("es", "entity", {"test"})
+    assert partial["component.test.entity.switch.other1.name"] == "Otra 1"
+    assert partial["component.test.entity.switch.other4.unit_of_measurement"] == (
+        "quantities"
+    )
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_evict_idle_languages(hass: HomeAssistant) -> None:
+    """Test translations of idle languages are evicted."""
+    hass.config.language = "de"
+    cache = translation._async_get_translations_cache(hass)
+    with patch("homeassistant.helpers.translation.time.monotonic", return_value=1000):
+        await cache.async_load("de", {"test"})
+        await cache.async_load("es", {"test"})
+        assert cache.get_cached("es", "entity", {"test"})
+
+    with patch(
+        "homeassistant.helpers.translation.time.monotonic",
+        return_value=1000 + translation.LANGUAGE_IDLE_TIMEOUT - 1,
+    ):
+        await cache.async_load("invalid-language", {"test"})
+    assert cache.async_is_loaded("es", {"test"})
+
+    with patch(
+        "homeassistant.helpers.translation.time.monotonic",
+        return_value=1000 + translation.LANGUAGE_IDLE_TIMEOUT + 1,
+    ):
+        await cache.async_load("invalid-language", {"switch"})
+
+    # English and the configured language are never evicted
+    assert not cache.async_is_loaded("es", {"test"})
+    assert "es" not in cache.cache_data.cache
+    assert cache.async_is_loaded("de", {"test"})
+    assert cache.async_is_loaded("en", {"test"})
+    assert cache.async_is_loaded("invalid-language", {"test", "switch"})
+
+    translations = await cache.async_fetch("es", "entity", {"test"})
+    assert translations["component.test.entity.switch.other1.name"] == "Otra 1"
+
+
 async def test_setup(hass: HomeAssistant) -> None:
     """Test the setup load listeners helper."""
     translation.async_setup(hass)
@@ -1,5 +1,6 @@
 """Tests for the update coordinator."""
 
+import asyncio
 from datetime import datetime, timedelta
 import logging
 from unittest.mock import AsyncMock, Mock, patch
@@ -19,7 +20,7 @@ from homeassistant.exceptions import (
     ConfigEntryError,
     ConfigEntryNotReady,
 )
-from homeassistant.helpers import frame, update_coordinator
+from homeassistant.helpers import event, frame, update_coordinator
 from homeassistant.util.dt import utcnow
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -937,3 +938,185 @@ async def test_listener_unsubscribe_releases_coordinator(hass: HomeAssistant) ->
 
     # Ensure the coordinator is released
     assert weak_ref() is None
+
+
+def get_group_crds(
+    hass: HomeAssistant, group: update_coordinator.RefreshGroup, count: int
+) -> list[update_coordinator.DataUpdateCoordinator[int]]:
+    """Make coordinator mocks that are members of a refresh group."""
+    return [
+        update_coordinator.DataUpdateCoordinator[int](
+            hass,
+            _LOGGER,
+            config_entry=None,
+            name=f"test {idx}",
+            update_interval=DEFAULT_UPDATE_INTERVAL,
+            refresh_group=group,
+        )
+        for idx in range(count)
+    ]
+
+
+async def test_refresh_group_batches_shared_tick(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test members of a refresh group refresh together in one batch."""
+    batches: list[list[update_coordinator.DataUpdateCoordinator[int]]] = []
+
+    async def update(
+        coordinators: list[update_coordinator.DataUpdateCoordinator[int]],
+    ) -> dict[update_coordinator.DataUpdateCoordinator[int], int]:
+        batches.append(coordinators)
+        return {coordinator: len(batches) for coordinator in coordinators[1:]}
+
+    group = update_coordinator.async_get_refresh_group(
+        hass, "test", update_method=update
+    )
+    assert update_coordinator.async_get_refresh_group(hass, "test") is group
+
+    crds = get_group_crds(hass, group, 3)
+    unsubs = [crd.async_add_listener(lambda: None) for crd in crds]
+    assert event.async_timer_wheel_stats(hass)["wakeups"] == 1
+
+    freezer.tick(DEFAULT_UPDATE_INTERVAL * 1.5)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert len(batches) == 1
+    assert set(batches[0]) == set(crds)
+    missing = batches[0][0]
+    assert missing.last_update_success is False
+    assert isinstance(missing.last_exception, update_coordinator.UpdateFailed)
+    for crd in batches[0][1:]:
+        assert crd.last_update_success is True
+        assert crd.data == 1
+
+    # A member refreshing on its own is fetched in a batch of one
+    await crds[0].async_refresh()
+    assert batches[1] == [crds[0]]
+    assert crds[0].last_update_success is False
+
+    for unsub in unsubs:
+        unsub()
+    assert event.async_timer_wheel_stats(hass)["wakeups"] == 0
+
+
+async def test_refresh_group_removed_with_last_member(hass: HomeAssistant) -> None:
+    """Test a refresh group is replaced once all its members shut down."""
+    group = update_coordinator.async_get_refresh_group(
+        hass, "test", update_method=AsyncMock(return_value={})
+    )
+    crds = get_group_crds(hass, group, 2)
+
+    await crds[0].async_shutdown()
+    assert update_coordinator.async_get_refresh_group(hass, "test") is group
+
+    # A reloaded config entry gets a group with its new update method
+    await crds[1].async_shutdown()
+    update = AsyncMock(return_value={})
+    new_group = update_coordinator.async_get_refresh_group(
+        hass, "test", update_method=update
+    )
+    assert new_group is not group
+    assert new_group.update_method is update
+
+
+async def test_refresh_group_batch_failure(hass: HomeAssistant) -> None:
+    """Test a failing batch fails the refresh of all its members."""
+    update = AsyncMock(side_effect=update_coordinator.UpdateFailed("offline"))
+    group = update_coordinator.RefreshGroup(hass, "test", update_method=update)
+    crds = get_group_crds(hass, group, 2)
+
+    await asyncio.gather(*(crd.async_refresh() for crd in crds))
+
+    update.assert_awaited_once_with(crds)
+    for crd in crds:
+        assert crd.last_update_success is False
+        assert str(crd.last_exception) == "offline"
+
+
+async def test_refresh_group_max_concurrent(hass: HomeAssistant) -> None:
+    """Test a refresh group limits the members fetching at the same time."""
+    running = 0
+    max_running = 0
+
+    async def refresh() -> int:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return 1
+
+    group = update_coordinator.RefreshGroup(hass, "test", max_concurrent=2)
+    crds = get_group_crds(hass, group, 5)
+    for crd in crds:
+        crd.update_method = refresh
+
+    await asyncio.gather(*(crd.async_refresh() for crd in crds))
+
+    assert max_running == 2
+    assert all(crd.data == 1 for crd in crds)
+
+
+async def test_adaptive_update_interval(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test the update interval backs off while data does not change."""
+    update_method = AsyncMock(return_value=1)
+    crd = update_coordinator.DataUpdateCoordinator[int](
+        hass,
+        _LOGGER,
+        config_entry=None,
+        name="test",
+        update_method=update_method,
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+        max_update_interval=timedelta(seconds=60),
+    )
+    crd.async_add_listener(lambda: None)
+    assert crd.effective_update_interval == DEFAULT_UPDATE_INTERVAL
+
+    await crd.async_refresh()
+    assert crd.effective_update_interval == DEFAULT_UPDATE_INTERVAL
+
+    # Only scheduled refreshes back off
+    await crd.async_refresh()
+    assert crd.effective_update_interval == DEFAULT_UPDATE_INTERVAL
+
+    for seconds in (20, 40, 60, 60):
+        freezer.tick(crd.effective_update_interval + timedelta(seconds=1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert crd.effective_update_interval == timedelta(seconds=seconds)
+    assert update_method.await_count == 6
+    assert crd.update_interval == DEFAULT_UPDATE_INTERVAL
+
+    # The next refresh is not scheduled before the effective interval
+    freezer.tick(timedelta(seconds=30))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert update_method.await_count == 6
+
+    # Changed data returns to the update interval, unchanged pushed data
+    # does not back off
+    crd.async_set_updated_data(2)
+    assert crd.effective_update_interval == DEFAULT_UPDATE_INTERVAL
+
+    crd.async_set_updated_data(2)
+    assert crd.effective_update_interval == DEFAULT_UPDATE_INTERVAL
+
+    update_method.return_value = 2
+    freezer.tick(crd.effective_update_interval + timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert crd.effective_update_interval == timedelta(seconds=20)
+
+    # Requested refreshes, like from entity service calls, return to the
+    # update interval
+    await crd.async_request_refresh()
+    assert crd.effective_update_interval == DEFAULT_UPDATE_INTERVAL
+
+    crd.update_interval = timedelta(seconds=5)
+    assert crd.effective_update_interval == timedelta(seconds=5)
+
+    await crd.async_shutdown()
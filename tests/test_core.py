@@ -355,6 +355,7 @@ async def test_async_create_task_schedule_coroutine_with_name() -> None:
 async def test_async_run_eager_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
     hass = MagicMock()
+    hass._job_profiler = None
     calls = []
 
     def job():
@@ -379,6 +380,7 @@ async def test_async_run_eager_hass_job_calls_coro_function() -> None:
 async def test_async_run_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
     hass = MagicMock()
+    hass._job_profiler = None
     calls = []
 
     def job():
@@ -389,6 +391,34 @@ async def test_async_run_hass_job_calls_callback() -> None:
     assert len(hass.async_add_job.mock_calls) == 0
 
 
+async def test_async_set_job_profiler(hass: HomeAssistant) -> None:
+    """Test the job profiler runs callback jobs."""
+    calls = []
+    profiled = []
+
+    @ha.callback
+    def job(value):
+        calls.append(value)
+
+    def job_profiler(hassjob, args):
+        profiled.append(hassjob)
+        hassjob.target(*args)
+
+    hass_job = ha.HassJob(job)
+    hass.async_set_job_profiler(job_profiler)
+    hass.async_run_hass_job(hass_job, 1)
+    hass._async_add_hass_job(hass_job, 2)
+    await hass.async_block_till_done()
+    assert calls == [1, 2]
+    assert profiled == [hass_job, hass_job]
+
+    hass.async_set_job_profiler(None)
+    hass.async_run_hass_job(hass_job, 3)
+    await hass.async_block_till_done()
+    assert calls == [1, 2, 3]
+    assert len(profiled) == 2
+
+
 async def test_async_run_hass_job_delegates_non_async() -> None:
     """Test that the callback annotation is respected."""
     hass = MagicMock()
@@ -1165,6 +1195,76 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_listeners_change_after_fire(hass: HomeAssistant) -> None:
+    """Test listeners added or removed after a fire are used by the next fire."""
+    calls: list[str] = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        calls.append("listener")
+
+    @ha.callback
+    def match_all_listener(event: ha.Event) -> None:
+        if event.event_type == "test":
+            calls.append("match_all")
+
+    hass.bus.async_fire("test")
+    assert calls == []
+
+    unsub = hass.bus.async_listen("test", listener)
+    hass.bus.async_fire("test")
+    assert calls == ["listener"]
+
+    unsub_match_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    hass.bus.async_fire("test")
+    assert calls == ["listener", "listener", "match_all"]
+
+    unsub()
+    hass.bus.async_fire("test")
+    assert calls == ["listener", "listener", "match_all", "match_all"]
+
+    unsub_match_all()
+    hass.bus.async_fire("test")
+    assert calls == ["listener", "listener", "match_all", "match_all"]
+
+
+async def test_eventbus_listen_entity(hass: HomeAssistant) -> None:
+    """Test listening for events about a single entity."""
+    old_count = hass.bus.async_listeners().get("test", 0)
+    calls: list[tuple[str, str]] = []
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        calls.append(("listener", event.data["entity_id"]))
+
+    @ha.callback
+    def other_listener(event: ha.Event) -> None:
+        calls.append(("other_listener", event.data["entity_id"]))
+
+    unsub = hass.bus.async_listen_entity("test", "light.kitchen", listener)
+    unsub_other = hass.bus.async_listen_entity("test", "light.kitchen", other_listener)
+    assert hass.bus.async_listeners()["test"] == old_count + 2
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.living_room"})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen", "light.hallway"]})
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    assert calls == [
+        ("listener", "light.kitchen"),
+        ("other_listener", "light.kitchen"),
+    ]
+
+    unsub()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    assert calls[2:] == [("other_listener", "light.kitchen")]
+
+    unsub_other()
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    assert len(calls) == 3
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1560,6 +1660,43 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_attribute_index(hass: HomeAssistant) -> None:
+    """Test looking up states by attribute with and without an index."""
+    hass.states.async_set("sensor.power", "1", {"device_class": "power"})
+    hass.states.async_set("sensor.energy", "2", {"device_class": "energy"})
+    hass.states.async_set("switch.power", "on", {"device_class": "power"})
+    hass.states.async_set("sensor.list", "3", {"device_class": ["power"]})
+
+    def _entity_ids(value: Any, domain_filter: str | None = None) -> list[str]:
+        return sorted(
+            state.entity_id
+            for state in hass.states.async_all_with_attribute(
+                "device_class", value, domain_filter
+            )
+        )
+
+    for _ in range(2):
+        assert _entity_ids("power") == ["sensor.power", "switch.power"]
+        assert _entity_ids("power", "sensor") == ["sensor.power"]
+        assert _entity_ids(["power"]) == ["sensor.list"]
+        assert _entity_ids("missing") == []
+        hass.states.async_add_attribute_index("device_class")
+
+    hass.states.async_set("sensor.power", "5", {"device_class": "power"})
+    assert hass.states.async_all_with_attribute("device_class", "power", "sensor") == [
+        hass.states.get("sensor.power")
+    ]
+    hass.states.async_set("sensor.energy", "2", {"device_class": "power"})
+    hass.states.async_set("switch.power", "on")
+    hass.states.async_set("sensor.new", "4", {"device_class": "energy"})
+    assert _entity_ids("power") == ["sensor.energy", "sensor.power"]
+    assert _entity_ids("energy") == ["sensor.new"]
+
+    hass.states.async_remove("sensor.new")
+    assert _entity_ids("energy") == []
+    assert "energy" not in hass.states._states._attribute_indexes["device_class"]
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall(None, "homeassistant", "start")
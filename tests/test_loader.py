@@ -235,6 +235,33 @@ async def test_get_integration(hass: HomeAssistant) -> None:
     assert hue_light == integration.get_platform("light")
 
 
+async def test_get_integration_cached_manifest(hass: HomeAssistant) -> None:
+    """Test resolving built-in integrations from cached manifests."""
+    manifest: loader.Manifest = {
+        "domain": "hue",
+        "name": "Cached Hue",
+        "dependencies": [],
+        "requirements": [],
+    }
+    loader.async_set_cached_manifests(
+        hass, {"hue": (manifest, {"__init__.py", "light.py"})}
+    )
+
+    with patch.object(
+        loader.Integration, "resolve_from_root", side_effect=AssertionError
+    ):
+        integration = await loader.async_get_integration(hass, "hue")
+
+    assert integration.name == "Cached Hue"
+    assert integration.is_built_in
+    assert integration.platforms_exists(["light", "sensor"]) == ["light"]
+    assert hue == await integration.async_get_component()
+
+    assert loader.async_get_cacheable_manifests(hass) == {
+        "hue": (manifest, {"__init__.py", "light.py"})
+    }
+
+
 async def test_async_get_component(hass: HomeAssistant) -> None:
     """Test resolving integration."""
     with pytest.raises(loader.IntegrationNotLoaded):